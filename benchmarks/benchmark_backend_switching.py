@@ -0,0 +1,50 @@
+# Benchmark the cost of switching between backends with nested context managers
+import argparse
+import timeit
+
+import ivy
+from ivy.backend_handler import _backend_fn_tables
+
+
+def _nested_switch(backends):
+    # enter every backend in turn, then leave them all in reverse order
+    for backend in backends:
+        ivy.set_backend(backend)
+    for _ in backends:
+        ivy.unset_backend()
+
+
+def _time_per_switch(backends, number, cached):
+    def _call():
+        if not cached:
+            _backend_fn_tables.clear()
+        _nested_switch(backends)
+
+    # each nested switch sets and unsets every backend once
+    total = min(timeit.repeat(_call, number=number, repeat=3))
+    return total / (number * 2 * len(backends)) * 1e3
+
+
+def benchmark(backends, depth, number):
+    ivy.clear_backend_stack()
+    nested = [backends[i % len(backends)] for i in range(depth)]
+    uncached = _time_per_switch(nested, number, cached=False)
+    cached = _time_per_switch(nested, number, cached=True)
+    print("nested backends: {}".format(nested))
+    print("uncached switch: {:.3f} ms".format(uncached))
+    print("cached switch:   {:.3f} ms".format(cached))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the cost of nested backend context switches."
+    )
+    parser.add_argument(
+        "--backends",
+        default="numpy",
+        help="comma separated backends to switch between",
+    )
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--number", type=int, default=10)
+    parsed_args = parser.parse_args()
+    benchmark(parsed_args.backends.split(","), parsed_args.depth, parsed_args.number)
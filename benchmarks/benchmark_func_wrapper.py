@@ -0,0 +1,89 @@
+# Benchmark the per-call overhead added by the function wrappers
+import argparse
+import timeit
+
+import ivy
+
+
+def _array_like_wrappers(fn):
+    # collect every function in the wrapper chain which caches array-like positions
+    wrappers = []
+    while fn is not None:
+        if "_array_like_positions" in fn.__dict__:
+            wrappers.append(fn)
+        fn = getattr(fn, "__wrapped__", None)
+    return wrappers
+
+
+def _reset_array_like_positions(wrappers):
+    for wrapper in wrappers:
+        wrapper._array_like_positions = None
+
+
+def _time_per_call(fn, args, kwargs, number, setup=None):
+    def _call():
+        if setup is not None:
+            setup()
+        fn(*args, **kwargs)
+
+    return min(timeit.repeat(_call, number=number, repeat=5)) / number * 1e6
+
+
+def benchmark(backend, number):
+    # the dispatch plans skip handle_array_like for plain array arguments, so the
+    # functions are wrapped with the full decorator stack to measure its caching
+    use_dispatch_plans = ivy.func_wrapper.use_dispatch_plans
+    ivy.func_wrapper.use_dispatch_plans = False
+    try:
+        ivy.set_backend(backend)
+    finally:
+        ivy.func_wrapper.use_dispatch_plans = use_dispatch_plans
+    x = ivy.array([[float(i * 4 + j) for j in range(4)] for i in range(4)])
+    y = ivy.array([[float(i - j) for j in range(4)] for i in range(4)])
+    cases = [
+        ("add", (x, y), {}),
+        ("matmul", (x, y), {}),
+        ("concat", ([x, y],), {"axis": 0}),
+    ]
+    backend_module = ivy.current_backend()
+    print(
+        "{:<10}{:>14}{:>20}{:>18}".format(
+            "function", "backend (us)", "uncached sig (us)", "cached sig (us)"
+        )
+    )
+    for fn_name, args, kwargs in cases:
+        fn = ivy.__dict__[fn_name]
+        native_args, native_kwargs = ivy.args_to_native(*args, **kwargs)
+        raw = _time_per_call(
+            backend_module.__dict__[fn_name], native_args, native_kwargs, number
+        )
+        wrappers = _array_like_wrappers(fn)
+        cached = _time_per_call(fn, args, kwargs, number)
+        if wrappers:
+            uncached = _time_per_call(
+                fn,
+                args,
+                kwargs,
+                number,
+                setup=lambda: _reset_array_like_positions(wrappers),
+            )
+            uncached = "{:.2f}".format(uncached - raw)
+        else:
+            # not wrapped with handle_array_like, so there is nothing to cache
+            uncached = "-"
+        print(
+            "{:<10}{:>14.2f}{:>20}{:>18.2f}".format(
+                fn_name, raw, uncached, cached - raw
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the per-call wrapper overhead for ivy functions."
+    )
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=2000)
+    parsed_args = parser.parse_args()
+    benchmark(parsed_args.backend, parsed_args.number)
@@ -0,0 +1,91 @@
+# Benchmark the optimizer steps per second with and without fused updates
+import argparse
+import timeit
+
+import ivy
+
+
+_OPTIMIZERS = {
+    "SGD": (ivy.SGD, {}),
+    "Adam": (ivy.Adam, {}),
+    "LAMB": (ivy.LAMB, {"decay_lambda": 0.01}),
+    "LARS": (ivy.LARS, {"decay_lambda": 0.01}),
+}
+
+
+def _new_container(num_leaves, leaf_size, fill_value):
+    # a flat container of num_leaves float32 vectors, such as many small layers
+    return ivy.Container(
+        {
+            "w{}".format(i): ivy.full((leaf_size,), fill_value, dtype="float32")
+            for i in range(num_leaves)
+        }
+    )
+
+
+def _steps_per_sec(optimizer_name, fused, num_leaves, leaf_size, number):
+    optimizer_class, kwargs = _OPTIMIZERS[optimizer_name]
+    optimizer = optimizer_class(lr=1e-3, fused=fused, **kwargs)
+    v = _new_container(num_leaves, leaf_size, 1.0)
+    grads = _new_container(num_leaves, leaf_size, 1e-3)
+    # the first step allocates the optimizer state
+    v = optimizer.step(v, grads)
+
+    def _call():
+        nonlocal v
+        v = optimizer.step(v, grads)
+
+    return number / min(timeit.repeat(_call, number=number, repeat=3))
+
+
+def benchmark(backend, optimizer_names, leaf_counts, leaf_size, number):
+    ivy.set_backend(backend)
+    print(
+        "{:<10}{:>10}{:>18}{:>16}{:>10}".format(
+            "optimizer", "leaves", "unfused (step/s)", "fused (step/s)", "speedup"
+        )
+    )
+    for optimizer_name in optimizer_names:
+        for num_leaves in leaf_counts:
+            unfused, fused = [
+                _steps_per_sec(optimizer_name, f, num_leaves, leaf_size, number)
+                for f in [False, True]
+            ]
+            print(
+                "{:<10}{:>10}{:>18}{:>16}{:>10}".format(
+                    optimizer_name,
+                    num_leaves,
+                    "{:.1f}".format(unfused),
+                    "{:.1f}".format(fused),
+                    "{:.1f}x".format(fused / unfused),
+                )
+            )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure optimizer steps per second with and without fused "
+        "multi-tensor updates."
+    )
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument(
+        "--optimizers",
+        default="SGD,Adam,LAMB,LARS",
+        help="comma separated optimizers to benchmark",
+    )
+    parser.add_argument(
+        "--leaves",
+        default="100,1000,10000",
+        help="comma separated numbers of variables to update",
+    )
+    parser.add_argument("--leaf-size", type=int, default=64)
+    parser.add_argument("--number", type=int, default=3)
+    parsed_args = parser.parse_args()
+    benchmark(
+        parsed_args.backend,
+        parsed_args.optimizers.split(","),
+        [int(n) for n in parsed_args.leaves.split(",")],
+        parsed_args.leaf_size,
+        parsed_args.number,
+    )
@@ -618,6 +618,8 @@ from .backend_handler import (
     set_tensorflow_backend,
     set_torch_backend,
     unset_backend,
+    set_local_backend,
+    unset_local_backend,
     backend_stack,
     choose_random_backend,
     clear_backend_stack,
@@ -765,6 +767,8 @@ globals = GlobalsDict(
         "array_mode_stack": general.array_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "trusted_inputs_mode_stack": general.trusted_inputs_mode_stack,
+        "container_fusion_mode_stack": general.container_fusion_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -10,6 +10,8 @@ import ivy
 
 
 class ArrayWithActivations(abc.ABC):
+    __slots__ = ()
+
     def relu(self: ivy.Array, /, *, out: Optional[ivy.Array] = None) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.relu. This method simply wraps the
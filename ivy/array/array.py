@@ -72,69 +72,65 @@ class Array(
     ArrayWithStatisticalExperimental,
     ArrayWithUtilityExperimental,
 ):
+    # the mixins hold no state and declare empty __slots__, so instances have no
+    # __dict__, and only store the native array and the lazily computed metadata
+    __slots__ = ("_data", "_dtype", "_device", "_dev_str", "_backend", "_version")
+
+    # the number of writes to any ivy array, which lets caches of array contents tell
+    # in O(1) whether they can still be trusted
+    _write_count = 0
+
     def __init__(self, data):
-        ArrayWithActivations.__init__(self)
-        ArrayWithCreation.__init__(self)
-        ArrayWithDataTypes.__init__(self)
-        ArrayWithDevice.__init__(self)
-        ArrayWithElementwise.__init__(self)
-        ArrayWithGeneral.__init__(self)
-        ArrayWithGradients.__init__(self)
-        ArrayWithImage.__init__(self)
-        ArrayWithLayers.__init__(self)
-        ArrayWithLinearAlgebra.__init__(self)
-        ArrayWithLosses.__init__(self)
-        ArrayWithManipulation.__init__(self)
-        ArrayWithNorms.__init__(self)
-        ArrayWithRandom.__init__(self)
-        ArrayWithSearching.__init__(self)
-        ArrayWithSet.__init__(self)
-        ArrayWithSorting.__init__(self)
-        ArrayWithStatistical.__init__(self)
-        ArrayWithUtility.__init__(self)
-        ArrayWithActivationsExperimental.__init__(self),
-        ArrayWithConversionsExperimental.__init__(self),
-        ArrayWithCreationExperimental.__init__(self),
-        ArrayWithData_typeExperimental.__init__(self),
-        ArrayWithDeviceExperimental.__init__(self),
-        ArrayWithElementWiseExperimental.__init__(self),
-        ArrayWithGeneralExperimental.__init__(self),
-        ArrayWithGradientsExperimental.__init__(self),
-        ArrayWithImageExperimental.__init__(self),
-        ArrayWithLayersExperimental.__init__(self),
-        ArrayWithLinearAlgebraExperimental.__init__(self),
-        ArrayWithLossesExperimental.__init__(self),
-        ArrayWithManipulationExperimental.__init__(self),
-        ArrayWithNormsExperimental.__init__(self),
-        ArrayWithRandomExperimental.__init__(self),
-        ArrayWithSearchingExperimental.__init__(self),
-        ArrayWithSetExperimental.__init__(self),
-        ArrayWithSortingExperimental.__init__(self),
-        ArrayWithStatisticalExperimental.__init__(self),
-        ArrayWithUtilityExperimental.__init__(self),
+        self._version = 0
         self._init(data)
 
     def _init(self, data):
-        if ivy.is_ivy_array(data):
-            self._data = data.data
+        if isinstance(data, Array):
+            self._data = data._data
+        elif isinstance(data, ivy.NativeArray):
+            self._data = data
         else:
             ivy.assertions.check_true(
                 ivy.is_native_array(data), "data must be native array"
             )
             self._data = data
-        self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
+        self._dtype = None
+        self._device = None
+        self._dev_str = None
+        # the backend which created the array, looked up without dispatching
+        if ivy.backend_stack:
+            self._backend = ivy.backend_stack[-1]
         else:
-            self._post_repr = ")"
-        self.backend = ivy.current_backend_str()
+            local_stack = ivy.backend_handler._local_backend_stack.get()
+            self._backend = local_stack[-1] if local_stack else None
+
+    @property
+    def _shape(self):
+        return self._data.shape
+
+    @property
+    def _size(self):
+        shape = self._data.shape
+        return functools.reduce(mul, shape) if len(shape) > 0 else 0
+
+    @property
+    def _pre_repr(self):
+        return "ivy."
+
+    @property
+    def _post_repr(self):
+        if self._dev_str is None:
+            self._dev_str = ivy.as_ivy_dev(self.device)
+        if "gpu" in self._dev_str:
+            return ", dev={})".format(self._dev_str)
+        return ")"
+
+    @property
+    def backend(self) -> str:
+        """The backend which was set when the array was created."""
+        if self._backend is None:
+            return ""
+        return self._backend.current_backend_str()
 
     # Properties #
     # ---------- #
@@ -147,11 +143,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = ivy.dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = ivy.dev(self._data)
         return self._device
 
     @property
@@ -208,6 +208,12 @@ class Array(
             ivy.is_native_array(data), "data must be native array"
         )
         self._init(data)
+        self._bump_version()
+
+    def _bump_version(self):
+        # record a write to the array, see _version
+        Array._write_count += 1
+        self._version = Array._write_count
 
     # Built-ins #
     # ----------#
@@ -269,7 +275,8 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
+        self._bump_version()
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -297,7 +304,8 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.unset_backend()
 
-        self.__dict__ = ivy_array.__dict__
+        for attr in Array.__slots__:
+            setattr(self, attr, getattr(ivy_array, attr))
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
@@ -12,6 +12,8 @@ import ivy
 
 
 class ArrayWithCreation(abc.ABC):
+    __slots__ = ()
+
     def asarray(
         self: ivy.Array,
         /,
@@ -10,6 +10,8 @@ Iinfo = None
 
 
 class ArrayWithDataTypes(abc.ABC):
+    __slots__ = ()
+
     def astype(
         self: ivy.Array,
         dtype: ivy.Dtype,
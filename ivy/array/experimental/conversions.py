@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithConversionsExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithCreationExperimental(abc.ABC):
-    pass
+    __slots__ = ()
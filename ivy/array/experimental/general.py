@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithGeneralExperimental(abc.ABC):
+    __slots__ = ()
+
     def isin(
         self: ivy.Array,
         test_elements: ivy.Array,
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithGradientsExperimental(abc.ABC):
-    pass
+    __slots__ = ()
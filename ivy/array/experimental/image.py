@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithImageExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithLossesExperimental(abc.ABC):
-    pass
+    __slots__ = ()
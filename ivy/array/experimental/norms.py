@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithNormsExperimental(abc.ABC):
-    pass
+    __slots__ = ()
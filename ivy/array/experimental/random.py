@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithRandomExperimental(abc.ABC):
+    __slots__ = ()
+
     # dirichlet
     def dirichlet(
         self: ivy.Array,
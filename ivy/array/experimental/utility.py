@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithUtilityExperimental(abc.ABC):
-    pass
+    __slots__ = ()
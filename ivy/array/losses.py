@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithLosses(abc.ABC):
+    __slots__ = ()
+
     def cross_entropy(
         self: ivy.Array,
         pred: Union[ivy.Array, ivy.NativeArray],
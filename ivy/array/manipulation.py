@@ -11,6 +11,8 @@ import ivy
 
 
 class ArrayWithManipulation(abc.ABC):
+    __slots__ = ()
+
     def concat(
         self: ivy.Array,
         xs: Union[
@@ -9,6 +9,8 @@ import ivy
 
 
 class ArrayWithNorms(abc.ABC):
+    __slots__ = ()
+
     def layer_norm(
         self: ivy.Array,
         normalized_idxs: List[int],
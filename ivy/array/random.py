@@ -7,6 +7,8 @@ import ivy
 
 
 class ArrayWithRandom(abc.ABC):
+    __slots__ = ()
+
     def random_uniform(
         self: ivy.Array,
         /,
@@ -1,6 +1,7 @@
 # global
 import ivy
 import importlib
+import contextvars
 import numpy as np
 from ivy import verbosity
 from typing import Optional
@@ -9,20 +10,34 @@ from typing import Optional
 from ivy.func_wrapper import _wrap_function
 
 backend_stack = []
+# backends which are local to the current thread or asyncio task
+_local_backend_stack = contextvars.ContextVar("local_backend_stack", default=())
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
 
+# caches the wrapped function table of each backend which has been set, so that later
+# backend switches only need to re-wrap functions which have changed since
+_backend_fn_tables = dict()
+_deleted = object()
+
 
 class ContextManager:
-    def __init__(self, module):
+    def __init__(self, module, local=False):
         self.module = module
+        self.local = local
 
     def __enter__(self):
-        set_backend(self.module)
+        if self.local:
+            set_local_backend(self.module)
+        else:
+            set_backend(self.module)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        unset_backend()
+        if self.local:
+            unset_local_backend()
+        else:
+            unset_backend()
 
 
 _array_types = dict()
@@ -38,6 +53,11 @@ _backend_dict["jax"] = "ivy.functional.backends.jax"
 _backend_dict["tensorflow"] = "ivy.functional.backends.tensorflow"
 _backend_dict["torch"] = "ivy.functional.backends.torch"
 
+# caches the inferred backend module name for each argument type, and the imported
+# backend module for each module name
+_backend_from_type_cache = dict()
+_backend_module_cache = dict()
+
 _backend_reverse_dict = dict()
 _backend_reverse_dict["ivy.functional.backends.numpy"] = "numpy"
 _backend_reverse_dict["ivy.functional.backends.jax"] = "jax"
@@ -49,6 +69,29 @@ _backend_reverse_dict["ivy.functional.backends.torch"] = "torch"
 # ----------------------- #
 
 
+def _import_backend_module(module_name):
+    """Imports the backend module `module_name`, caching the module reference."""
+    try:
+        return _backend_module_cache[module_name]
+    except KeyError:
+        module = importlib.import_module(module_name)
+        _backend_module_cache[module_name] = module
+        return module
+
+
+def _backend_module_name_from_type(arg_type):
+    """Returns the name of the Ivy backend module for arguments of type `arg_type`,
+    or None if `arg_type` isn't an array type of any backend."""
+    try:
+        return _backend_from_type_cache[arg_type]
+    except KeyError:
+        # use the _array_types dict to map the module where arg comes from, to the
+        # corresponding Ivy backend
+        module_name = _array_types.get(arg_type.__module__)
+        _backend_from_type_cache[arg_type] = module_name
+        return module_name
+
+
 def _determine_backend_from_args(args):
     """Return the appropriate Ivy backend, given some arguments.
 
@@ -76,21 +119,19 @@ def _determine_backend_from_args(args):
     for arg in args:
         arg_type = type(arg)
         # function is called recursively if arg is a list/tuple
-        if arg_type in [list, tuple]:
+        if arg_type is list or arg_type is tuple:
             lib = _determine_backend_from_args(arg)
             if lib:
                 return lib
         # function is called recursively if arg is a dict
         elif arg_type is dict:
-            lib = _determine_backend_from_args(list(arg.values()))
+            lib = _determine_backend_from_args(arg.values())
             if lib:
                 return lib
         else:
-            # use the _array_types dict to map the module where arg comes from, to the
-            # corresponding Ivy backend
-            if arg.__class__.__module__ in _array_types:
-                module_name = _array_types[arg.__class__.__module__]
-                return importlib.import_module(module_name)
+            module_name = _backend_module_name_from_type(arg_type)
+            if module_name is not None:
+                return _import_backend_module(module_name)
 
 
 def fn_name_from_version_specific_fn_name(name, version):
@@ -165,6 +206,62 @@ def set_backend_to_specific_version(backend):
                 backend.__dict__[orig_name].__name__ = orig_name
 
 
+def _wrap_backend_fn(backend, k, v, cached=None):
+    """Returns the table entry `(original, backend_fn, wrapped, compositional)` for
+    the function `k` of `backend`, given its original implementation `v`."""
+    compositional = k not in backend.__dict__ or (
+        cached is not None and cached[3] and backend.__dict__[k] is cached[1]
+    )
+    if compositional:
+        if k in backend.invalid_dtypes:
+            return v, None, _deleted, compositional
+        backend.__dict__[k] = v
+    wrapped = _wrap_function(
+        key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+    )
+    return v, backend.__dict__[k], wrapped, compositional
+
+
+def _set_backend_fns(backend):
+    """Updates the ivy namespace with the wrapped functions of `backend`. The wrapped
+    functions are cached per backend, and only the functions for which either the
+    original or the backend implementation has changed since are wrapped again."""
+    if backend not in _backend_fn_tables:
+        set_backend_to_specific_version(backend)
+        _backend_fn_tables[backend] = dict()
+    table = _backend_fn_tables[backend]
+    backend_dict = backend.__dict__
+    ivy_dict = ivy.__dict__
+    for k, v in ivy_original_dict.items():
+        entry = table.get(k)
+        if entry is None or entry[0] is not v or entry[1] is not backend_dict.get(k):
+            entry = table[k] = _wrap_backend_fn(backend, k, v, entry)
+        wrapped = entry[2]
+        if wrapped is _deleted:
+            ivy_dict.pop(k, None)
+        else:
+            ivy_dict[k] = wrapped
+
+
+def _pop_backend():
+    """Removes the last backend from the stack, and resets the global state which was
+    specific to that backend."""
+    backend = backend_stack.pop(-1)
+    if backend.current_backend_str() == "numpy":
+        ivy.unset_default_device()
+    elif backend.current_backend_str() == "jax":
+        ivy.del_global_attr("RNG")
+    # the new backend is the backend that was set before the one we just removed
+    # from the stack, or Ivy if there was no previously set backend
+    if backend_stack:
+        new_backend = backend_stack[-1]
+        if new_backend.current_backend_str() == "numpy":
+            ivy.set_default_device("cpu")
+        elif new_backend.current_backend_str() == "jax":
+            ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
+    return backend
+
+
 def current_backend(*args, **kwargs):
     """Returns the current backend. Priorities:
     global_backend > argument's backend.
@@ -206,14 +303,24 @@ def current_backend(*args, **kwargs):
             verbosity.cprint("Using backend from stack: {}".format(f))
         return f
 
+    # otherwise a backend set with set_local_backend in this context is returned
+    local_stack = _local_backend_stack.get()
+    if local_stack:
+        f = local_stack[-1]
+        if verbosity.level > 0:
+            verbosity.cprint("Using backend from local stack: {}".format(f))
+        return f
+
     # if no global backend exists, we try to infer the backend from the arguments
-    f = _determine_backend_from_args(list(args) + list(kwargs.values()))
+    f = _determine_backend_from_args(args)
+    if f is None and kwargs:
+        f = _determine_backend_from_args(kwargs.values())
     if f is not None:
         implicit_backend = f.current_backend_str()
         return f
     if verbosity.level > 0:
         verbosity.cprint("Using backend from type: {}".format(f))
-    return importlib.import_module(_backend_dict[implicit_backend])
+    return _import_backend_module(_backend_dict[implicit_backend])
 
 
 def set_backend(backend: str):
@@ -245,10 +352,12 @@ def set_backend(backend: str):
     if not backend_stack:
         ivy_original_dict = ivy.__dict__.copy()
     if isinstance(backend, str):
+        # the ivy namespace is fully overwritten by the new backend below, so only
+        # the backend specific global state is reset for the backends in the stack
         temp_stack = list()
         while backend_stack:
-            temp_stack.append(unset_backend())
-        backend = importlib.import_module(_backend_dict[backend])
+            temp_stack.append(_pop_backend())
+        backend = _import_backend_module(_backend_dict[backend])
         for fw in reversed(temp_stack):
             backend_stack.append(fw)
     if backend.current_backend_str() == "numpy":
@@ -256,23 +365,59 @@ def set_backend(backend: str):
     elif backend.current_backend_str() == "jax":
         ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
     backend_stack.append(backend)
-    set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
-        )
+    _set_backend_fns(backend)
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     ivy.locks["backend_setter"].release()
 
 
+def set_local_backend(backend: str):
+    """Sets `backend` to be the backend of the current thread or asyncio task only.
+
+    Unlike `set_backend`, the ivy namespace is left untouched and no global lock is
+    taken. Ivy's functions instead dispatch to the local backend through
+    `ivy.current_backend`, so different threads and tasks can each use their own
+    backend concurrently. Local backends can only be used while no global backend is
+    set.
+
+    Examples
+    --------
+    >>> ivy.set_local_backend("numpy")
+    >>> native = ivy.to_native(ivy.array([1]))
+    >>> print(type(native))
+    <class 'numpy.ndarray'>
+    >>> ivy.unset_local_backend()
+    """
+    ivy.assertions.check_false(
+        isinstance(backend, str) and backend not in _backend_dict,
+        "backend must be one from {}".format(list(_backend_dict.keys())),
+    )
+    ivy.assertions.check_false(
+        backend_stack,
+        "local backends can't be set while a global backend is set",
+    )
+    if isinstance(backend, str):
+        backend = _import_backend_module(_backend_dict[backend])
+    set_backend_to_specific_version(backend)
+    _local_backend_stack.set(_local_backend_stack.get() + (backend,))
+
+
+def unset_local_backend():
+    """Unsets the current local backend of this thread or asyncio task.
+
+    Returns
+    -------
+    ret
+        the backend that was unset, or None if there was no set local backend.
+    """
+    local_stack = _local_backend_stack.get()
+    if not local_stack:
+        return None
+    _local_backend_stack.set(local_stack[:-1])
+    return local_stack[-1]
+
+
 def set_numpy_backend():
     """Sets NumPy to be the global backend. equivalent to `ivy.set_backend("numpy")`."""
     set_backend("numpy")
@@ -381,29 +526,13 @@ def unset_backend():
     backend = None
     # if the backend stack is empty, nothing is done and we just return `None`
     if backend_stack:
-        backend = backend_stack.pop(-1)  # remove last backend from the stack
-        if backend.current_backend_str() == "numpy":
-            ivy.unset_default_device()
-        elif backend.current_backend_str() == "jax":
-            ivy.del_global_attr("RNG")
-        # the new backend is the backend that was set before the one we just removed
-        # from the stack, or Ivy if there was no previously set backend
+        backend = _pop_backend()
+        # add the cached wrapped functions of the previous backend to the ivy
+        # namespace if there still is a backend, otherwise restore Ivy's functions
         if backend_stack:
-            new_backend = backend_stack[-1]
-            if new_backend.current_backend_str() == "numpy":
-                ivy.set_default_device("cpu")
-            elif new_backend.current_backend_str() == "jax":
-                ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+            _set_backend_fns(backend_stack[-1])
+        else:
+            ivy.__dict__.update(ivy_original_dict)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
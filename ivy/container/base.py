@@ -1,11 +1,14 @@
 """Base Container Object."""
 
 # global
+import importlib
 import inspect
 from itertools import chain
 import re
 import abc
+import collections
 import copy
+import hashlib
 import termcolor
 import numpy as np
 import json
@@ -19,11 +22,19 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import queue
 import random
+import threading
+import time
+import contextvars
+import os
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from operator import mul
 from functools import reduce
 from typing import Union, Tuple
 from builtins import set
+from numbers import Number
 
 # local
 import ivy
@@ -31,6 +42,14 @@ import ivy
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
+# the magic bytes and buffer alignment of the binary container format
+_BINARY_MAGIC = b"IVYCONT\x01"
+_BINARY_ALIGNMENT = 64
+
+# waits for a queue entry longer than this many seconds count as stalls, shorter
+# ones are just the overhead of collecting an entry which was already prefetched
+_QUEUE_STALL_THRESHOLD = 1e-4
+
 
 def _is_jsonable(x):
     try:
@@ -47,6 +66,559 @@ def _repr(x):
         return str(x)
 
 
+def _leaf_call_template(nest, indices):
+    """Compiles a function which fills a copy of nest with the values at indices.
+
+    Only the nests on the path to each index are copied when filling, and the paths
+    are worked out once here rather than on every call.
+    """
+    nest = ivy.copy_nest(nest, to_mutable=True)
+    # the nests to copy, as (parent, key) pairs, and the (parent, key) pairs at which
+    # to insert the values, with each parent referring to a previously copied nest
+    copies = list()
+    inserts = list()
+    copied = {(): 0}
+    for index in indices:
+        parent = 0
+        for depth in range(1, len(index)):
+            path = tuple(index[:depth])
+            if path not in copied:
+                copied[path] = len(copies) + 1
+                copies.append((parent, index[depth - 1]))
+            parent = copied[path]
+        inserts.append((parent, index[-1]))
+
+    def fill(values):
+        nests = [nest.copy()]
+        for parent, key in copies:
+            nests.append(nests[parent][key].copy())
+            nests[parent][key] = nests[-1]
+        for (parent, key), value in zip(inserts, values):
+            nests[parent][key] = value
+        return nests[0]
+
+    return fill
+
+
+class _PackedLayout:
+    """The flat buffers of a packed container, together with the (keys, buffer index,
+    offset, size, shape) entry of each leaf and the leaves which are views into them.
+    """
+
+    def __init__(self, buffers, entries, leaves):
+        self.buffers = buffers
+        self.entries = entries
+        self.leaves = leaves
+
+
+class _KeyChains(tuple):
+    """The key chains used to filter a map, with set based membership and prefix
+    checks, so that each leaf is matched in O(depth) rather than O(len(key_chains)).
+    """
+
+    def __new__(cls, key_chains):
+        self = super().__new__(cls, key_chains)
+        self._set = frozenset(self)
+        self._lengths = sorted(set(len(kc) for kc in self))
+        return self
+
+    def __contains__(self, key_chain):
+        return key_chain in self._set
+
+    def has_prefix_of(self, key_chain):
+        key_chains = self._set
+        for length in self._lengths:
+            if length > len(key_chain):
+                return False
+            if key_chain[:length] in key_chains:
+                return True
+        return False
+
+
+def _as_key_chains(key_chains):
+    if isinstance(key_chains, (list, tuple, set, frozenset)) and not isinstance(
+        key_chains, _KeyChains
+    ):
+        return _KeyChains(key_chains)
+    return key_chains
+
+
+def _found_in_key_chains(this_key_chain, key_chains):
+    if key_chains is None:
+        return False
+    if isinstance(key_chains, _KeyChains):
+        return key_chains.has_prefix_of(this_key_chain)
+    for key_chain in key_chains:
+        if this_key_chain.startswith(key_chain):
+            return True
+    return False
+
+
+def _register_token(cont, token):
+    # drop the tokens which are no longer valid, so that the lists stay short
+    tokens = cont.__dict__.get("_cont_index_tokens")
+    if tokens is None:
+        tokens = cont.__dict__["_cont_index_tokens"] = list()
+    tokens[:] = [t for t in tokens if t.valid]
+    tokens.append(token)
+
+
+class _KeyChainIndex:
+    """The key chains of a container, flattened once so that key queries do not need
+    to traverse the container.
+
+    Each indexed container holds a reference to the index, which is invalidated as
+    soon as any of them is mutated.
+    """
+
+    def __init__(self, cont):
+        self.valid = True
+        self.key_chains = list()
+        self.key_chains_w_empty = list()
+        self.by_key = dict()
+        self.cache = dict()
+        self._add(cont, "")
+        self.positions = {kc: i for i, kc in enumerate(self.key_chains)}
+
+    def _add(self, cont, key_chain):
+        _register_token(cont, self)
+        for key, value in cont.items():
+            kc = key_chain + "/" + key if key_chain != "" else key
+            if isinstance(value, ivy.Container):
+                if not value:
+                    self.key_chains_w_empty.append(kc)
+                self._add(value, kc)
+            else:
+                self.key_chains.append(kc)
+                self.key_chains_w_empty.append(kc)
+                for k in re.split("[/.]", kc):
+                    self.by_key.setdefault(k, list()).append(kc)
+
+
+def _hash_parts(parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+    return h.digest()
+
+
+def _leaf_structure(x):
+    # the type, and the dtype, shape and device of arrays, or None for leaves which
+    # cannot be fingerprinted
+    if isinstance(x, _LazyH5Dataset):
+        return None
+    type_name = (type(x).__module__ + "." + type(x).__qualname__).encode("utf-8")
+    if ivy.is_array(x):
+        return _hash_parts([type_name, repr(_leaf_signature(x)).encode("utf-8")])
+    return _hash_parts([type_name])
+
+
+def _leaf_content(x):
+    # the structure together with the bytes of arrays, or the json of other leaves.
+    # None for leaves containing nans, which equal bytes do not make equal values
+    structure = _leaf_structure(x)
+    if structure is None:
+        return None
+    if ivy.is_array(x):
+        data = np.asarray(ivy.to_numpy(x), order="C")
+        if data.dtype.hasobject:
+            return None
+        if data.dtype.kind in "fc" and np.isnan(data).any():
+            return None
+        return _hash_parts([structure, memoryview(data.reshape(-1)).cast("B")])
+    try:
+        json_str = json.dumps(x, sort_keys=True, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return _hash_parts([structure, json_str.encode("utf-8")])
+
+
+def _cont_without_empty(cont, config):
+    # the result of cont_diff for identical containers, which drops empty
+    # sub-containers
+    ret = dict()
+    for key, value in cont.items():
+        if isinstance(value, ivy.Container):
+            value = _cont_without_empty(value, config)
+            if not value:
+                continue
+        ret[key] = value
+    return ivy.Container(ret, **config)
+
+
+def _leaf_version(x):
+    # ivy arrays record their writes, while other leaves are assumed unchanged until
+    # the container is mutated
+    if isinstance(x, ivy.Array):
+        return id(x._data), x._version
+    return None
+
+
+class _ContainerHashes:
+    """The cached structural hash and content fingerprint of a container.
+
+    The structural hash covers the keys, and the types, shapes and dtypes of the
+    leaves, while the content fingerprint also covers the array bytes and the other
+    leaf values. Both are computed when first needed, and either is None if some leaf
+    cannot be hashed. Equal hashes are order independent, and imply equal containers.
+
+    The hashes are registered with the container and all of its sub-containers, and
+    are invalidated as soon as any of them is mutated. The hashes of the leaves are
+    checked against the versions of the ivy arrays whenever any ivy array was
+    written since, and only the written leaves are hashed again.
+    """
+
+    def __init__(self, cont):
+        self.valid = True
+        self.generation = 0
+        self._keys = sorted(cont.keys())
+        self._children = dict()
+        self._child_generations = dict()
+        self._leaves = dict()
+        self._versions = dict()
+        for key in self._keys:
+            value = cont[key]
+            if isinstance(value, ivy.Container):
+                child = value._cont_get_hashes()
+                self._children[key] = child
+                self._child_generations[key] = child.generation
+            else:
+                self._leaves[key] = value
+                self._versions[key] = _leaf_version(value)
+        self._leaf_structures = dict()
+        self._leaf_contents = dict()
+        self._write_count = ivy.Array._write_count
+        self._structure = False
+        self._content = False
+        self._register(cont)
+
+    def _register(self, cont):
+        _register_token(cont, self)
+        for value in cont.values():
+            if isinstance(value, ivy.Container):
+                self._register(value)
+
+    def _refresh(self):
+        # drop the hashes of the leaves written since they were computed
+        write_count = ivy.Array._write_count
+        if self._write_count == write_count:
+            return
+        self._write_count = write_count
+        changed = False
+        for key, child in self._children.items():
+            child._refresh()
+            if child.generation != self._child_generations[key]:
+                self._child_generations[key] = child.generation
+                changed = True
+        for key, value in self._leaves.items():
+            version = _leaf_version(value)
+            if version != self._versions[key]:
+                self._versions[key] = version
+                self._leaf_structures.pop(key, None)
+                self._leaf_contents.pop(key, None)
+                changed = True
+        if changed:
+            self.generation += 1
+            self._structure = False
+            self._content = False
+
+    def _hash(self, attr, leaf_hashes, leaf_fn):
+        parts = list()
+        for key in self._keys:
+            if key in self._children:
+                digest = getattr(self._children[key], attr)
+            else:
+                if key not in leaf_hashes:
+                    leaf_hashes[key] = leaf_fn(self._leaves[key])
+                digest = leaf_hashes[key]
+            if digest is None:
+                return None
+            parts += [key.encode("utf-8"), b"\x00", digest]
+        return _hash_parts(parts)
+
+    @property
+    def structure(self):
+        self._refresh()
+        if self._structure is False:
+            self._structure = self._hash(
+                "structure", self._leaf_structures, _leaf_structure
+            )
+        return self._structure
+
+    @property
+    def content(self):
+        self._refresh()
+        if self._content is False:
+            self._content = self._hash("content", self._leaf_contents, _leaf_content)
+        return self._content
+
+
+def _h5_rows(dataset, slice_obj):
+    """The rows of dataset selected by slice_obj, as a range, an integer, an array of
+    indices, or None for scalar datasets.
+    """
+    if not dataset.shape:
+        return None
+    if isinstance(slice_obj, (int, np.integer, slice)):
+        return range(dataset.shape[0])[slice_obj]
+    return np.asarray(slice_obj, dtype="int64")
+
+
+def _h5_read_rows(dataset, rows, rest=()):
+    """Read rows of dataset, as returned by _h5_rows, with only hyperslab and sorted
+    point selections being passed to h5py.
+    """
+    if rows is None:
+        return dataset[()][rest]
+    if isinstance(rows, range):
+        if rows.step > 0:
+            stop = rows.start + len(rows) * rows.step
+            return dataset[(slice(rows.start, stop, rows.step),) + rest]
+        rows = np.asarray(rows, dtype="int64")
+    if not isinstance(rows, np.ndarray):
+        return dataset[(rows,) + rest]
+    if rows.size == 0:
+        return dataset[(slice(0, 0),) + rest]
+    # h5py point selections must be increasing, so read sorted and then reorder
+    order = np.argsort(rows, kind="stable")
+    sorted_rows = rows[order]
+    unique_rows, inverse = np.unique(sorted_rows, return_inverse=True)
+    data = dataset[(unique_rows,) + rest][inverse]
+    ret = np.empty_like(data)
+    ret[order] = data
+    return ret
+
+
+class _LazyH5Dataset:
+    """A dataset of an hdf5 file, which is only read once it is loaded or indexed.
+    Indexing reads just the requested hyperslab of the file.
+    """
+
+    def __init__(self, dataset, slice_obj=slice(None), ivyh=None):
+        self._dataset = dataset
+        self._rows = _h5_rows(dataset, slice_obj)
+        self._ivyh = ivyh
+
+    @property
+    def shape(self):
+        if self._rows is None:
+            return ()
+        if isinstance(self._rows, (int, np.integer)):
+            return tuple(self._dataset.shape[1:])
+        return (len(self._rows),) + tuple(self._dataset.shape[1:])
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def load(self):
+        """Read the whole dataset into an array."""
+        return ivy.default(self._ivyh, ivy).asarray(
+            _h5_read_rows(self._dataset, self._rows)
+        )
+
+    def __getitem__(self, query):
+        first, rest = (query[0], query[1:]) if isinstance(query, tuple) else (query, ())
+        if (
+            isinstance(self._rows, (range, np.ndarray))
+            and isinstance(first, (int, np.integer, slice))
+            and Ellipsis not in rest
+        ):
+            data = _h5_read_rows(self._dataset, self._rows[first], rest)
+        else:
+            data = _h5_read_rows(self._dataset, self._rows)[query]
+        return ivy.default(self._ivyh, ivy).asarray(data)
+
+    def __array__(self, dtype=None):
+        data = _h5_read_rows(self._dataset, self._rows)
+        return data if dtype is None else data.astype(dtype)
+
+    def __repr__(self):
+        return "LazyH5Dataset({}, shape={}, dtype={})".format(
+            self._dataset.name, self.shape, self.dtype
+        )
+
+
+class _QueueLoader:
+    """Loads the containers of a queue-backed container, prefetching the upcoming
+    queue entries in a background thread while the current ones are in use.
+
+    The entries are loaded in order by a single worker thread, which is started when
+    entries are scheduled and exits once none are left.
+    """
+
+    def __init__(self, queues, timeout, config, prefetch=0, device=None):
+        self._queues = queues
+        self._timeout = timeout
+        self._config = config
+        self._prefetch = prefetch
+        self._device = device
+        self._futures = dict()
+        self._tasks = collections.deque()
+        self._worker_running = False
+        self._lock = threading.Lock()
+        self.metrics = dict(
+            loaded=0, load_time=0.0, throughput=0.0, stalls=0, stall_time=0.0
+        )
+        for idx in range(min(prefetch, len(queues))):
+            self._schedule(idx)
+
+    def _load(self, idx):
+        start = time.perf_counter()
+        cont = ivy.Container(
+            self._queues[idx].get(timeout=self._timeout), **self._config
+        ).to_ivy()
+        if self._device is not None:
+            cont = cont.to_device(self._device)
+        with self._lock:
+            metrics = self.metrics
+            metrics["loaded"] += 1
+            metrics["load_time"] += time.perf_counter() - start
+            metrics["throughput"] = metrics["loaded"] / max(metrics["load_time"], 1e-9)
+        return cont
+
+    def _work(self):
+        while True:
+            with self._lock:
+                if not self._tasks:
+                    self._worker_running = False
+                    return
+                idx, future, context = self._tasks.popleft()
+            try:
+                future.set_result(context.run(self._load, idx))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _schedule(self, idx):
+        if idx in self._futures or idx >= len(self._queues):
+            return
+        future = Future()
+        self._futures[idx] = future
+        # run with the caller's context, so that local backends carry over
+        context = contextvars.copy_context()
+        with self._lock:
+            self._tasks.append((idx, future, context))
+            if self._worker_running:
+                return
+            self._worker_running = True
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def get(self, idx):
+        for upcoming in range(idx + 1, idx + 1 + self._prefetch):
+            self._schedule(upcoming)
+        future = self._futures.pop(idx, None)
+        start = time.perf_counter()
+        try:
+            if future is None:
+                return self._load(idx)
+            try:
+                return future.result()
+            except queue.Empty:
+                # the entry may have arrived since the prefetch timed out
+                return self._load(idx)
+        finally:
+            wait = time.perf_counter() - start
+            if future is None or wait > _QUEUE_STALL_THRESHOLD:
+                with self._lock:
+                    self.metrics["stalls"] += 1
+                    self.metrics["stall_time"] += wait
+
+
+class _DeferredCall:
+    """A placeholder for the result of a deferred leaf call."""
+
+    __slots__ = ("idx",)
+
+    def __init__(self, idx):
+        self.idx = idx
+
+
+def _call_chunk(func, calls):
+    return [func(*args) for args in calls]
+
+
+def _map_in_parallel(
+    traverse, func, map_sequences, executor, num_workers, chunk_size, target=None
+):
+    """Runs traverse with the leaf calls of func deferred, then makes the calls in
+    chunks on the executor, or on a thread pool of num_workers, and fills in the
+    results. If a target container is given, the results are written into it only
+    once every call has succeeded, so a failing call leaves it untouched.
+    """
+    calls = list()
+
+    def _record(*args):
+        calls.append(args)
+        return _DeferredCall(len(calls) - 1)
+
+    ret = traverse(_record)
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(num_workers)
+    if chunk_size is None:
+        # a few chunks per worker, to balance uneven leaves without per-leaf overhead
+        workers = num_workers or getattr(executor, "_max_workers", os.cpu_count())
+        chunk_size = max(-(-len(calls) // (4 * max(workers or 1, 1))), 1)
+    try:
+        futures = list()
+        for start in range(0, len(calls), chunk_size):
+            chunk = calls[start : start + chunk_size]
+            if isinstance(executor, ThreadPoolExecutor):
+                # run with the caller's context, so that local backends carry over
+                futures.append(
+                    executor.submit(
+                        contextvars.copy_context().run, _call_chunk, func, chunk
+                    )
+                )
+            else:
+                futures.append(executor.submit(_call_chunk, func, chunk))
+        results = list(chain.from_iterable(f.result() for f in futures))
+    finally:
+        if own_executor:
+            executor.shutdown()
+    ret = ret.cont_map(
+        lambda x, _: results[x.idx] if isinstance(x, _DeferredCall) else x,
+        map_sequences=map_sequences,
+        inplace=True,
+    )
+    if target is None:
+        return ret
+    for key_chain, value in ret.cont_to_iterator():
+        target.cont_set_at_key_chain(key_chain, value, inplace=True)
+    return target
+
+
+def _leaf_signature(x):
+    # the native shape, and cached dtype and device of ivy arrays, avoid building an
+    # ivy.Shape and dispatching ivy.dtype and ivy.dev for every leaf
+    if isinstance(x, ivy.Array):
+        return tuple(x.data.shape), x.dtype, x.device
+    return tuple(x.shape), ivy.dtype(x), ivy.dev(x)
+
+
+_elementwise_fn_names = None
+
+
+def _get_elementwise_fn_names():
+    global _elementwise_fn_names
+    if _elementwise_fn_names is None:
+        # the experimental elementwise module shadows this one as an attribute
+        module = importlib.import_module("ivy.functional.ivy.elementwise")
+        _elementwise_fn_names = frozenset(
+            name
+            for name, fn in vars(module).items()
+            if inspect.isfunction(fn) and fn.__module__ == module.__name__
+        )
+    return _elementwise_fn_names
+
+
 # noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
     def __init__(
@@ -66,6 +638,8 @@ class ContainerBase(dict, abc.ABC):
         rebuild_child_containers=False,
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
+        queue_prefetch=0,
+        queue_device=None,
         **kwargs,
     ):
         """Initialize container object from input dict representation.
@@ -115,6 +689,12 @@ class ContainerBase(dict, abc.ABC):
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
+        queue_prefetch
+            The number of upcoming queue entries to load in the background ahead of
+            access. Default is ``0``, in which case entries are loaded on access.
+        queue_device
+            The device to stage the loaded queue entries on. Default is ``None``, in
+            which case they are left on the device they arrive on.
         kwargs
             keyword arguments for dict creation. Default is ``None``.
 
@@ -153,7 +733,19 @@ class ContainerBase(dict, abc.ABC):
             alphabetical_keys=alphabetical_keys,
         )
         self._config = dict()
+        self._cont_packed = None
+        self._cont_key_chain_index = None
+        self._cont_index_tokens = list()
+        self._cont_hashes = None
         self.cont_inplace_update(dict_in, **self._config_in)
+        if ivy.exists(self._queues):
+            self._queue_loader = _QueueLoader(
+                self._queues,
+                self._queue_timeout,
+                self._config,
+                queue_prefetch,
+                queue_device,
+            )
 
     # Class Methods #
     # --------------#
@@ -181,8 +773,9 @@ class ContainerBase(dict, abc.ABC):
         kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
         # Combine the retrieved containers from args and kwargs into a single list
         with_out = (
-            inspect.signature(ivy.__dict__[fn_name]).parameters.get("out") is not None
-            and out is not None
+            out is not None
+            and inspect.signature(ivy.__dict__[fn_name]).parameters.get("out")
+            is not None
         )
         if with_out:
             conts = arg_conts + kwarg_conts + [out]
@@ -193,22 +786,35 @@ class ContainerBase(dict, abc.ABC):
         # Get the function with the name fn_name, enabling containers to specify
         # their backends irrespective of global ivy's backend
         fn = cont0.cont_ivy.__dict__[fn_name]
+        # Work out the argument templates once, rather than copying the arguments
+        # for every leaf
+        fill_args = _leaf_call_template(args, arg_cont_idxs)
+        fill_kwargs = _leaf_call_template(kwargs, kwarg_cont_idxs)
 
         def map_fn(vals, _):
             if with_out:
                 out = vals[-1]
                 del vals[-1]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args, to_mutable=True)
-            ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs, to_mutable=True)
-            ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+            a = fill_args(vals[:num_arg_conts])
+            kw = fill_kwargs(vals[num_arg_conts:])
             if with_out:
                 return fn(*a, out=out, **kw)
             else:
                 return fn(*a, **kw)
 
+        # elementwise functions of packed containers can be applied to their flat
+        # buffers, provided no other arrays need broadcasting against each leaf
+        elementwise = (
+            not with_out
+            and fn_name in _get_elementwise_fn_names()
+            and not ivy.nested_argwhere(
+                (args, kwargs),
+                ivy.is_array,
+                to_ignore=ivy.Container,
+                stop_after_n_found=1,
+            )
+        )
+
         # Replace each container in arg and kwarg with the arrays at the leaf
         # levels of that container using map_fn and call fn using those arrays
         # as inputs
@@ -219,7 +825,11 @@ class ContainerBase(dict, abc.ABC):
             to_apply,
             prune_unapplied,
             map_nests=map_sequences,
+            elementwise=elementwise,
         )
+        if fn_name.startswith("inplace_"):
+            # the leaves were written in place
+            cont0._cont_invalidate_hashes()
         if ivy.exists(out):
             out.inplace_update(ret)
             ret = out
@@ -429,6 +1039,7 @@ class ContainerBase(dict, abc.ABC):
         detect_value_diffs=True,
         detect_shape_diffs=True,
         config=None,
+        use_fingerprints=False,
     ):
         """Compare keys and values in a sequence of containers, returning the single
         shared values where they are the same, and new nested sub-dicts with all values
@@ -457,6 +1068,11 @@ class ContainerBase(dict, abc.ABC):
             Default is ``True``.
         config
             The configuration for the containers. Default is the same as container0.
+        use_fingerprints
+            Whether to compare the cached fingerprints of the containers (see
+            ``cont_fingerprint``), or their structural hashes if value diffs are not
+            detected, so that only the sub-containers which differ are visited.
+            Default is ``False``.
         *containers
 
 
@@ -467,6 +1083,18 @@ class ContainerBase(dict, abc.ABC):
         """
         ivy.assertions.check_elem_in_list(mode, ["all", "same_only", "diff_only"])
 
+        if use_fingerprints and all(isinstance(c, ivy.Container) for c in containers):
+            hashes = [cont._cont_get_hashes() for cont in containers]
+            if detect_value_diffs:
+                digests = [h.content for h in hashes]
+            else:
+                digests = [h.structure for h in hashes]
+            if digests[0] is not None and digests.count(digests[0]) == len(digests):
+                config = ivy.default(config, containers[0].cont_config)
+                if mode == "diff_only":
+                    return ivy.Container(**config)
+                return _cont_without_empty(containers[0], config)
+
         # if inputs are not dicts, then compare their values to determine the diff dict
         num_containers = len(containers)
         container0 = containers[0]
@@ -539,6 +1167,7 @@ class ContainerBase(dict, abc.ABC):
                     detect_value_diffs=detect_value_diffs,
                     detect_shape_diffs=detect_shape_diffs,
                     config=config,
+                    use_fingerprints=use_fingerprints,
                 )
                 if not isinstance(res, dict) or res:
                     return_dict[key] = res
@@ -574,6 +1203,7 @@ class ContainerBase(dict, abc.ABC):
         detect_key_diffs=True,
         detect_shape_diffs=True,
         config=None,
+        use_fingerprints=False,
     ):
         """Compare keys and shapes in a sequence of containers, returning the single
         shared values where they are the same, and new nested sub-dicts with all values
@@ -599,6 +1229,10 @@ class ContainerBase(dict, abc.ABC):
             Default is ``True``.
         config
             The configuration for the containers. Default is the same as container0.
+        use_fingerprints
+            Whether to compare the cached structural hashes of the containers (see
+            ``cont_structural_hash``), so that only the sub-containers which differ are
+            visited. Default is ``False``.
         *containers
 
         Returns
@@ -614,6 +1248,7 @@ class ContainerBase(dict, abc.ABC):
             detect_value_diffs=False,
             detect_shape_diffs=detect_shape_diffs,
             config=config,
+            use_fingerprints=use_fingerprints,
         )
 
     @staticmethod
@@ -627,6 +1262,10 @@ class ContainerBase(dict, abc.ABC):
         config=None,
         map_nests=False,
         assert_identical=False,
+        elementwise=False,
+        executor=None,
+        num_workers=None,
+        chunk_size=None,
     ):
         """Apply function to all array values from a collection of identically
         structured containers.
@@ -654,12 +1293,55 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         assert_identical
             Whether to assert that the input containers are identical or not.
+        elementwise
+            Whether func is elementwise. If so, and all containers are packed with the
+            same layout (see ``cont_pack``) and the other inputs are scalars, func is
+            applied once to each flat buffer rather than to each leaf, with None
+            passed as the key chain. Otherwise in the container fusion mode, func is
+            applied once to each stack of leaves sharing the same shape, dtype and
+            device across the containers. Default is ``False``.
+        executor
+            An executor to call func on the leaves with in parallel, such as a
+            ``concurrent.futures.ThreadPoolExecutor``. Default is ``None``.
+        num_workers
+            The number of threads to call func on the leaves with in parallel, if no
+            executor is given. Default is ``None``, in which case the leaves are
+            mapped sequentially unless an executor is given.
+        chunk_size
+            The number of leaves in each parallel task. Default is ``None``, in which
+            case the leaves are split into about four chunks per worker.
 
         Returns
         -------
             Container
 
         """
+        if (executor is not None or num_workers is not None) and key_chain == "":
+            return _map_in_parallel(
+                lambda fn: ivy.Container.cont_multi_map(
+                    fn,
+                    containers,
+                    key_chains,
+                    to_apply,
+                    prune_unapplied,
+                    key_chain,
+                    config,
+                    map_nests,
+                    assert_identical,
+                ),
+                func,
+                map_nests,
+                executor,
+                num_workers,
+                chunk_size,
+            )
+        if elementwise and key_chains is None and key_chain == "":
+            ret = ContainerBase._cont_packed_multi_map(func, containers, config)
+            if ret is None and ivy.get_container_fusion_mode():
+                ret = ContainerBase._cont_fused_multi_map(func, containers, config)
+            if ret is not None:
+                return ret
+        key_chains = _as_key_chains(key_chains)
         container0 = None
         for cont in containers:
             if isinstance(cont, ivy.Container):
@@ -682,15 +1364,6 @@ class ContainerBase(dict, abc.ABC):
             value0 = values[0]
             this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
             is_container = [ivy.is_ivy_container(x) for x in values]
-
-            def _found_in_key_chains(this_key_chain, key_chains):
-                if key_chains is None:
-                    return False
-                for key_chain in key_chains:
-                    if this_key_chain.startswith(key_chain):
-                        return True
-                return False
-
             if not assert_identical and not all(is_container) and any(is_container):
                 found = _found_in_key_chains(this_key_chain, key_chains)
                 if key_chains is not None:
@@ -734,6 +1407,98 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_packed_multi_map(func, containers, config=None):
+        container0 = None
+        layout = None
+        for cont in containers:
+            if isinstance(cont, ivy.Container):
+                cont_layout = cont._cont_get_packed_layout()
+                if cont_layout is None:
+                    return None
+                if layout is None:
+                    container0, layout = cont, cont_layout
+                elif cont_layout.entries is not layout.entries and (
+                    cont_layout.entries != layout.entries
+                ):
+                    return None
+            elif not isinstance(cont, Number):
+                return None
+        if layout is None:
+            return None
+        buffers = [
+            func(
+                [
+                    c._cont_packed.buffers[i] if isinstance(c, ivy.Container) else c
+                    for c in containers
+                ],
+                None,
+            )
+            for i in range(len(layout.buffers))
+        ]
+        return container0._cont_from_packed(layout, buffers, config)
+
+    @staticmethod
+    def _cont_fused_multi_map(func, containers, config=None):
+        container0 = None
+        leaves = list()
+        for cont in containers:
+            if isinstance(cont, ivy.Container):
+                container0 = ivy.default(container0, cont)
+                leaves.append(list(cont.cont_to_iterator()))
+            elif not isinstance(cont, Number):
+                return None
+        if container0 is None:
+            return None
+        key_chains = [kc for kc, _ in leaves[0]]
+        # group the leaf positions by the shape, dtype and device of every input
+        if any(len(cont_leaves) != len(key_chains) for cont_leaves in leaves):
+            return None
+        groups = dict()
+        for i, kc in enumerate(key_chains):
+            signature = list()
+            for cont_leaves in leaves:
+                leaf_kc, leaf = cont_leaves[i]
+                if leaf_kc != kc or not (
+                    isinstance(leaf, ivy.Array) or ivy.is_native_array(leaf)
+                ):
+                    return None
+                signature.append(_leaf_signature(leaf))
+            if any(shape != signature[0][0] for shape, _, _ in signature):
+                return None
+            groups.setdefault(tuple(signature), []).append(i)
+        results = [None] * len(key_chains)
+        for signature, idxs in groups.items():
+            shape = signature[0][0]
+            inputs = list()
+            leaf_iters = iter(leaves)
+            for cont in containers:
+                if isinstance(cont, ivy.Container):
+                    cont_leaves = next(leaf_iters)
+                    values = [cont_leaves[i][1] for i in idxs]
+                    inputs.append(values[0] if len(idxs) == 1 else ivy.stack(values))
+                else:
+                    inputs.append(cont)
+            ret = func(inputs, None)
+            if len(idxs) == 1:
+                results[idxs[0]] = ret
+                continue
+            native = ivy.to_native(ret)
+            if not ivy.is_native_array(native) or tuple(native.shape) != (
+                len(idxs),
+            ) + tuple(shape):
+                return None
+            for j, i in enumerate(idxs):
+                results[i] = ivy.Array(native[j, ...])
+        return_dict = dict()
+        for kc, result in zip(key_chains, results):
+            keys = kc.split("/")
+            d = return_dict
+            for key in keys[:-1]:
+                d = d.setdefault(key, dict())
+            d[keys[-1]] = result
+        return ivy.Container(return_dict, **ivy.default(config, container0._config))
+
     @staticmethod
     def cont_common_key_chains(containers):
         """Return the key-chains common across all containers.
@@ -764,6 +1529,7 @@ class ContainerBase(dict, abc.ABC):
         to_apply=True,
         partial=False,
         key_chain="",
+        use_fingerprints=False,
     ):
         """Returns a single boolean as to whether the input containers have identical
         key-chains and data types.
@@ -793,12 +1559,25 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        use_fingerprints
+            Whether to compare the cached fingerprints of the containers (see
+            ``cont_fingerprint``), or their structural hashes if arrays_equal is False,
+            so that identical sub-containers are skipped without visiting their leaves.
+            Only used if same_arrays is False. Default is ``False``.
 
         Returns
         -------
         Boolean
 
         """
+        if use_fingerprints and not same_arrays and not partial:
+            hashes = [cont._cont_get_hashes() for cont in containers]
+            if arrays_equal:
+                digests = [h.content for h in hashes]
+            else:
+                digests = [h.structure for h in hashes]
+            if digests[0] is not None and digests.count(digests[0]) == len(digests):
+                return True
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -844,6 +1623,7 @@ class ContainerBase(dict, abc.ABC):
                     to_apply,
                     partial,
                     this_key_chain,
+                    use_fingerprints=use_fingerprints,
                 )
                 if not ret:
                     return False
@@ -913,6 +1693,7 @@ class ContainerBase(dict, abc.ABC):
         to_apply=True,
         partial=False,
         key_chain="",
+        use_fingerprints=False,
     ):
         """Returns a single boolean as to whether the input containers have identical
         structure.
@@ -937,6 +1718,10 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        use_fingerprints
+            Whether to compare the cached structural hashes of the containers (see
+            ``cont_structural_hash``), so that identical sub-containers are skipped
+            without visiting their leaves. Default is ``False``.
 
         Returns
         -------
@@ -953,6 +1738,7 @@ class ContainerBase(dict, abc.ABC):
             to_apply,
             partial,
             key_chain,
+            use_fingerprints=use_fingerprints,
         )
 
     @staticmethod
@@ -1050,7 +1836,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1060,13 +1850,19 @@ class ContainerBase(dict, abc.ABC):
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         slice_obj
-            slice object to slice all h5 elements. (Default value = slice(None))
+            slice object to slice all h5 elements, or a sequence of indices such as
+            the permutation of a virtual shuffle. (Default value = slice(None))
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to defer reading the datasets. If so, each leaf is only read when
+            it is first accessed by key, and slicing the container reads only the
+            requested hyperslab of each dataset, so the file must remain open.
+            Default is ``False``.
 
         Returns
         -------
@@ -1087,17 +1883,25 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
-                )
+                if lazy:
+                    container_dict[key] = _LazyH5Dataset(value, slice_obj, ivyh)
+                else:
+                    # read straight into a numpy array, rather than via python lists
+                    container_dict[key] = ivy.default(ivyh, ivy).asarray(
+                        _h5_read_rows(value, _h5_rows(value, slice_obj))
+                    )
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        if type(h5_obj_or_filepath) is str and not lazy:
+            h5_obj.close()
+        return ivy.Container(
+            container_dict, ivyh=ivyh, alphabetical_keys=alphabetical_keys
+        )
 
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1122,6 +1926,74 @@ class ContainerBase(dict, abc.ABC):
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def cont_from_disk_as_binary(
+        binary_filepath, key_chains=None, mmap_mode="c", ivyh=None
+    ):
+        """Load container object from disk at the specified filepath, saved in the
+        binary format of ``cont_to_disk_as_binary``.
+
+        Only the header is read up front. The file is memory-mapped, and each array is
+        a view into the mapping, which is zero-copy for backends able to wrap numpy
+        arrays, so the data is only read from disk as it is used.
+
+        Parameters
+        ----------
+        binary_filepath
+            Filepath where the container object is saved to disk.
+        key_chains
+            The key-chains to load, along with everything beneath them. Default is
+            ``None``, in which case the whole container is loaded.
+        mmap_mode
+            The mode of the memory-map, either 'r' for read-only arrays, or 'c' for
+            copy-on-write arrays, which can be modified without writing to the file.
+            Default is 'c'.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        """
+        with open(binary_filepath, "rb") as f:
+            if f.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+                raise ivy.exceptions.IvyException(
+                    "{} is not a binary container file.".format(binary_filepath)
+                )
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size).decode("utf-8"))
+        if isinstance(key_chains, str):
+            key_chains = [key_chains]
+        key_chains = None if key_chains is None else set(key_chains)
+        data = None
+        container_dict = dict()
+        for leaf in header["leaves"]:
+            keys = leaf["key_chain"].split("/")
+            if key_chains is not None and not any(
+                "/".join(keys[: i + 1]) in key_chains for i in range(len(keys))
+            ):
+                continue
+            if "value" in leaf:
+                value = leaf["value"]
+            else:
+                if data is None:
+                    data = np.memmap(binary_filepath, dtype=np.uint8, mode=mmap_mode)
+                value = ivy.default(ivyh, ivy).asarray(
+                    np.ndarray(
+                        leaf["shape"],
+                        np.dtype(leaf["dtype"]),
+                        buffer=data,
+                        offset=header["data_offset"] + leaf["offset"],
+                    )
+                )
+            d = container_dict
+            for key in keys[:-1]:
+                d = d.setdefault(key, dict())
+            d[keys[-1]] = value
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def cont_from_disk_as_json(json_filepath, ivyh=None):
         """Load container object from disk at the specified json filepath. If some
@@ -1184,16 +2056,33 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath, seed_value=0, max_memory=2**28, virtual=False
+    ):
         """Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        A single permutation is drawn for each dataset length, and is applied to
+        each dataset in memory if it fits within max_memory, and otherwise out of core
+        with contiguous block reads and writes through a temporary buffer dataset.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        max_memory
+            The maximum number of bytes of a dataset to read into memory at once.
+            Default is 256MB.
+        virtual
+            Whether to leave the file untouched and only return the permutation, which
+            can be passed as the slice_obj of ``cont_from_disk_as_hdf5`` to read the
+            shuffled entries. Default is ``False``.
+
+        Returns
+        -------
+            The permutation if virtual, otherwise None.
 
         """
         ivy.assertions.check_exists(
@@ -1204,21 +2093,100 @@ class ContainerBase(dict, abc.ABC):
         if seed_value is None:
             seed_value = random.randint(0, 1000)
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "a")
+            h5_obj = h5py.File(h5_obj_or_filepath, "r" if virtual else "a")
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
+        datasets = list()
+
+        def _collect(group):
+            for value in group.values():
+                if isinstance(value, h5py.Group):
+                    _collect(value)
+                elif isinstance(value, h5py.Dataset):
+                    datasets.append(value)
+                else:
+                    raise ivy.exceptions.IvyException(
+                        "Item found inside h5_obj which was neither a Group nor a "
+                        "Dataset."
+                    )
+
+        _collect(h5_obj)
+        permutations = dict()
+        for dataset in datasets:
+            n = dataset.shape[0] if dataset.shape else 0
+            if n not in permutations:
+                # the same permutation as shuffling the entries with this seed
+                permutation = list(range(n))
                 random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
-            else:
-                raise ivy.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
-                )
+                random.shuffle(permutation)
+                permutations[n] = np.asarray(permutation, dtype="int64")
+
+        if virtual:
+            ivy.assertions.check_true(
+                len(permutations) <= 1,
+                message="a virtual shuffle needs all datasets to have the same length",
+            )
+            if isinstance(h5_obj, h5py.File):
+                h5_obj.close()
+            return next(iter(permutations.values()), np.zeros(0, dtype="int64"))
+
+        for dataset in datasets:
+            if not dataset.shape or dataset.shape[0] < 2:
+                continue
+            permutation = permutations[dataset.shape[0]]
+            row_size = max(
+                dataset.dtype.itemsize * reduce(mul, dataset.shape[1:], 1), 1
+            )
+            if row_size * dataset.shape[0] <= max_memory:
+                dataset[...] = dataset[()][permutation]
+                continue
+            # two passes of contiguous block reads and writes: first each source block
+            # is split into the buckets of its destination blocks within a buffer
+            # dataset, then each bucket is reordered in memory and written back
+            n = dataset.shape[0]
+            block_size = max(max_memory // row_size, 1)
+            num_blocks = -(-n // block_size)
+            destinations = np.empty_like(permutation)
+            destinations[permutation] = np.arange(n)
+            buffer_destinations = np.empty_like(permutation)
+            bucket_fill = np.zeros(num_blocks, dtype="int64")
+            # a unique name, so that the buffer never clashes with an existing dataset
+            parent = dataset.parent
+            name = "{}_shuffle_buffer_{}".format(
+                dataset.name.split("/")[-1], uuid.uuid4().hex
+            )
+            buffer = parent.create_dataset(
+                name, shape=dataset.shape, dtype=dataset.dtype
+            )
+            try:
+                for start in range(0, n, block_size):
+                    block = dataset[start : start + block_size]
+                    block_destinations = destinations[start : start + len(block)]
+                    order = np.argsort(block_destinations, kind="stable")
+                    block, block_destinations = block[order], block_destinations[order]
+                    bounds = np.searchsorted(
+                        block_destinations // block_size, np.arange(num_blocks + 1)
+                    )
+                    for bucket in range(num_blocks):
+                        lo, hi = bounds[bucket], bounds[bucket + 1]
+                        if lo == hi:
+                            continue
+                        offset = bucket * block_size + bucket_fill[bucket]
+                        buffer[offset : offset + hi - lo] = block[lo:hi]
+                        buffer_destinations[
+                            offset : offset + hi - lo
+                        ] = block_destinations[lo:hi]
+                        bucket_fill[bucket] += hi - lo
+                for start in range(0, n, block_size):
+                    block = buffer[start : start + block_size]
+                    shuffled = np.empty_like(block)
+                    shuffled[
+                        buffer_destinations[start : start + len(block)] - start
+                    ] = block
+                    dataset[start : start + len(block)] = shuffled
+            finally:
+                del parent[name]
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1447,6 +2415,91 @@ class ContainerBase(dict, abc.ABC):
             return sub_devs[0]
         return None
 
+    def _cont_loaded_items(self):
+        # the items, with the lazy hdf5 datasets read and stored in their place, so
+        # that the traversals never expose them
+        for key, value in self.items():
+            if isinstance(value, _LazyH5Dataset):
+                value = value.load()
+                dict.__setitem__(self, key, value)
+            yield key, value
+
+    def _cont_get_key_chain_index(self):
+        index = self.__dict__.get("_cont_key_chain_index")
+        if index is None or not index.valid:
+            index = _KeyChainIndex(self)
+            self._cont_key_chain_index = index
+        return index
+
+    def _cont_invalidate_key_chain_index(self):
+        tokens = self.__dict__.get("_cont_index_tokens")
+        if tokens:
+            for index in tokens:
+                index.valid = False
+            tokens.clear()
+
+    def _cont_get_hashes(self):
+        hashes = self.__dict__.get("_cont_hashes")
+        if hashes is None or not hashes.valid:
+            hashes = _ContainerHashes(self)
+            self._cont_hashes = hashes
+        return hashes
+
+    def _cont_invalidate_hashes(self):
+        # for writes into the leaves, which leave the key chain index intact
+        tokens = self.__dict__.get("_cont_index_tokens")
+        if tokens:
+            for token in tokens:
+                if isinstance(token, _ContainerHashes):
+                    token.valid = False
+            tokens[:] = [t for t in tokens if t.valid]
+        for value in self.values():
+            if isinstance(value, ivy.Container):
+                value._cont_invalidate_hashes()
+
+    def _cont_get_packed_layout(self):
+        layout = self.__dict__.get("_cont_packed")
+        if layout is None:
+            return None
+        # the layout only holds while the leaves are still the views it created
+        leaves = layout.leaves
+        num_leaves = len(leaves)
+        i = 0
+        for value in self.cont_to_iterator_values():
+            if (
+                i == num_leaves
+                or value is not leaves[i][0]
+                or value.data is not leaves[i][1]
+            ):
+                return None
+            i += 1
+        if i != num_leaves:
+            return None
+        return layout
+
+    def _cont_from_packed(self, layout, buffers, config=None):
+        if any(
+            not ivy.is_array(new) or new.shape != old.shape
+            for new, old in zip(buffers, layout.buffers)
+        ):
+            return None
+        buffers = [ivy.to_ivy(b) for b in buffers]
+        natives = [b.data for b in buffers]
+        backend = ivy.current_backend(*natives) if natives else None
+        return_dict = dict()
+        leaves = list()
+        for keys, idx, offset, size, shape in layout.entries:
+            native = backend.reshape(natives[idx][offset : offset + size], shape)
+            leaf = ivy.Array(native)
+            leaves.append((leaf, native))
+            d = return_dict
+            for key in keys[:-1]:
+                d = d.setdefault(key, dict())
+            d[keys[-1]] = leaf
+        ret = ivy.Container(return_dict, **ivy.default(config, self._config))
+        ret._cont_packed = _PackedLayout(buffers, layout.entries, leaves)
+        return ret
+
     def _cont_at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
         return_cont = ivy.Container(dict(), **self._config)
         for kc in key_chains:
@@ -1956,6 +3009,68 @@ class ContainerBase(dict, abc.ABC):
         """
         pickle.dump(self.to_native().cont_to_dict(), open(pickle_filepath, "wb"))
 
+    def cont_to_disk_as_binary(self, binary_filepath):
+        """Save container object to disk at the specified filepath, in a compact
+        binary format, which can be memory-mapped by ``cont_from_disk_as_binary``.
+
+        The file starts with a json header holding the key-chain, dtype, shape and
+        byte offset of each array, followed by the raw bytes of the arrays, each
+        aligned to 64 bytes. Leaves which are not arrays must be json-able, and are
+        stored in the header.
+
+        Parameters
+        ----------
+        binary_filepath
+            Filepath for where to save the container to disk.
+
+        """
+        leaves = list()
+        arrays = list()
+        offset = 0
+        for key_chain, value in self.cont_to_iterator(include_empty=True):
+            if ivy.is_array(value):
+                array = np.asarray(ivy.to_numpy(value), order="C")
+                ivy.assertions.check_true(
+                    not array.dtype.hasobject,
+                    message="cannot save arrays of objects in the binary format, "
+                    "but found one at {}".format(key_chain),
+                )
+                offset = -(-offset // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+                leaves.append(
+                    dict(
+                        key_chain=key_chain,
+                        dtype=array.dtype.str,
+                        shape=list(array.shape),
+                        offset=offset,
+                    )
+                )
+                arrays.append((offset, array))
+                offset += array.nbytes
+            else:
+                if isinstance(value, ivy.Container):
+                    value = dict()
+                ivy.assertions.check_true(
+                    _is_jsonable(value),
+                    message="only arrays and json-able leaves can be saved in the "
+                    "binary format, but found {} at {}".format(type(value), key_chain),
+                )
+                leaves.append(dict(key_chain=key_chain, value=value))
+        header_size = len(json.dumps(dict(leaves=leaves, data_offset=0)))
+        # leave space for the digits of the data offset itself
+        data_offset = len(_BINARY_MAGIC) + 8 + header_size + 20
+        data_offset = -(-data_offset // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+        header = json.dumps(dict(leaves=leaves, data_offset=data_offset)).encode(
+            "utf-8"
+        )
+        with open(binary_filepath, "wb") as f:
+            f.write(_BINARY_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            f.write(b"\x00" * (data_offset - f.tell()))
+            for array_offset, array in arrays:
+                f.write(b"\x00" * (data_offset + array_offset - f.tell()))
+                f.write(memoryview(array).cast("B") if array.ndim else array.tobytes())
+
     def cont_to_jsonable(self, return_dict=None):
         """
 
@@ -1989,7 +3104,7 @@ class ContainerBase(dict, abc.ABC):
 
     def cont_to_nested_list(self):
         return_list = list()
-        for key, value in self.items():
+        for key, value in self._cont_loaded_items():
             if isinstance(value, ivy.Container):
                 return_list.append(value.cont_to_nested_list())
             elif value is not None and key != "_f":
@@ -2030,7 +3145,7 @@ class ContainerBase(dict, abc.ABC):
 
         """
         return_dict = dict()
-        for key, value in self.items():
+        for key, value in self._cont_loaded_items():
             if isinstance(value, ivy.Container):
                 return_dict[key] = value.cont_to_dict()
             else:
@@ -2054,7 +3169,7 @@ class ContainerBase(dict, abc.ABC):
             Iterator for the container elements.
 
         """
-        for key, value in self.items():
+        for key, value in self._cont_loaded_items():
             if leaf_keys_only:
                 kc = key
             else:
@@ -2077,7 +3192,7 @@ class ContainerBase(dict, abc.ABC):
             Iterator for the container values.
 
         """
-        for key, value in self.items():
+        for key, value in self._cont_loaded_items():
             if isinstance(value, ivy.Container) and (not include_empty or value):
                 # noinspection PyCompatibility
                 yield from value.cont_to_iterator_values(include_empty)
@@ -2165,25 +3280,12 @@ class ContainerBase(dict, abc.ABC):
             Boolean
 
         """
-        has_key = False
-
-        def map_fn(x, kc):
-            """
-
-            Parameters
-            ----------
-            x
-                param kc:
-            kc
-
-            """
-            nonlocal has_key
-            if query_key in kc:
-                has_key = True
-            return x
-
-        self.cont_map(map_fn)
-        return has_key
+        cache = self._cont_get_key_chain_index().cache
+        if ("has_key", query_key) not in cache:
+            cache[("has_key", query_key)] = any(
+                query_key in kc for kc in self._cont_get_key_chain_index().key_chains
+            )
+        return cache[("has_key", query_key)]
 
     def cont_has_key_chain(self, key_chain):
         """Determine whether container object has specified key-chain.
@@ -2427,21 +3529,24 @@ class ContainerBase(dict, abc.ABC):
         """
         if queries is None and ignore_none:
             return self
-        key_chains_to_keep = list()
         if isinstance(queries, str):
             queries = [queries]
-
-        def map_fn(x, kc):
-            nonlocal key_chains_to_keep
-            kc_split = re.split("[/.]", kc)
-            for query_key in queries:
-                if query_key in kc_split or (
-                    containing and min([query_key in k for k in kc_split])
-                ):
-                    key_chains_to_keep.append(kc)
-            return x
-
-        self.cont_map(map_fn)
+        index = self._cont_get_key_chain_index()
+        if containing:
+            key_chains_to_keep = [
+                kc
+                for kc in index.key_chains
+                if any(
+                    query_key in re.split("[/.]", kc)
+                    or min([query_key in k for k in re.split("[/.]", kc)])
+                    for query_key in queries
+                )
+            ]
+        else:
+            key_chains_to_keep = sorted(
+                set(kc for q in queries for kc in index.by_key.get(q, ())),
+                key=index.positions.__getitem__,
+            )
         return self.cont_at_key_chains(
             key_chains_to_keep, ignore_key_errors=ignore_key_errors
         )
@@ -2521,7 +3626,8 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
-        return [kc for kc, v in self.cont_to_iterator(include_empty=include_empty)]
+        index = self._cont_get_key_chain_index()
+        return list(index.key_chains_w_empty if include_empty else index.key_chains)
 
     def cont_key_chains_containing(self, sub_str, include_empty=False):
         """
@@ -2534,9 +3640,10 @@ class ContainerBase(dict, abc.ABC):
              (Default value = False)
 
         """
+        index = self._cont_get_key_chain_index()
         return [
             kc
-            for kc, v in self.cont_to_iterator(include_empty=include_empty)
+            for kc in (index.key_chains_w_empty if include_empty else index.key_chains)
             if sub_str in kc
         ]
 
@@ -2725,27 +3832,14 @@ class ContainerBase(dict, abc.ABC):
         """
         if query_keys is None and ignore_none:
             return self
-        key_chains_to_prune = list()
         if isinstance(query_keys, str):
             query_keys = [query_keys]
-
-        def map_fn(x, kc):
-            """
-
-            Parameters
-            ----------
-            x
-                param kc:
+        key_chains_to_prune = [
             kc
-
-            """
-            nonlocal key_chains_to_prune
-            for query_key in query_keys:
-                if query_key in kc:
-                    key_chains_to_prune.append(kc)
-            return x
-
-        self.cont_map(map_fn)
+            for kc in self._cont_get_key_chain_index().key_chains
+            for query_key in query_keys
+            if query_key in kc
+        ]
         return self.cont_prune_key_chains(key_chains_to_prune)
 
     def cont_prune_key_chain(self, key_chain):
@@ -3064,6 +4158,60 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_pack(self):
+        """Create a copy of this container with its arrays packed into one contiguous
+        flat buffer per dtype and device, and with each leaf a view into its buffer.
+
+        Elementwise operations on packed containers, such as container arithmetic
+        and comparisons, the elementwise ivy functions and ``cont_map`` with
+        ``elementwise=True``, are then applied once per buffer rather than once per
+        leaf, and return containers packed with the same layout. Replacing a leaf, or
+        rebinding its data, detaches the container from its buffers, after which the
+        usual per-leaf path is used again. Empty sub-containers are not kept.
+
+        Returns
+        -------
+            The packed container.
+
+        """
+        groups = dict()
+        entries = list()
+        for key_chain, value in self.cont_to_iterator():
+            ivy.assertions.check_true(
+                ivy.is_array(value),
+                message="only containers with all leaves being arrays can be packed, "
+                "but found {} at {}".format(type(value), key_chain),
+            )
+            group = groups.setdefault(
+                (ivy.dtype(value), ivy.dev(value)), (len(groups), list(), [0])
+            )
+            size = reduce(mul, value.shape, 1)
+            entries.append(
+                (
+                    tuple(key_chain.split("/")),
+                    group[0],
+                    group[2][0],
+                    size,
+                    tuple(value.shape),
+                )
+            )
+            group[1].append(value)
+            group[2][0] += size
+        buffers = [ivy.concat(values, axis=None) for _, values, _ in groups.values()]
+        layout = _PackedLayout(buffers, tuple(entries), None)
+        return self._cont_from_packed(layout, buffers)
+
+    def cont_unpack(self):
+        """Create a copy of this container with each array copied out of the flat
+        buffers of a packed container, so that the leaves are independent again.
+
+        Returns
+        -------
+            The unpacked container.
+
+        """
+        return self.cont_map(lambda x, kc: ivy.copy_array(x) if ivy.is_array(x) else x)
+
     def cont_map(
         self,
         func,
@@ -3073,6 +4221,10 @@ class ContainerBase(dict, abc.ABC):
         map_sequences=False,
         inplace=False,
         key_chain="",
+        elementwise=False,
+        executor=None,
+        num_workers=None,
+        chunk_size=None,
     ):
         """Apply function to all array values of container.
 
@@ -3098,14 +4250,57 @@ class ContainerBase(dict, abc.ABC):
             Whether to also map to sequences (lists and tuples). Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        elementwise
+            Whether func is elementwise. If so, and the container is packed (see
+            ``cont_pack``), func is applied once to each flat buffer rather than to
+            each leaf, with None passed as the key chain. Otherwise in the container
+            fusion mode, func is applied once to each stack of leaves sharing the same
+            shape, dtype and device. Default is ``False``.
+        executor
+            An executor to call func on the leaves with in parallel, such as a
+            ``concurrent.futures.ThreadPoolExecutor``. Default is ``None``.
+        num_workers
+            The number of threads to call func on the leaves with in parallel, if no
+            executor is given. Default is ``None``, in which case the leaves are
+            mapped sequentially unless an executor is given.
+        chunk_size
+            The number of leaves in each parallel task. Default is ``None``, in which
+            case the leaves are split into about four chunks per worker.
 
         Returns
         -------
             New container following the function mapped to each sub-array.
 
         """
+        if (executor is not None or num_workers is not None) and key_chain == "":
+            return _map_in_parallel(
+                lambda fn: self.cont_map(
+                    fn, key_chains, to_apply, prune_unapplied, map_sequences
+                ),
+                func,
+                map_sequences,
+                executor,
+                num_workers,
+                chunk_size,
+                target=self if inplace else None,
+            )
+        if elementwise and key_chains is None and not inplace and key_chain == "":
+            layout = self._cont_get_packed_layout()
+            if layout is not None:
+                ret = self._cont_from_packed(
+                    layout, [func(buffer, None) for buffer in layout.buffers]
+                )
+                if ret is not None:
+                    return ret
+            elif ivy.get_container_fusion_mode():
+                ret = ContainerBase._cont_fused_multi_map(
+                    lambda xs, kc: func(xs[0], kc), [self]
+                )
+                if ret is not None:
+                    return ret
+        key_chains = _as_key_chains(key_chains)
         return_dict = self if inplace else dict()
-        for key, value in self.items():
+        for key, value in self._cont_loaded_items():
             this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
             if isinstance(value, ivy.Container):
                 ret = value.cont_map(
@@ -3180,6 +4375,7 @@ class ContainerBase(dict, abc.ABC):
             New container following the function mapped to each sub-container.
 
         """
+        key_chains = _as_key_chains(key_chains)
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
@@ -3859,6 +5055,9 @@ class ContainerBase(dict, abc.ABC):
     def __getattr__(self, item, *args, **kwargs):
         try:
             ret = dict.__getitem__(self, item)
+            if isinstance(ret, _LazyH5Dataset):
+                ret = ret.load()
+                dict.__setitem__(self, item, ret)
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = ivy.Container()
@@ -3906,9 +5105,7 @@ class ContainerBase(dict, abc.ABC):
         conts = list()
         for i in queue_idxs:
             if i not in self._loaded_containers_from_queues:
-                cont = ivy.Container(
-                    self._queues[i].get(timeout=self._queue_timeout), **self._config
-                ).to_ivy()
+                cont = self._queue_loader.get(i)
                 self._loaded_containers_from_queues[i] = cont
             else:
                 cont = self._loaded_containers_from_queues[i]
@@ -3950,6 +5147,9 @@ class ContainerBase(dict, abc.ABC):
                 ret = self.cont_at_key_chain(query)
                 return ret
             ret = dict.__getitem__(self, query)
+            if isinstance(ret, _LazyH5Dataset):
+                ret = ret.load()
+                dict.__setitem__(self, query, ret)
             return ret
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
@@ -3990,8 +5190,33 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            self._cont_invalidate_key_chain_index()
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_invalidate_key_chain_index()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._cont_invalidate_key_chain_index()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self._cont_invalidate_key_chain_index()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_key_chain_index()
+        return dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self._cont_invalidate_key_chain_index()
+        return dict.clear(self)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4002,6 +5227,11 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the leaves are no longer views into the buffers once unpickled
+        state_dict["_cont_packed"] = None
+        state_dict["_cont_key_chain_index"] = None
+        state_dict["_cont_index_tokens"] = list()
+        state_dict["_cont_hashes"] = None
         state_dict["_local_ivy"] = ivy.try_else_none(
             lambda: state_dict["_local_ivy"].current_backend_str()
         )
@@ -4082,6 +5312,42 @@ class ContainerBase(dict, abc.ABC):
 
         return self._cont_ivy
 
+    @property
+    def cont_queue_metrics(self):
+        """The loading metrics of a queue-backed container: the number of queue
+        entries loaded, the total time spent loading them and the resulting entries
+        per second, and the number of accesses which stalled waiting for an entry
+        along with the total stall time. None if the container has no queues.
+        """
+        if not ivy.exists(self._queues):
+            return None
+        return dict(self._queue_loader.metrics)
+
+    @property
+    def cont_is_packed(self):
+        """Whether the container is packed into flat buffers, see ``cont_pack``."""
+        return self._cont_get_packed_layout() is not None
+
+    @property
+    def cont_structural_hash(self):
+        """A hash of the keys, and the types, shapes and dtypes of the leaves, as a hex
+        string. Cached until the container is mutated. None if a leaf cannot be hashed.
+        """
+        structure = self._cont_get_hashes().structure
+        return None if structure is None else structure.hex()
+
+    @property
+    def cont_fingerprint(self):
+        """A hash of the structure, the array bytes and the other leaf values, as a hex
+        string. Computed when first accessed, and cached until the container is
+        mutated. Writes to ivy arrays, such as item assignment or ivy.inplace_update,
+        are detected, and only the written leaves are hashed again. Native arrays
+        written in place, or ivy arrays written through their native data, are not
+        detected. None if a leaf is neither an array nor json-able, or contains nans.
+        """
+        content = self._cont_get_hashes().content
+        return None if content is None else content.hex()
+
     @property
     def cont_config(self):
 
@@ -1,6 +1,7 @@
 # global
 import copy
 import operator
+from numbers import Number
 
 # local
 import ivy
@@ -108,6 +109,8 @@ class Container(
         rebuild_child_containers=False,
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
+        queue_prefetch=0,
+        queue_device=None,
         **kwargs
     ):
         ContainerBase.__init__(
@@ -127,6 +130,8 @@ class Container(
             rebuild_child_containers,
             types_to_iteratively_nest,
             alphabetical_keys,
+            queue_prefetch,
+            queue_device,
             **kwargs
         )
 
@@ -137,7 +142,7 @@ class Container(
         return self
 
     def __neg__(self):
-        return self.cont_map(lambda x, kc: -x, map_sequences=True)
+        return self.cont_map(lambda x, kc: -x, map_sequences=True, elementwise=True)
 
     def __pow__(self, power):
         """
@@ -181,12 +186,23 @@ class Container(
         """
         if isinstance(power, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.pow(xs[0], xs[1]), [self, power], map_nests=True
+                lambda xs, _: operator.pow(xs[0], xs[1]),
+                [self, power],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x**power, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x**power,
+            map_sequences=True,
+            elementwise=isinstance(power, Number),
+        )
 
     def __rpow__(self, power):
-        return self.cont_map(lambda x, kc: power**x, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: power**x,
+            map_sequences=True,
+            elementwise=isinstance(power, Number),
+        )
 
     def __add__(self, other):
         """
@@ -250,7 +266,10 @@ class Container(
         }
         """
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
+            lambda xs, _: operator.add(xs[0], xs[1]),
+            [self, other],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __radd__(self, other):
@@ -284,7 +303,10 @@ class Container(
         }
         """
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.add(xs[0], xs[1]), [other, self], map_nests=True
+            lambda xs, _: operator.add(xs[0], xs[1]),
+            [other, self],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __sub__(self, other):
@@ -349,7 +371,10 @@ class Container(
         }
         """
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.sub(xs[0], xs[1]), [self, other], map_nests=True
+            lambda xs, _: operator.sub(xs[0], xs[1]),
+            [self, other],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __rsub__(self, other):
@@ -383,17 +408,26 @@ class Container(
         }
         """
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
+            lambda xs, _: operator.sub(xs[0], xs[1]),
+            [other, self],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __mul__(self, other):
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
+            lambda xs, _: operator.mul(xs[0], xs[1]),
+            [self, other],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __rmul__(self, other):
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
+            lambda xs, _: operator.mul(xs[0], xs[1]),
+            [other, self],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __truediv__(self, other):
@@ -444,12 +478,18 @@ class Container(
 
         """
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
+            lambda xs, _: operator.truediv(xs[0], xs[1]),
+            [self, other],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __rtruediv__(self, other):
         return ivy.Container.cont_multi_map(
-            lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
+            lambda xs, _: operator.truediv(xs[0], xs[1]),
+            [other, self],
+            map_nests=True,
+            elementwise=True,
         )
 
     def __floordiv__(self, other):
@@ -458,11 +498,20 @@ class Container(
                 lambda xs, _: operator.floordiv(xs[0], xs[1]),
                 [self, other],
                 map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x // other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x // other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __rfloordiv__(self, other):
-        return self.cont_map(lambda x, kc: other // x, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: other // x,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __abs__(self):
         """
@@ -494,7 +543,9 @@ class Container(
         }
 
         """
-        return self.cont_map(lambda x, kc: operator.abs(x), map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: operator.abs(x), map_sequences=True, elementwise=True
+        )
 
     def __lt__(self, other):
         """
@@ -530,9 +581,16 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.lt(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.lt(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x < other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x < other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __le__(self, other):
         """
@@ -568,9 +626,16 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.le(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.le(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x <= other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x <= other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __eq__(self, other):
         """
@@ -630,9 +695,16 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.eq(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.eq(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x == other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x == other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __ne__(self, other):
         """
@@ -692,9 +764,16 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.ne(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.ne(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x != other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x != other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __gt__(self, other):
         """
@@ -730,9 +809,16 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.gt(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.gt(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x > other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x > other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __ge__(self, other):
         """
@@ -768,14 +854,24 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.ge(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.ge(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: x >= other, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: x >= other,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __and__(self, other):
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.and_(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.and_(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
         return self.cont_map(lambda x, kc: x and other, map_sequences=True)
 
@@ -785,7 +881,10 @@ class Container(
     def __or__(self, other):
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.or_(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.or_(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
         return self.cont_map(lambda x, kc: x or other, map_sequences=True)
 
@@ -830,12 +929,23 @@ class Container(
         """
         if isinstance(other, ivy.Container):
             return ivy.Container.cont_multi_map(
-                lambda xs, _: operator.xor(xs[0], xs[1]), [self, other], map_nests=True
+                lambda xs, _: operator.xor(xs[0], xs[1]),
+                [self, other],
+                map_nests=True,
+                elementwise=True,
             )
-        return self.cont_map(lambda x, kc: operator.xor(x, other), map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: operator.xor(x, other),
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __rxor__(self, other):
-        return self.cont_map(lambda x, kc: other != x, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: other != x,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __rshift__(self, other):
         """
@@ -901,6 +1011,7 @@ class Container(
                 lambda xs, _: operator.rshift(xs[0], xs[1]),
                 [self, other],
                 map_nests=True,
+                elementwise=True,
             )
         return self.cont_map(
             lambda x, kc: operator.rshift(x, other), map_sequences=True
@@ -939,10 +1050,19 @@ class Container(
             b: ivy.array([8, 4, 2])
         }
         """
-        return self.cont_map(lambda x, kc: other >> x, map_sequences=True)
+        return self.cont_map(
+            lambda x, kc: other >> x,
+            map_sequences=True,
+            elementwise=isinstance(other, Number),
+        )
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the leaves are no longer views into the buffers once unpickled
+        state_dict["_cont_packed"] = None
+        state_dict["_cont_key_chain_index"] = None
+        state_dict["_cont_index_tokens"] = list()
+        state_dict["_cont_hashes"] = None
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -2,7 +2,7 @@ import ivy
 import functools
 import logging
 from types import FunctionType
-from typing import Callable
+from typing import Callable, Tuple
 import inspect
 
 # import typing
@@ -30,58 +30,72 @@ FN_DECORATORS = [
 
 
 def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
-        else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
-    return arr
+    # walk the nests lazily, stopping at the first array found
+    for nest in (args, kwargs):
+        for _, item in ivy.nest._walk_nest(nest):
+            if ivy.is_array(item):
+                return item
+    return None
+
+
+def _flat_args_to_native(args, kwargs):
+    # converts the top-level arguments only, for arguments known to contain no nests
+    args = [a.data if isinstance(a, ivy.Array) else a for a in args]
+    kwargs = {k: v.data if isinstance(v, ivy.Array) else v for k, v in kwargs.items()}
+    return args, kwargs
+
+
+def _flat_to_ivy(ret):
+    if isinstance(ret, ivy.NativeArray):
+        return ivy.Array(ret)
+    ret_type = type(ret)
+    if ret_type is tuple or ret_type is list:
+        return ret_type(
+            ivy.Array(r) if isinstance(r, ivy.NativeArray) else r for r in ret
+        )
+    return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
 
 
 # Array Handling #
 # ---------------#
 
 
+def _get_array_like_positions(fn: Callable) -> Tuple[int, ...]:
+    """Returns the positions of the arguments of `fn` which are annotated as arrays,
+    and which may therefore be passed as lists or tuples."""
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    positions = []
+    for i, param in enumerate(parameters):
+        annotation_str = str(param.annotation)
+        if "Array" in annotation_str and all(
+            sq not in annotation_str for sq in ["Sequence", "List", "Tuple"]
+        ):
+            positions.append(i)
+    return tuple(positions)
+
+
 def handle_array_like(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
-        args = list(args)
+        # the positions are worked out on the first call, once the annotations of
+        # the wrapped function have been finalized
+        positions = new_fn._array_like_positions
+        if positions is None:
+            positions = new_fn._array_like_positions = _get_array_like_positions(fn)
         num_args = len(args)
-        try:
-            type_hints = dict(inspect.signature(fn).parameters)
-        except TypeError:
-            return fn(*args, **kwargs)
-        parameters = [param.name for param in type_hints.values()]
-        annotations = [param.annotation for param in type_hints.values()]
-
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if "Array" in annotation_str and all(
-                sq not in annotation_str for sq in ["Sequence", "List", "Tuple"]
-            ):
-
-                if i < num_args:
-                    if isinstance(arg, (list, tuple)):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if isinstance(kwarg, (list, tuple)):
-                        kwargs[parameter] = ivy.array(kwarg)
-
+        args = list(args)
+        for i in positions:
+            if i >= num_args:
+                break
+            if isinstance(args[i], (list, tuple)):
+                args[i] = ivy.array(args[i])
         return fn(*args, **kwargs)
 
     new_fn.handle_array_like = True
+    new_fn._array_like_positions = None
     return new_fn
 
 
@@ -115,9 +129,12 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
             del kwargs["out"]
             has_out = True
         # convert all arrays in the inputs to ivy.NativeArray instances
-        new_args, new_kwargs = ivy.args_to_native(
-            *args, **kwargs, include_derived={tuple: True}
-        )
+        if ivy.get_trusted_inputs_mode():
+            new_args, new_kwargs = _flat_args_to_native(args, kwargs)
+        else:
+            new_args, new_kwargs = ivy.args_to_native(
+                *args, **kwargs, include_derived={tuple: True}
+            )
         # add the original out argument back to the keyword arguments
         if has_out:
             new_kwargs["out"] = out
@@ -184,12 +201,12 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         """
         # call unmodified function
         ret = fn(*args, **kwargs)
+        if not ivy.get_array_mode():
+            return ret
         # convert all arrays in the return to `ivy.Array` instances
-        return (
-            ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
-            if ivy.get_array_mode()
-            else ret
-        )
+        if ivy.get_trusted_inputs_mode():
+            return _flat_to_ivy(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
 
     new_fn.outputs_to_ivy_arrays = True
     return new_fn
@@ -451,9 +468,13 @@ def handle_nestable(fn: Callable) -> Callable:
         # a container, get the container's version of the function and call it using
         # the passed arguments.
         cont_fn = getattr(ivy.Container, "static_" + fn_name)
-        if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+        if (
+            ivy.get_nestable_mode()
+            and not ivy.get_trusted_inputs_mode()
+            and (
+                ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
+                or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            )
         ):
             return cont_fn(*args, **kwargs)
 
@@ -465,6 +486,104 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Dispatch Plans #
+# ---------------#
+
+# decorators which are applied innermost and are kept as-is beneath a dispatch plan
+_INNER_DECORATORS = ("infer_device", "infer_dtype", "integer_arrays_to_float")
+
+# decorators whose behaviour can be merged into a single dispatch plan
+_FUSABLE_DECORATORS = (
+    "outputs_to_ivy_arrays",
+    "inputs_to_native_arrays",
+    "handle_out_argument",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+    "handle_array_like",
+)
+
+# whether _wrap_function should merge the decorator stack into a dispatch plan
+use_dispatch_plans = True
+
+
+def _dispatch_plan(inner_fn: Callable, stacked_fn: Callable, stages) -> Callable:
+    """
+    Merges the decorator `stages` applied on top of `inner_fn` into a single callable.
+    The returned function performs one pass over the top-level args and kwargs, and
+    when none of them are nests or containers it only runs the stages which can
+    apply. Otherwise, the fully decorated `stacked_fn` is called.
+
+    Parameters
+    ----------
+    inner_fn
+        the function with only the inner decorators applied.
+    stacked_fn
+        the function with all decorators in `stages` applied on top of `inner_fn`.
+    stages
+        the names of the decorators which have been applied to produce `stacked_fn`.
+
+    Returns
+    -------
+    ret
+        the dispatch plan for the function, or `stacked_fn` if the decorators can't
+        all be merged.
+    """
+    outer_stages = [s for s in stages if s not in _INNER_DECORATORS]
+    if not outer_stages or any(s not in _FUSABLE_DECORATORS for s in outer_stages):
+        return stacked_fn
+    nest_types = (list, tuple, dict, ivy.Container)
+    handle_out = "handle_out_argument" in outer_stages
+    handle_nans = "handle_nans" in outer_stages
+    handle_exceptions = "handle_exceptions" in outer_stages
+    to_native = "inputs_to_native_arrays" in outer_stages
+    to_ivy = "outputs_to_ivy_arrays" in outer_stages
+    fn_name = inner_fn.__name__
+
+    def _call(args, kwargs):
+        array_mode = (to_native or to_ivy) and ivy.get_array_mode()
+        if to_native and array_mode:
+            args, kwargs = _flat_args_to_native(args, kwargs)
+        ret = inner_fn(*args, **kwargs)
+        if to_ivy and array_mode:
+            if isinstance(ret, ivy.NativeArray):
+                return ivy.Array(ret)
+            if ivy.get_trusted_inputs_mode():
+                return _flat_to_ivy(ret)
+            return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+        return ret
+
+    @functools.wraps(stacked_fn)
+    def new_fn(*args, **kwargs):
+        # the arguments are only checked for nests if they aren't trusted to be flat
+        if not ivy.get_trusted_inputs_mode():
+            for arg in args:
+                if isinstance(arg, nest_types):
+                    return stacked_fn(*args, **kwargs)
+            for kwarg in kwargs.values():
+                if isinstance(kwarg, nest_types):
+                    return stacked_fn(*args, **kwargs)
+        if "out" in kwargs:
+            if not handle_out or kwargs["out"] is not None:
+                return stacked_fn(*args, **kwargs)
+            del kwargs["out"]
+        if handle_nans and ivy.get_nan_policy() != "nothing":
+            return stacked_fn(*args, **kwargs)
+        if not handle_exceptions:
+            return _call(args, kwargs)
+        try:
+            return _call(args, kwargs)
+        except (IndexError, ValueError, AttributeError) as e:
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyError(fn_name, str(e))
+        except Exception as e:
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+
+    new_fn.dispatch_plan = tuple(outer_stages)
+    return new_fn
+
+
 # Functions #
 
 
@@ -532,9 +651,18 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        stages = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        inner_fn = to_wrap
+        for attr in stages:
+            to_wrap = getattr(ivy, attr)(to_wrap)
+            if attr in _INNER_DECORATORS:
+                inner_fn = to_wrap
+        if use_dispatch_plans and stages:
+            to_wrap = _dispatch_plan(inner_fn, to_wrap, stages)
     return to_wrap
 
 
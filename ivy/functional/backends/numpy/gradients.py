@@ -2,6 +2,9 @@
 
 # global
 import logging
+import numpy as np
+
+# local
 import ivy
 
 
@@ -92,3 +95,130 @@ def stop_gradient(x, /, *, preserve_type=True, out=None):
         "has no effect on the array, as gradients are not supported in the first place."
     )
     return x
+
+
+def _scratch_buffers(arrays):
+    # one flat buffer per dtype, large enough for the largest of the arrays, so that
+    # the temporaries of every update are views rather than new allocations
+    sizes = dict()
+    for x in arrays:
+        sizes[x.dtype] = max(sizes.get(x.dtype, 0), x.size)
+    return {dtype: np.empty(size, dtype) for dtype, size in sizes.items()}
+
+
+def _scratch(buffers, x):
+    return buffers[x.dtype][: x.size].reshape(x.shape)
+
+
+def _norm(x):
+    return np.linalg.norm(x.reshape(-1))
+
+
+def _as_scalar(x):
+    return np.asarray(x).item() if np.size(x) == 1 else x
+
+
+def _adam_moments_and_step(dcdw, mw, vw, alpha, beta1, beta2, epsilon, t):
+    # mw and vw are updated inplace, and the adam step delta is written into t
+    np.multiply(mw, beta1, out=mw)
+    np.multiply(dcdw, 1 - beta1, out=t)
+    np.add(mw, t, out=mw)
+    np.multiply(vw, beta2, out=vw)
+    np.multiply(dcdw, dcdw, out=t)
+    np.multiply(t, 1 - beta2, out=t)
+    np.add(vw, t, out=vw)
+    np.maximum(vw, 0.0, out=t)
+    np.sqrt(t, out=t)
+    np.add(t, epsilon, out=t)
+    np.divide(mw, t, out=t)
+    np.multiply(t, alpha, out=t)
+    return t
+
+
+def fused_gradient_descent_update(ws, dcdws, lr, /, *, stop_gradients=True):
+    lr = _as_scalar(lr)
+    buffers = _scratch_buffers(ws)
+    for w, dcdw in zip(ws, dcdws):
+        t = _scratch(buffers, w)
+        np.multiply(dcdw, lr, out=t)
+        np.subtract(w, t, out=w)
+    return list(ws)
+
+
+def fused_lars_update(ws, dcdws, lr, /, *, decay_lambda=0, stop_gradients=True):
+    lr = _as_scalar(lr)
+    buffers = _scratch_buffers(ws)
+    for w, dcdw in zip(ws, dcdws):
+        w_norm = _norm(w)
+        w_lr = w_norm * lr / (_norm(dcdw) + ivy._MIN_DENOMINATOR)
+        if decay_lambda > 0:
+            w_lr /= w_norm * decay_lambda
+        t = _scratch(buffers, w)
+        np.multiply(dcdw, w_lr, out=t)
+        np.subtract(w, t, out=w)
+    return list(ws)
+
+
+def fused_adam_update(
+    ws,
+    dcdws,
+    lr,
+    mws_tm1,
+    vws_tm1,
+    step,
+    /,
+    *,
+    beta1=0.9,
+    beta2=0.999,
+    epsilon=1e-7,
+    stop_gradients=True,
+):
+    lr = _as_scalar(lr)
+    step = float(_as_scalar(step))
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    buffers = _scratch_buffers(ws)
+    for w, dcdw, mw, vw in zip(ws, dcdws, mws_tm1, vws_tm1):
+        t = _adam_moments_and_step(
+            dcdw, mw, vw, alpha, beta1, beta2, epsilon, _scratch(buffers, w)
+        )
+        np.multiply(t, lr, out=t)
+        np.subtract(w, t, out=w)
+    return list(ws), list(mws_tm1), list(vws_tm1)
+
+
+def fused_lamb_update(
+    ws,
+    dcdws,
+    lr,
+    mws_tm1,
+    vws_tm1,
+    step,
+    /,
+    *,
+    beta1=0.9,
+    beta2=0.999,
+    epsilon=1e-7,
+    max_trust_ratio=10,
+    decay_lambda=0,
+    stop_gradients=True,
+):
+    lr = _as_scalar(lr)
+    step = float(_as_scalar(step))
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    buffers = _scratch_buffers(ws)
+    decay_buffers = _scratch_buffers(ws) if decay_lambda > 0 else None
+    for w, dcdw, mw, vw in zip(ws, dcdws, mws_tm1, vws_tm1):
+        t = _adam_moments_and_step(
+            dcdw, mw, vw, alpha, beta1, beta2, epsilon, _scratch(buffers, w)
+        )
+        if decay_lambda > 0:
+            d = _scratch(decay_buffers, w)
+            np.multiply(w, decay_lambda, out=d)
+            np.add(d, t, out=d)
+            eff_norm = _norm(d)
+        else:
+            eff_norm = _norm(t)
+        r = min(_norm(w) / (eff_norm + ivy._MIN_DENOMINATOR), max_trust_ratio)
+        np.multiply(t, r * lr, out=t)
+        np.subtract(w, t, out=w)
+    return list(ws), list(mws_tm1), list(vws_tm1)
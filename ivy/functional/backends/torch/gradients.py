@@ -189,3 +189,121 @@ def grad(func: Callable):
         return ivy.to_ivy(x.grad)
 
     return callback_fn
+
+
+def _as_scalar(x):
+    return x.item() if isinstance(x, torch.Tensor) and x.numel() == 1 else x
+
+
+def _sub_scaled_(ws, xs, scale):
+    # ws -= scale * xs, with a single multi-tensor kernel for scalar scales
+    if isinstance(scale, torch.Tensor):
+        for w, x in zip(ws, xs):
+            w.sub_(x * scale)
+    else:
+        torch._foreach_add_(ws, xs, alpha=-scale)
+
+
+def _check_stop_gradients(stop_gradients):
+    # the kernels write the weights inplace, which autograd cannot differentiate
+    if not stop_gradients:
+        raise ivy.exceptions.IvyException(
+            "fused updates write the weights inplace, and so require "
+            "stop_gradients=True with the torch backend"
+        )
+
+
+def _adam_moments_and_denoms(dcdws, mws, vws, beta1, beta2, epsilon):
+    torch._foreach_mul_(mws, beta1)
+    torch._foreach_add_(mws, dcdws, alpha=1 - beta1)
+    torch._foreach_mul_(vws, beta2)
+    torch._foreach_addcmul_(vws, dcdws, dcdws, value=1 - beta2)
+    denoms = torch._foreach_sqrt([torch.clamp_min(vw, 0.0) for vw in vws])
+    torch._foreach_add_(denoms, epsilon)
+    return denoms
+
+
+def fused_gradient_descent_update(ws, dcdws, lr, /, *, stop_gradients=True):
+    _check_stop_gradients(stop_gradients)
+    with torch.no_grad():
+        _sub_scaled_(list(ws), list(dcdws), _as_scalar(lr))
+    return list(ws)
+
+
+def fused_lars_update(ws, dcdws, lr, /, *, decay_lambda=0, stop_gradients=True):
+    _check_stop_gradients(stop_gradients)
+    lr = _as_scalar(lr)
+    with torch.no_grad():
+        for w, dcdw in zip(ws, dcdws):
+            w_norm = torch.linalg.vector_norm(w)
+            w_lr = w_norm * lr / (torch.linalg.vector_norm(dcdw) + ivy._MIN_DENOMINATOR)
+            if decay_lambda > 0:
+                w_lr /= w_norm * decay_lambda
+            w.sub_(dcdw * w_lr)
+    return list(ws)
+
+
+def fused_adam_update(
+    ws,
+    dcdws,
+    lr,
+    mws_tm1,
+    vws_tm1,
+    step,
+    /,
+    *,
+    beta1=0.9,
+    beta2=0.999,
+    epsilon=1e-7,
+    stop_gradients=True,
+):
+    _check_stop_gradients(stop_gradients)
+    ws, dcdws, mws, vws = list(ws), list(dcdws), list(mws_tm1), list(vws_tm1)
+    lr = _as_scalar(lr)
+    step = float(_as_scalar(step))
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    with torch.no_grad():
+        denoms = _adam_moments_and_denoms(dcdws, mws, vws, beta1, beta2, epsilon)
+        if isinstance(lr, torch.Tensor):
+            _sub_scaled_(ws, torch._foreach_div(mws, denoms), alpha * lr)
+        else:
+            torch._foreach_addcdiv_(ws, mws, denoms, value=-alpha * lr)
+    return ws, mws, vws
+
+
+def fused_lamb_update(
+    ws,
+    dcdws,
+    lr,
+    mws_tm1,
+    vws_tm1,
+    step,
+    /,
+    *,
+    beta1=0.9,
+    beta2=0.999,
+    epsilon=1e-7,
+    max_trust_ratio=10,
+    decay_lambda=0,
+    stop_gradients=True,
+):
+    _check_stop_gradients(stop_gradients)
+    ws, dcdws, mws, vws = list(ws), list(dcdws), list(mws_tm1), list(vws_tm1)
+    lr = _as_scalar(lr)
+    step = float(_as_scalar(step))
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    with torch.no_grad():
+        denoms = _adam_moments_and_denoms(dcdws, mws, vws, beta1, beta2, epsilon)
+        eff_grads = torch._foreach_div(mws, denoms)
+        torch._foreach_mul_(eff_grads, alpha)
+        for w, eff_grad in zip(ws, eff_grads):
+            if decay_lambda > 0:
+                eff_norm = torch.linalg.vector_norm(eff_grad + decay_lambda * w)
+            else:
+                eff_norm = torch.linalg.vector_norm(eff_grad)
+            r = torch.clamp(
+                torch.linalg.vector_norm(w) / (eff_norm + ivy._MIN_DENOMINATOR),
+                max=max_trust_ratio,
+            )
+            w.sub_(eff_grad * (r * lr))
+    return ws, mws, vws
@@ -909,6 +909,52 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _get_split_chunk_sizes(inputs, input_axes, max_chunk_size, chunk_size, device):
+    # the sizes of the chunks to split the inputs into along their input axes, which
+    # is a single chunk if the inputs do not need to be split
+    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+        shape_key = "_".join([str(inp.shape) for inp in inputs])
+        if shape_key in max_chunk_sizes:
+            max_chunk_size = max_chunk_sizes[shape_key]
+        else:
+            max_chunk_size = 0
+        max_dim = max([inp.shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)])
+        if max_dim > max_chunk_size:
+            max_chunk_sizes[shape_key] = max_dim
+            max_chunk_size = max_dim
+    chunk_size = ivy.default(
+        chunk_size,
+        default_val=lambda: 1
+        + int(
+            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
+        ),
+        with_callable=True,
+    )
+    dim_size = inputs[0].shape[input_axes[0]]
+    if chunk_size >= dim_size:
+        return [dim_size]
+    num_chunks = dim_size / chunk_size
+    num_chunks_floored = math.floor(num_chunks)
+    chunk_sizes = [chunk_size] * num_chunks_floored
+    if num_chunks != num_chunks_floored:
+        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    return chunk_sizes
+
+
+def _split_inputs(inputs, chunk_sizes, input_axes):
+    # the chunks of each of the inputs, as a list per input
+    return [
+        ivy.split(
+            inp, num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+        )
+        if ivy.is_array(inp)
+        else inp.split(
+            num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+        )
+        for i, inp in enumerate(inputs)
+    ]
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -960,43 +1006,13 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
-    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
-        if shape_key in max_chunk_sizes:
-            max_chunk_size = max_chunk_sizes[shape_key]
-        else:
-            max_chunk_size = 0
-        max_dim = max([inp.shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)])
-        if max_dim > max_chunk_size:
-            max_chunk_sizes[shape_key] = max_dim
-            max_chunk_size = max_dim
-    chunk_size = ivy.default(
-        chunk_size,
-        default_val=lambda: 1
-        + int(
-            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
-        ),
-        with_callable=True,
+    chunk_sizes = _get_split_chunk_sizes(
+        inputs, input_axes, max_chunk_size, chunk_size, device
     )
-    dim_size = inputs[0].shape[input_axes[0]]
-    if chunk_size >= dim_size:
+    if len(chunk_sizes) == 1:
         return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        ivy.split(
-            inp, num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        if ivy.is_array(inp)
-        else inp.split(
-            num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        for i, inp in enumerate(inputs)
-    ]
+    num_chunks_ceiled = len(chunk_sizes)
+    inputs_split = _split_inputs(inputs, chunk_sizes, input_axes)
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
@@ -4,6 +4,7 @@
 import gc
 import inspect
 import math
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import Callable, Any, Union, List, Tuple, Dict, Iterable, Optional, Sequence
@@ -34,6 +35,8 @@ queue_timeout_stack = list()
 array_mode_stack = list()
 shape_array_mode_stack = list()
 nestable_mode_stack = list()
+trusted_inputs_mode_stack = list()
+container_fusion_mode_stack = list()
 exception_trace_mode_stack = list()
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
@@ -357,6 +360,180 @@ def get_nestable_mode() -> bool:
     return nestable_mode_stack[-1]
 
 
+@handle_exceptions
+def set_trusted_inputs_mode(mode: bool) -> None:
+    """Set the mode of whether function inputs are trusted to be flat. In this mode
+    only the top-level arguments and returns are converted between ivy.Array and
+    ivy.NativeArray, and the inputs are not checked for ivy.Container instances.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to trust that function inputs contain no nests or containers
+
+    Examples
+    --------
+    >>> ivy.set_trusted_inputs_mode(True)
+    >>> ivy.get_trusted_inputs_mode()
+    True
+
+    >>> ivy.set_trusted_inputs_mode(False)
+    >>> ivy.get_trusted_inputs_mode()
+    False
+    """
+    global trusted_inputs_mode_stack
+    ivy.assertions.check_isinstance(mode, bool)
+    trusted_inputs_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_trusted_inputs_mode() -> None:
+    """Reset the mode of whether function inputs are trusted to be flat to the
+    previous state
+
+    Examples
+    --------
+    >>> ivy.set_trusted_inputs_mode(True)
+    >>> ivy.get_trusted_inputs_mode()
+    True
+
+    >>> ivy.unset_trusted_inputs_mode()
+    >>> ivy.get_trusted_inputs_mode()
+    False
+    """
+    global trusted_inputs_mode_stack
+    if trusted_inputs_mode_stack:
+        trusted_inputs_mode_stack.pop(-1)
+
+
+@handle_exceptions
+def get_trusted_inputs_mode() -> bool:
+    """Get the current mode of whether function inputs are trusted to be flat.
+    Default is ``False``.
+
+    Examples
+    --------
+    >>> ivy.get_trusted_inputs_mode()
+    False
+
+    >>> ivy.set_trusted_inputs_mode(True)
+    >>> ivy.get_trusted_inputs_mode()
+    True
+    """
+    global trusted_inputs_mode_stack
+    if not trusted_inputs_mode_stack:
+        return False
+    return trusted_inputs_mode_stack[-1]
+
+
+class TrustedInputs:
+    """Context manager for the trusted inputs mode.
+
+    Examples
+    --------
+    >>> with ivy.TrustedInputs(True):
+    ...     y = ivy.add(ivy.array([1.0]), ivy.array([2.0]))
+    """
+
+    def __init__(self, mode=True):
+        self._mode = mode
+
+    def __enter__(self):
+        set_trusted_inputs_mode(self._mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_trusted_inputs_mode()
+
+
+@handle_exceptions
+def set_container_fusion_mode(mode: bool) -> None:
+    """Set the mode of whether elementwise operations on containers are fused. In
+    this mode the leaves sharing the same shape, dtype and device are stacked into
+    one array, the operation is applied once to each stack, and the results are
+    unstacked as views.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to fuse elementwise operations across container leaves
+
+    Examples
+    --------
+    >>> ivy.set_container_fusion_mode(True)
+    >>> ivy.get_container_fusion_mode()
+    True
+
+    >>> ivy.set_container_fusion_mode(False)
+    >>> ivy.get_container_fusion_mode()
+    False
+    """
+    global container_fusion_mode_stack
+    ivy.assertions.check_isinstance(mode, bool)
+    container_fusion_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_container_fusion_mode() -> None:
+    """Reset the mode of whether elementwise operations on containers are fused to
+    the previous state
+
+    Examples
+    --------
+    >>> ivy.set_container_fusion_mode(True)
+    >>> ivy.get_container_fusion_mode()
+    True
+
+    >>> ivy.unset_container_fusion_mode()
+    >>> ivy.get_container_fusion_mode()
+    False
+    """
+    global container_fusion_mode_stack
+    if container_fusion_mode_stack:
+        container_fusion_mode_stack.pop(-1)
+
+
+@handle_exceptions
+def get_container_fusion_mode() -> bool:
+    """Get the current mode of whether elementwise operations on containers are
+    fused. Default is ``False``.
+
+    Examples
+    --------
+    >>> ivy.get_container_fusion_mode()
+    False
+
+    >>> ivy.set_container_fusion_mode(True)
+    >>> ivy.get_container_fusion_mode()
+    True
+    """
+    global container_fusion_mode_stack
+    if not container_fusion_mode_stack:
+        return False
+    return container_fusion_mode_stack[-1]
+
+
+class ContainerFusion:
+    """Context manager for the container fusion mode.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1.0]), b=ivy.array([2.0]))
+    >>> with ivy.ContainerFusion(True):
+    ...     y = x + x
+    """
+
+    def __init__(self, mode=True):
+        self._mode = mode
+
+    def __enter__(self):
+        set_container_fusion_mode(self._mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_container_fusion_mode()
+
+
 @handle_exceptions
 def set_exception_trace_mode(mode: str) -> None:
     """Set the mode of whether to show frontend-truncated exception stack traces,
@@ -1535,15 +1712,86 @@ def match_kwargs(
     return split_kwargs
 
 
+class _FnCache:
+    """The cached outputs of a function wrapped by ivy.cache_fn, in least recently
+    used order, along with the cache statistics."""
+
+    def __init__(self, max_size):
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class _ArrayCacheKey:
+    """Keys an array argument by its type, shape, dtype, identity and version, without
+    reading its contents. The key references the array, so that its id is not reused
+    while the output is cached."""
+
+    __slots__ = ("array", "key")
+
+    def __init__(self, x):
+        if isinstance(x, ivy.Array):
+            # the version of an ivy array changes with every write through ivy
+            self.array, version = x.data, x._version
+        else:
+            self.array, version = x, None
+        self.key = (
+            type(x),
+            tuple(self.array.shape),
+            str(self.array.dtype),
+            id(self.array),
+            version,
+        )
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, _ArrayCacheKey) and self.key == other.key
+
+
+def _cache_key(x):
+    # builds a hashable key for an argument, with arrays keyed by their identity
+    # rather than by their string representation, which copies them to the host
+    if isinstance(x, (tuple, list)):
+        return type(x), tuple(_cache_key(item) for item in x)
+    elif isinstance(x, dict):
+        return type(x), tuple((k, _cache_key(v)) for k, v in x.items())
+    elif ivy.is_ivy_array(x) or ivy.is_native_array(x):
+        return _ArrayCacheKey(x)
+    try:
+        hash(x)
+    except TypeError:
+        return type(x), str(x)
+    return type(x), x
+
+
+def _get_fn_cache(func):
+    if func not in FN_CACHE and hasattr(func, "__wrapped__"):
+        func = func.__wrapped__
+    ivy.assertions.check_true(
+        func in FN_CACHE, "{} is not cached by ivy.cache_fn".format(func)
+    )
+    return FN_CACHE[func]
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(func: Callable, /, *, max_size: Optional[int] = None) -> Callable:
     """Decorator to wrap a function, such that computed outputs are cached
-    to avoid recalculating them later.
+    to avoid recalculating them later. Array arguments are matched by identity rather
+    than by contents, so the output is recomputed for a new array with equal values,
+    or after an in-place update through ivy.
 
     Parameters
     ----------
     func
         The function to wrap, whose output should be cached for later.
+    max_size
+        The maximum number of outputs to cache for the function, after which the
+        least recently used output is evicted. Default is ``None``, in which case
+        the cache is unbounded.
 
     Returns
     -------
@@ -1592,25 +1840,95 @@ def cache_fn(func: Callable) -> Callable:
     """
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+        FN_CACHE[func] = _FnCache(max_size)
+    else:
+        FN_CACHE[func].max_size = max_size
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
+        key = (
+            _cache_key(args),
+            tuple((k, _cache_key(v)) for k, v in sorted(kwargs.items())),
         )
         cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        if key in cache.entries:
+            cache.hits += 1
+            cache.entries.move_to_end(key)
+            return cache.entries[key]
+        cache.misses += 1
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.entries[key] = ret
+        if cache.max_size is not None and len(cache.entries) > cache.max_size:
+            cache.entries.popitem(last=False)
+            cache.evictions += 1
         return ret
 
     return cached_fn
 
 
+@handle_exceptions
+def cache_fn_stats(func: Callable, /) -> Dict[str, int]:
+    """Returns the cache statistics of a function wrapped by ivy.cache_fn.
+
+    Parameters
+    ----------
+    func
+        The cached function, or the original function which was wrapped.
+
+    Returns
+    -------
+    ret
+        The number of cache hits, misses and evictions, along with the current
+        and maximum number of cached outputs.
+
+    Examples
+    --------
+    >>> def my_sum(val1:float, val2:float)->float: return val1 + val2
+    >>> cached_sum = ivy.cache_fn(my_sum, max_size=1)
+    >>> cached_sum(3, 5), cached_sum(3, 5), cached_sum(5, 3)
+    (8, 8, 8)
+
+    >>> print(ivy.cache_fn_stats(cached_sum))
+    {'hits': 1, 'misses': 2, 'evictions': 1, 'size': 1, 'max_size': 1}
+    """
+    cache = _get_fn_cache(func)
+    return {
+        "hits": cache.hits,
+        "misses": cache.misses,
+        "evictions": cache.evictions,
+        "size": len(cache.entries),
+        "max_size": cache.max_size,
+    }
+
+
+@handle_exceptions
+def invalidate_cache_fn(func: Optional[Callable] = None, /) -> None:
+    """Removes the cached outputs of a function wrapped by ivy.cache_fn, so they are
+    recomputed on the next call, and resets its cache statistics.
+
+    Parameters
+    ----------
+    func
+        The cached function, or the original function which was wrapped. The
+        outputs of all cached functions are removed if None. Default is ``None``.
+
+    Examples
+    --------
+    >>> def my_sum(val1:float, val2:float)->float: return val1 + val2
+    >>> cached_sum = ivy.cache_fn(my_sum)
+    >>> cached_sum(3, 5)
+    8
+
+    >>> ivy.invalidate_cache_fn(cached_sum)
+    >>> print(ivy.cache_fn_stats(cached_sum)["size"])
+    0
+    """
+    caches = FN_CACHE.values() if func is None else [_get_fn_cache(func)]
+    for cache in caches:
+        cache.entries.clear()
+        cache.hits = cache.misses = cache.evictions = 0
+
+
 @handle_exceptions
 def current_backend_str() -> Union[str, None]:
     """Return framework string
@@ -1622,7 +1940,7 @@ def current_backend_str() -> Union[str, None]:
 
     """
     fw = current_backend()
-    if not backend_stack:
+    if not backend_stack and not ivy.backend_handler._local_backend_stack.get():
         return ""
     return fw.current_backend_str()
 
@@ -1,7 +1,7 @@
 """Collection of gradient Ivy functions."""
 
 # global
-from typing import Union, Optional, Tuple
+from typing import Union, Optional, Tuple, List, Sequence, Callable
 import numpy as np
 import itertools
 
@@ -17,6 +17,7 @@ from ivy.func_wrapper import (
     handle_array_like,
 )
 from ivy.exceptions import handle_exceptions
+from ivy.functional.ivy.device import _get_split_chunk_sizes, _split_inputs
 
 
 # Helpers #
@@ -63,33 +64,23 @@ def _get_required_native_variables(xs, xs_grad_idxs):
     """Used to extract all required native variables from a
     nested structure.
     """
-    # To make sure that only the required arrays are converted to native arrays
-    xs = ivy.nested_map(xs, ivy.to_ivy, include_derived=True)
-    if xs_grad_idxs is not None:
-        ivy.map_nest_at_indices(xs, xs_grad_idxs, ivy.to_native)
+    leaves, treedef = ivy.tree_flatten(xs)
+    if xs_grad_idxs is None:
+        required = [True] * len(leaves)
     else:
-        xs = ivy.nested_map(xs, ivy.to_native, include_derived=True)
-
-    def map_fn(x):
-        if ivy.is_native_array(x):
-            return x
-        return None
-
-    # Extract all those required native arrays and None for all others
-    xs = ivy.nested_map(xs, map_fn, include_derived=True, to_mutable=True)
-
-    # Prune all None values
-    none_idxs = ivy.nested_argwhere(xs, lambda x: x is None)
-    not _check_if_empty(none_idxs) and ivy.prune_nest_at_indices(
-        xs, list(reversed(none_idxs))
-    )
-    xs = (
-        xs
-        if ivy.is_array(xs)
-        else xs.cont_prune_empty()
-        if isinstance(xs, ivy.Container)
-        else ivy.prune_empty(xs)
-    )
+        # a leaf is required if it's at or below any of the required indices
+        xs_grad_idxs = set(tuple(idx) for idx in xs_grad_idxs)
+        required = [
+            any(path[:i] in xs_grad_idxs for i in range(len(path) + 1))
+            for path in treedef.leaf_paths
+        ]
+
+    # Keep only the required arrays as native arrays, and prune all others
+    leaves = [
+        ivy.to_native(x) if req and ivy.is_array(x) else None
+        for x, req in zip(leaves, required)
+    ]
+    xs = treedef.unflatten(leaves, to_mutable=True, prune_none=True)
 
     # return a single array instead of a list if possible, otherwise return the nest
     if isinstance(xs, list) and len(xs) == 1:
@@ -547,6 +538,130 @@ def execute_with_gradients(
 execute_with_gradients.computes_gradients = True
 
 
+def _accumulate_leaf(acc, x, weight, overwrite):
+    if acc is None:
+        return ivy.multiply(x, weight)
+    if overwrite:
+        return ivy.multiply(x, weight, out=acc)
+    return ivy.add(acc, x, alpha=weight, out=acc)
+
+
+def _accumulate(acc, x, weight, overwrite=False):
+    # acc + x * weight, written into the arrays of acc if given
+    if x is None:
+        return acc
+    if isinstance(x, ivy.Container):
+        if acc is None:
+            return x.cont_map(lambda x_, kc: _accumulate_leaf(None, x_, weight, False))
+        return ivy.Container.cont_multi_map(
+            lambda xs_, kc: _accumulate_leaf(xs_[0], xs_[1], weight, overwrite),
+            [acc, x],
+        )
+    if isinstance(x, (tuple, list)):
+        accs = [None] * len(x) if acc is None else acc
+        return type(x)(_accumulate(a, x_, weight, overwrite) for a, x_ in zip(accs, x))
+    return _accumulate_leaf(acc, x, weight, overwrite)
+
+
+@handle_exceptions
+def execute_with_accumulated_gradients(
+    func: Callable,
+    xs: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+    inputs: Sequence[Union[ivy.Array, ivy.NativeArray, ivy.Container]],
+    /,
+    *,
+    max_chunk_size: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    input_axes: Union[int, Sequence[int]] = 0,
+    retain_grads: bool = False,
+    xs_grad_idxs: Optional[Sequence[int]] = None,
+    ret_grad_idxs: Optional[Sequence[int]] = None,
+    device: Union[ivy.Device, ivy.NativeDevice] = None,
+    out: Optional[Union[ivy.Array, ivy.Container]] = None,
+):
+    """Call function func with input of xs variables on micro-batches of the
+    inputs, splitting the inputs into chunks as in ``ivy.split_func_call``, and
+    return the function result and the gradients with respect to xs, each averaged
+    over the micro-batches and weighted by their size. If func returns the mean
+    over its micro-batch, the result is the same as that of
+    ``ivy.execute_with_gradients`` on the whole batch, while only one micro-batch
+    is held in memory at a time.
+
+    Parameters
+    ----------
+    func
+        Function for which we compute the gradients of the output with respect to xs
+        input, called as func(xs, *input_chunks).
+    xs
+        Variables for which to compute the function gradients with respective to. This
+        can be a single array or an arbitrary nest of arrays.
+    inputs
+        A list of inputs to split into micro-batches and pass into the function.
+    max_chunk_size
+        The maximum size of each of the micro-batches.
+    chunk_size
+        The size of each of the micro-batches. Specifying this arg overwrites the
+        global split factor. Default is ``None``.
+    input_axes
+        The axes along which to split each of the inputs. Default is ``0``.
+    retain_grads
+        Whether to retain the gradients of the returned values. (Default value = False)
+    xs_grad_idxs
+        Indices of the input arrays to compute gradients with respect to. If None,
+        gradients are returned with respect to all input arrays. (Default value = None)
+    ret_grad_idxs
+        Indices of the returned arrays for which to return computed gradients. If None,
+        gradients are returned for all returned arrays. (Default value = None)
+    device
+        The device to use the split factor of. Uses the default device by default.
+    out
+        optional gradients, with the structure of the gradients of xs, which the
+        gradients are accumulated into inplace, and which can be reused between
+        steps.
+
+    Returns
+    -------
+    ret
+        the averaged function result func_ret and the averaged gradients of each
+        output variable w.r.t each input variable, which can be passed to
+        ``Optimizer.step``.
+
+    Examples
+    --------
+    >>> def loss_fn(v, x, y):
+    ...     return ivy.mean((model(x, v=v) - y) ** 2)
+    >>> loss, grads = ivy.execute_with_accumulated_gradients(
+    ...     loss_fn, model.v, [x, y], chunk_size=32)
+    >>> model.v = optimizer.step(model.v, grads)
+    """
+    if isinstance(input_axes, int):
+        input_axes = [input_axes] * len(inputs)
+    chunk_sizes = _get_split_chunk_sizes(
+        inputs, input_axes, max_chunk_size, chunk_size, device
+    )
+    if len(chunk_sizes) == 1:
+        inputs_split = [inputs]
+    else:
+        inputs_split = zip(*_split_inputs(inputs, chunk_sizes, input_axes))
+    dim_size = sum(chunk_sizes)
+    func_ret, grads = None, out
+    for i, (chunk_size_i, inps) in enumerate(zip(chunk_sizes, inputs_split)):
+        weight = chunk_size_i / dim_size
+        ret, chunk_grads = ivy.execute_with_gradients(
+            lambda xs_: func(xs_, *inps),
+            xs,
+            retain_grads=retain_grads,
+            xs_grad_idxs=xs_grad_idxs,
+            ret_grad_idxs=ret_grad_idxs,
+        )
+        func_ret = _accumulate(func_ret, ret, weight)
+        grads = _accumulate(grads, chunk_grads, weight, overwrite=i == 0)
+    return func_ret, grads
+
+
+execute_with_accumulated_gradients.computes_gradients = True
+
+
 @to_native_arrays_and_back
 @handle_exceptions
 def value_and_grad(func):
@@ -789,7 +904,9 @@ def adam_step(
     })
 
     """
-    step = float(step)
+    # the optimizers count their steps in arrays of shape (1,), which float() only
+    # accepts for 0-dim arrays with some backends
+    step = float(ivy.to_scalar(step)) if ivy.is_array(step) else float(step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
     vw = ivy.add(beta2 * vw, (1 - beta2) * dcdw_sqrd)
@@ -1313,3 +1430,304 @@ def lamb_update(
 
 
 lamb_update.out_index = 0
+
+
+# Fused Optimizer Updates #
+
+
+@handle_exceptions
+def fused_gradient_descent_update(
+    ws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    dcdws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    lr: Union[float, ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    stop_gradients: bool = True,
+) -> List[ivy.Array]:
+    """Update a list of weights by gradient descent in one pass, writing the new
+    weights into the existing arrays wherever the backend supports inplace updates.
+    Backends with native multi-tensor kernels use those, and otherwise
+    ``ivy.gradient_descent_update`` is applied to each weight.
+
+    Parameters
+    ----------
+    ws
+        Weights of the function to be updated.
+    dcdws
+        Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    lr
+        Learning rate, the rate at which the weights should be updated relative to the
+        gradient.
+    stop_gradients
+        Whether to stop the gradients of the variables after each gradient step.
+        Must be ``True`` with the torch backend, whose kernels write the weights
+        inplace, which cannot be differentiated. Default is ``True``.
+
+    Returns
+    -------
+    ret
+        The new function weights ws_new, which are the updated arrays of ws if
+        updated inplace.
+
+    Examples
+    --------
+    >>> ws = [ivy.array([1., 2.]), ivy.array([3.])]
+    >>> dcdws = [ivy.array([1., 1.]), ivy.array([2.])]
+    >>> ws_new = ivy.fused_gradient_descent_update(ws, dcdws, 0.5)
+    >>> print(ws_new)
+    [ivy.array([0.5, 1.5]), ivy.array([2.])]
+    """
+    return [
+        ivy.inplace_update(
+            w, ivy.gradient_descent_update(w, dcdw, lr, stop_gradients=stop_gradients)
+        )
+        for w, dcdw in zip(ws, dcdws)
+    ]
+
+
+fused_gradient_descent_update.mixed_function = True
+
+
+@handle_exceptions
+def fused_lars_update(
+    ws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    dcdws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    lr: Union[float, ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    decay_lambda: float = 0,
+    stop_gradients: bool = True,
+) -> List[ivy.Array]:
+    """Update a list of weights by Layerwise Adaptive Rate Scaling (LARS) in one pass,
+    with the rate scaled separately for each weight, and the new weights written into
+    the existing arrays wherever the backend supports inplace updates. Backends with
+    native multi-tensor kernels use those, and otherwise ``ivy.lars_update`` is
+    applied to each weight.
+
+    Parameters
+    ----------
+    ws
+        Weights of the function to be updated.
+    dcdws
+        Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    lr
+        Learning rate, the rate at which the weights should be updated relative to the
+        gradient.
+    decay_lambda
+        The factor used for weight decay. Default is zero.
+    stop_gradients
+        Whether to stop the gradients of the variables after each gradient step.
+        Must be ``True`` with the torch backend, whose kernels write the weights
+        inplace, which cannot be differentiated. Default is ``True``.
+
+    Returns
+    -------
+    ret
+        The new function weights ws_new, which are the updated arrays of ws if
+        updated inplace.
+
+    Examples
+    --------
+    >>> ws = [ivy.array([3., 4.]), ivy.array([1.])]
+    >>> dcdws = [ivy.array([3., 4.]), ivy.array([2.])]
+    >>> ws_new = ivy.fused_lars_update(ws, dcdws, 0.5)
+    >>> print(ws_new)
+    [ivy.array([1.5, 2. ]), ivy.array([0.5])]
+    """
+    return [
+        ivy.inplace_update(
+            w,
+            ivy.lars_update(
+                w,
+                dcdw,
+                lr,
+                decay_lambda=decay_lambda,
+                stop_gradients=stop_gradients,
+            ),
+        )
+        for w, dcdw in zip(ws, dcdws)
+    ]
+
+
+fused_lars_update.mixed_function = True
+
+
+@handle_exceptions
+def fused_adam_update(
+    ws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    dcdws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    lr: Union[float, ivy.Array, ivy.NativeArray],
+    mws_tm1: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    vws_tm1: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    step: int,
+    /,
+    *,
+    beta1: float = 0.9,
+    beta2: float = 0.999,
+    epsilon: float = 1e-7,
+    stop_gradients: bool = True,
+) -> Tuple[List[ivy.Array], List[ivy.Array], List[ivy.Array]]:
+    """Update a list of weights and their moments by ADAM in one pass, writing the new
+    weights and moments into the existing arrays wherever the backend supports
+    inplace updates. Backends with native multi-tensor kernels use those, and
+    otherwise ``ivy.adam_update`` is applied to each weight.
+
+    Parameters
+    ----------
+    ws
+        Weights of the function to be updated.
+    dcdws
+        Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    lr
+        Learning rate, the rate at which the weights should be updated relative to the
+        gradient.
+    mws_tm1
+        running averages of the gradients, from the previous time-step.
+    vws_tm1
+        running averages of second moments of the gradients, from the previous
+        time-step.
+    step
+        training step.
+    beta1
+        gradient forgetting factor (Default value = 0.9).
+    beta2
+        second moment of gradient forgetting factor (Default value = 0.999).
+    epsilon
+        divisor during adam update, preventing division by zero (Default value = 1e-7).
+    stop_gradients
+        Whether to stop the gradients of the variables after each gradient step.
+        Must be ``True`` with the torch backend, whose kernels write the weights
+        inplace, which cannot be differentiated. Default is ``True``.
+
+    Returns
+    -------
+    ret
+        The new function weights ws_new, and also the new mws and vws, following the
+        adam updates, which are the updated arrays of the inputs if updated inplace.
+
+    Examples
+    --------
+    >>> ws = [ivy.array([1., 2.]), ivy.array([3.])]
+    >>> dcdws = [ivy.array([0.5, 1.]), ivy.array([2.])]
+    >>> mws = [ivy.array([0.5, 1.]), ivy.array([2.])]
+    >>> vws = [ivy.array([0.25, 1.]), ivy.array([4.])]
+    >>> ws_new, mws_new, vws_new = ivy.fused_adam_update(ws, dcdws, 0.1, mws, vws, 1)
+    >>> print(ws_new)
+    [ivy.array([0.96837729, 1.96837723]), ivy.array([2.96837735])]
+    """
+    ws_new, mws, vws = list(), list(), list()
+    for w, dcdw, mw_tm1, vw_tm1 in zip(ws, dcdws, mws_tm1, vws_tm1):
+        w_new, mw, vw = ivy.adam_update(
+            w,
+            dcdw,
+            lr,
+            mw_tm1,
+            vw_tm1,
+            step,
+            beta1=beta1,
+            beta2=beta2,
+            epsilon=epsilon,
+            stop_gradients=stop_gradients,
+        )
+        ws_new.append(ivy.inplace_update(w, w_new))
+        mws.append(ivy.inplace_update(mw_tm1, mw))
+        vws.append(ivy.inplace_update(vw_tm1, vw))
+    return ws_new, mws, vws
+
+
+fused_adam_update.mixed_function = True
+
+
+@handle_exceptions
+def fused_lamb_update(
+    ws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    dcdws: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    lr: Union[float, ivy.Array, ivy.NativeArray],
+    mws_tm1: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    vws_tm1: Sequence[Union[ivy.Array, ivy.NativeArray]],
+    step: int,
+    /,
+    *,
+    beta1: float = 0.9,
+    beta2: float = 0.999,
+    epsilon: float = 1e-7,
+    max_trust_ratio: Union[int, float] = 10,
+    decay_lambda: float = 0,
+    stop_gradients: bool = True,
+) -> Tuple[List[ivy.Array], List[ivy.Array], List[ivy.Array]]:
+    """Update a list of weights and their moments by LAMB in one pass, with the trust
+    ratio computed separately for each weight, and the new weights and moments
+    written into the existing arrays wherever the backend supports inplace updates.
+    Backends with native multi-tensor kernels use those, and otherwise
+    ``ivy.lamb_update`` is applied to each weight.
+
+    Parameters
+    ----------
+    ws
+        Weights of the function to be updated.
+    dcdws
+        Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+    lr
+        Learning rate, the rate at which the weights should be updated relative to the
+        gradient.
+    mws_tm1
+        running averages of the gradients, from the previous time-step.
+    vws_tm1
+        running averages of second moments of the gradients, from the previous
+        time-step.
+    step
+        training step.
+    beta1
+        gradient forgetting factor (Default value = 0.9).
+    beta2
+        second moment of gradient forgetting factor (Default value = 0.999).
+    epsilon
+        divisor during adam update, preventing division by zero (Default value = 1e-7).
+    max_trust_ratio
+        The maximum value for the trust ratio. (Default value = 10)
+    decay_lambda
+        The factor used for weight decay. (Default value = 0).
+    stop_gradients
+        Whether to stop the gradients of the variables after each gradient step.
+        Must be ``True`` with the torch backend, whose kernels write the weights
+        inplace, which cannot be differentiated. Default is ``True``.
+
+    Returns
+    -------
+    ret
+        The new function weights ws_new, and also the new mws and vws, following the
+        LAMB updates, which are the updated arrays of the inputs if updated inplace.
+
+    Examples
+    --------
+    >>> ws = [ivy.array([1., 2.]), ivy.array([3.])]
+    >>> dcdws = [ivy.array([0.5, 1.]), ivy.array([2.])]
+    >>> mws = [ivy.array([0.5, 1.]), ivy.array([2.])]
+    >>> vws = [ivy.array([0.25, 1.]), ivy.array([4.])]
+    >>> ws_new, mws_new, vws_new = ivy.fused_lamb_update(ws, dcdws, 0.1, mws, vws, 1)
+    >>> print(ws_new)
+    [ivy.array([0.8418861 , 1.84188604]), ivy.array([2.70000005])]
+    """
+    ws_new, mws, vws = list(), list(), list()
+    for w, dcdw, mw_tm1, vw_tm1 in zip(ws, dcdws, mws_tm1, vws_tm1):
+        w_new, mw, vw = ivy.lamb_update(
+            w,
+            dcdw,
+            lr,
+            mw_tm1,
+            vw_tm1,
+            step,
+            beta1=beta1,
+            beta2=beta2,
+            epsilon=epsilon,
+            max_trust_ratio=max_trust_ratio,
+            decay_lambda=decay_lambda,
+            stop_gradients=stop_gradients,
+        )
+        ws_new.append(ivy.inplace_update(w, w_new))
+        mws.append(ivy.inplace_update(mw_tm1, mw))
+        vws.append(ivy.inplace_update(vw_tm1, vw))
+    return ws_new, mws, vws
+
+
+fused_lamb_update.mixed_function = True
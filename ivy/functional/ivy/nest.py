@@ -10,6 +10,55 @@ import ivy
 from ivy.exceptions import handle_exceptions
 
 
+# Helpers #
+# --------#
+
+
+def _is_nest(x, to_ignore=(), extra_nest_types=()):
+    return (
+        isinstance(x, (tuple, list, dict)) or isinstance(x, extra_nest_types)
+    ) and not isinstance(x, to_ignore)
+
+
+def _walk_nest(nest, include_nests=False, to_ignore=(), extra_nest_types=()):
+    """Iterates depth first over the leaves of a nest, using an explicit stack
+    rather than recursion.
+
+    Yields ``(index, item)`` pairs for every leaf and, if include_nests is set, for
+    every nest below the root once all of its items have been yielded. The index
+    list is shared between iterations and updated in place, so it must be copied
+    to be kept. Arrays are always yielded as leaves, even when they are part of
+    extra_nest_types.
+    """
+    array_types = (ivy.Array, ivy.NativeArray)
+
+    def _items(x):
+        return iter(x.items()) if isinstance(x, dict) else enumerate(x)
+
+    index = list()
+    if not _is_nest(nest, to_ignore, extra_nest_types) or isinstance(nest, array_types):
+        yield index, nest
+        return
+    stack = [(nest, _items(nest))]
+    while stack:
+        node, items = stack[-1]
+        for key, item in items:
+            index.append(key)
+            if _is_nest(item, to_ignore, extra_nest_types) and not isinstance(
+                item, array_types
+            ):
+                stack.append((item, _items(item)))
+                break
+            yield index, item
+            index.pop()
+        else:
+            stack.pop()
+            if stack:
+                if include_nests:
+                    yield index, node
+                index.pop()
+
+
 # Extra #
 # ------#
 
@@ -676,99 +725,22 @@ def nested_argwhere(
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
     _index = list() if _index is None else _index
-    if (
-        isinstance(nest, (tuple, list)) or isinstance(nest, extra_nest_types)
-    ) and not isinstance(nest, to_ignore):
-        if isinstance(nest, (ivy.Array, ivy.NativeArray)):
-            cond_met = fn(nest)
-            ind = ivy.argwhere(cond_met)
-            _indices = list()
-            for i in range(len(ind)):
-                _indices.append(_index + ind.to_list()[i])
-            return _indices
-        n = 0
-        _indices = []
-        for i, item in enumerate(nest):
-            ind = (
-                nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    stop_after_n_found - n,
-                    extra_nest_types,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    item,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [i],
-                    False,
-                    None,
-                    extra_nest_types,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n < stop_after_n_found:
-                    n += len(ind)
-                    _indices += [ind]
-                else:
-                    break
-            else:
-                _indices += [ind]
-            if stop_after_n_found is not None and len(_indices) >= stop_after_n_found:
-                break
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    elif isinstance(nest, dict) and not isinstance(nest, to_ignore):
-        n = 0
-        _indices = []
-        for k, v in nest.items():
-            ind = (
-                nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    stop_after_n_found - n,
-                    extra_nest_types,
-                )
-                if stop_after_n_found is not None
-                else nested_argwhere(
-                    v,
-                    fn,
-                    check_nests,
-                    to_ignore,
-                    _index + [k],
-                    False,
-                    None,
-                    extra_nest_types,
-                )
-            )
-            if stop_after_n_found is not None and ind:
-                if n < stop_after_n_found:
-                    n += len(ind)
-                    _indices += [ind]
-                else:
-                    break
-            else:
-                _indices += [ind]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if check_nests and fn(nest):
-            _indices.append(_index)
-    else:
-        cond_met = fn(nest)
-        if cond_met:
-            return [_index]
-        return False
-    return [index for index in _indices if index]
+    if not _is_nest(nest, to_ignore, extra_nest_types):
+        return [_index] if fn(nest) else False
+    array_types = (ivy.Array, ivy.NativeArray)
+    _indices = list()
+    for index, item in _walk_nest(nest, check_nests, to_ignore, extra_nest_types):
+        if isinstance(item, array_types) and _is_nest(
+            item, to_ignore, extra_nest_types
+        ):
+            _indices += [
+                _index + index + idx for idx in ivy.argwhere(fn(item)).to_list()
+            ]
+        elif fn(item):
+            _indices.append(_index + index)
+        if stop_after_n_found is not None and len(_indices) >= stop_after_n_found:
+            return _indices[:stop_after_n_found]
+    return _indices
 
 
 @handle_exceptions
@@ -806,33 +778,19 @@ def all_nested_indices(
     """
     _index = list() if _index is None else _index
     extra_nest_types = ivy.default(extra_nest_types, ())
-    if isinstance(nest, (tuple, list)) or isinstance(nest, extra_nest_types):
-        if isinstance(nest, (ivy.Array, ivy.NativeArray)):
-            ind = ivy.argwhere(ivy.ones_like(nest))
-            indices = list()
-            for i in range(len(ind)):
-                indices.append(_index + ind.to_list()[i])
-            return indices
-        _indices = [
-            all_nested_indices(
-                item, include_nests, _index + [i], False, extra_nest_types
-            )
-            for i, item in enumerate(nest)
-        ]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if include_nests:
-            _indices.append(_index)
-    elif isinstance(nest, dict):
-        _indices = [
-            all_nested_indices(v, include_nests, _index + [k], False, extra_nest_types)
-            for k, v in nest.items()
-        ]
-        _indices = [idx for idxs in _indices if idxs for idx in idxs]
-        if include_nests:
-            _indices.append(_index)
-    else:
+    if not _is_nest(nest, extra_nest_types=extra_nest_types):
         return [_index]
-    return [index for index in _indices if index]
+    array_types = (ivy.Array, ivy.NativeArray)
+    _indices = list()
+    for index, item in _walk_nest(
+        nest, include_nests, extra_nest_types=extra_nest_types
+    ):
+        if isinstance(item, array_types) and isinstance(item, extra_nest_types):
+            ind = ivy.argwhere(ivy.ones_like(item)).to_list()
+            _indices += [_index + index + idx for idx in ind]
+        else:
+            _indices.append(_index + index)
+    return _indices
 
 
 # noinspection PyShadowingBuiltins
@@ -1008,7 +966,6 @@ def nested_map(
             include_derived[t] = False
     if ivy.exists(max_depth) and _depth > max_depth:
         return x
-    class_instance = type(x)
     tuple_check_fn = ivy.default(
         _tuple_check_fn,
         (lambda x_, t_: isinstance(x_, t_))
@@ -1027,77 +984,71 @@ def nested_map(
         if include_derived[dict]
         else (lambda x_, t_: type(x_) is t_),
     )
-    if tuple_check_fn(x, tuple):
-        ret_list = [
-            nested_map(
-                i,
-                fn,
-                include_derived,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for i in x
-        ]
-        if to_mutable:
-            return ret_list
-        elif hasattr(x, "_fields"):
-            # noinspection PyProtectedMember
-            return class_instance(**dict(zip(x._fields, ret_list)))
-        else:
+    array_types = (ivy.Array, ivy.NativeArray)
+
+    def _nest_type(x_):
+        if tuple_check_fn(x_, tuple):
+            return tuple
+        elif list_check_fn(x_, list) or isinstance(x_, extra_nest_types):
+            return None if isinstance(x_, array_types) else list
+        elif dict_check_fn(x_, dict):
+            return dict
+        return None
+
+    def _map_leaf(x_):
+        ret = fn(x_)
+        if (
+            shallow
+            and isinstance(x_, array_types)
+            and isinstance(x_, extra_nest_types)
+            and not tuple_check_fn(x_, tuple)
+        ):
+            return ivy.inplace_update(x_, ret)
+        return ret
+
+    def _rebuild(x_, nest_type, ret_list):
+        class_instance = type(x_)
+        if nest_type is tuple:
+            if to_mutable:
+                return ret_list
+            elif hasattr(x_, "_fields"):
+                # noinspection PyProtectedMember
+                return class_instance(**dict(zip(x_._fields, ret_list)))
             return class_instance(ret_list)
-    elif list_check_fn(x, list) or isinstance(x, extra_nest_types):
-        if isinstance(x, (ivy.Array, ivy.NativeArray)):
-            ret = fn(x)
+        elif nest_type is list:
             if shallow:
-                return ivy.inplace_update(x, ret)
-            return ret
-        ret_list = [
-            nested_map(
-                i,
-                fn,
-                include_derived,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for i in x
-        ]
-        if shallow:
-            x[:] = ret_list[:]
-        return class_instance(ret_list)
-    elif dict_check_fn(x, dict):
-        class_instance = type(x)
-        ret = {
-            k: nested_map(
-                v,
-                fn,
-                include_derived,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for k, v in x.items()
-        }
+                x_[:] = ret_list[:]
+            return class_instance(ret_list)
+        ret = dict(zip(x_.keys(), ret_list))
         if shallow:
-            x.update(**ret)
+            x_.update(**ret)
         return class_instance(**ret)
-    return fn(x)
+
+    nest_type = _nest_type(x)
+    if nest_type is None:
+        return _map_leaf(x)
+    # each stack entry holds a nest, its type, its depth, an iterator over its items
+    # and the mapped items so far, with the deepest nest being mapped at the end
+    stack = [(x, nest_type, _depth, iter(x.values() if nest_type is dict else x), [])]
+    while True:
+        x_, nest_type, depth, items, ret_list = stack[-1]
+        for item in items:
+            if ivy.exists(max_depth) and depth + 1 > max_depth:
+                ret_list.append(item)
+                continue
+            item_type = _nest_type(item)
+            if item_type is None:
+                ret_list.append(_map_leaf(item))
+                continue
+            item_items = iter(item.values() if item_type is dict else item)
+            stack.append((item, item_type, depth + 1, item_items, []))
+            break
+        else:
+            stack.pop()
+            ret = _rebuild(x_, nest_type, ret_list)
+            if not stack:
+                return ret
+            stack[-1][-1].append(ret)
 
 
 @handle_exceptions
@@ -1134,24 +1085,16 @@ def nested_any(
 
     """
     extra_nest_types = ivy.default(extra_nest_types, ())
-    if isinstance(nest, (tuple, list)) or isinstance(nest, extra_nest_types):
-        if isinstance(nest, (ivy.Array, ivy.NativeArray)):
-            if ivy.any(fn(nest)):
+    array_types = (ivy.Array, ivy.NativeArray)
+    for _, item in _walk_nest(nest, check_nests, extra_nest_types=extra_nest_types):
+        if isinstance(item, array_types) and isinstance(item, extra_nest_types):
+            if ivy.any(fn(item)):
                 return True
-        for i, item in enumerate(nest):
-            if nested_any(item, fn, check_nests, False, extra_nest_types):
-                return True
-        if check_nests and fn(nest):
-            return True
-    elif isinstance(nest, dict):
-        for k, v in nest.items():
-            if nested_any(v, fn, check_nests, False, extra_nest_types):
-                return True
-        if check_nests and fn(nest):
+        elif fn(item):
             return True
-    elif fn(nest):
-        return True
-    return False
+    return bool(
+        check_nests and _is_nest(nest, extra_nest_types=extra_nest_types) and fn(nest)
+    )
 
 
 @handle_exceptions
@@ -1427,19 +1370,10 @@ def duplicate_array_index_chains(nest: Union[ivy.Array, ivy.NativeArray, Iterabl
     -------
         list of index chains to duplicate.
     """
-    all_index_chains = ivy.nested_argwhere(nest, lambda _: True)
-    duplicates = []
-    duplicate_index_chains = {}
-    for index_chain in all_index_chains:
-        val = ivy.index_nest(nest, index_chain)
+    duplicate_index_chains = dict()
+    for index_chain, val in _walk_nest(nest):
         if ivy.is_array(val):
-            for i in range(len(duplicates)):
-                if val is duplicates[i]:
-                    duplicate_index_chains[i].append(index_chain)
-                    break
-            else:
-                duplicates.append(val)
-                duplicate_index_chains[len(duplicates) - 1] = [index_chain]
+            duplicate_index_chains.setdefault(id(val), []).append(list(index_chain))
     return list(duplicate_index_chains.values())
 
 
@@ -1477,3 +1411,194 @@ def prune_empty(nest):
     if not valid and not (ivy.is_array(nest) or isinstance(nest, (int, float, str))):
         return None
     return nest
+
+
+# Tree Definitions #
+# -----------------#
+
+# the tree definitions of the nests flattened most recently, keyed by their nodes
+_treedef_cache = dict()
+_max_treedef_cache_size = 1024
+
+
+class TreeDef:
+    """The structure of a nest, as returned by :func:`ivy.tree_flatten`.
+
+    The nodes of the nest are stored in post order, with ``None`` for each leaf and
+    ``(type, keys)`` for each nest, where keys is a tuple of the dict keys, or the
+    number of items for a sequence. Tree definitions are cached, so flattening
+    nests with the same structure returns the same tree definition.
+    """
+
+    def __init__(self, nodes):
+        self._nodes = nodes
+        self._num_leaves = sum(node is None for node in nodes)
+        self._leaf_paths = None
+
+    @property
+    def num_leaves(self) -> int:
+        """Number of leaves in the nest."""
+        return self._num_leaves
+
+    @property
+    def leaf_paths(self) -> Tuple[Tuple]:
+        """Index of each leaf in the nest, in the order of the flattened leaves."""
+        if self._leaf_paths is None:
+            stack = list()
+            for node in self._nodes:
+                if node is None:
+                    stack.append([()])
+                    continue
+                children = _pop_children(stack, node)
+                keys = range(node[1]) if isinstance(node[1], int) else node[1]
+                stack.append(
+                    [(k,) + path for k, paths in zip(keys, children) for path in paths]
+                )
+            self._leaf_paths = tuple(stack[0])
+        return self._leaf_paths
+
+    def unflatten(
+        self,
+        leaves: Sequence,
+        /,
+        *,
+        to_mutable: bool = False,
+        prune_none: bool = False,
+    ) -> Any:
+        """Builds a nest with this structure from its leaves.
+
+        Parameters
+        ----------
+        leaves
+            The leaves of the nest, in the order returned by :func:`ivy.tree_flatten`.
+        to_mutable
+            Whether to convert the nest to a mutable form, changing all tuples to
+            lists. Default is ``False``.
+        prune_none
+            Whether to prune the leaves which are None, and the nests which are left
+            empty. Default is ``False``.
+
+        Returns
+        -------
+        ret
+            The nest built from the leaves, or None if prune_none is set and no
+            leaves are left.
+
+        Examples
+        --------
+        >>> leaves, treedef = ivy.tree_flatten({'a': [1, 2], 'b': (3,)})
+        >>> print(treedef.unflatten([4, 5, 6]))
+        {'a': [4, 5], 'b': (6,)}
+
+        >>> print(treedef.unflatten([4, None, None], prune_none=True))
+        {'a': [4]}
+        """
+        ivy.assertions.check_equal(len(leaves), self._num_leaves)
+        leaves = iter(leaves)
+        stack = list()
+        for node in self._nodes:
+            if node is None:
+                stack.append(next(leaves))
+                continue
+            children = _pop_children(stack, node)
+            node_type, keys = node
+            if isinstance(keys, int):
+                if prune_none:
+                    children = [child for child in children if child is not None]
+                    if not children:
+                        stack.append(None)
+                        continue
+                stack.append(_build_sequence(node_type, children, to_mutable))
+                continue
+            ret = dict(zip(keys, children))
+            if prune_none:
+                ret = {k: v for k, v in ret.items() if v is not None}
+                if not ret:
+                    stack.append(None)
+                    continue
+            stack.append(ret if node_type is dict else node_type(ret))
+        return stack[0]
+
+    def __eq__(self, other):
+        return isinstance(other, TreeDef) and self._nodes == other._nodes
+
+    def __hash__(self):
+        return hash(self._nodes)
+
+    def __repr__(self):
+        return "TreeDef(num_leaves={}, num_nodes={})".format(
+            self._num_leaves, len(self._nodes)
+        )
+
+
+def _pop_children(stack, node):
+    num_children = node[1] if isinstance(node[1], int) else len(node[1])
+    children = stack[len(stack) - num_children :]
+    del stack[len(stack) - num_children :]
+    return children
+
+
+def _build_sequence(node_type, children, to_mutable):
+    if node_type is list or (to_mutable and issubclass(node_type, tuple)):
+        return children
+    elif node_type is tuple:
+        return tuple(children)
+    elif hasattr(node_type, "_fields"):
+        return node_type(*children)
+    return node_type(children)
+
+
+def _tree_node(nest):
+    if isinstance(nest, dict):
+        return type(nest), tuple(nest.keys())
+    return type(nest), len(nest)
+
+
+@handle_exceptions
+def tree_flatten(
+    nest: Union[ivy.Array, ivy.NativeArray, Iterable],
+    /,
+) -> Tuple[List, TreeDef]:
+    """Flattens a nest into its leaves and its structure, whereby all dicts, lists
+    and tuples, including derived classes such as :class:`ivy.Container`, are
+    traversed to their lowest leaves.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+
+    Returns
+    -------
+    ret
+        The leaves of the nest in depth first order, and the tree definition which
+        rebuilds the nest from its leaves. The tree definition is cached, so nests
+        with the same structure share the same tree definition.
+
+    Examples
+    --------
+    >>> x = {'a': [ivy.array([1.]), 2], 'b': (ivy.array([3.]),)}
+    >>> leaves, treedef = ivy.tree_flatten(x)
+    >>> print(leaves)
+    [ivy.array([1.]), 2, ivy.array([3.])]
+
+    >>> print(treedef.unflatten([1, 2, 3]))
+    {'a': [1, 2], 'b': (3,)}
+    """
+    leaves = list()
+    nodes = list()
+    for _, item in _walk_nest(nest, include_nests=True):
+        if _is_nest(item) and not isinstance(item, (ivy.Array, ivy.NativeArray)):
+            nodes.append(_tree_node(item))
+        else:
+            leaves.append(item)
+            nodes.append(None)
+    if _is_nest(nest) and not isinstance(nest, (ivy.Array, ivy.NativeArray)):
+        nodes.append(_tree_node(nest))
+    nodes = tuple(nodes)
+    treedef = _treedef_cache.get(nodes)
+    if treedef is None:
+        if len(_treedef_cache) >= _max_treedef_cache_size:
+            del _treedef_cache[next(iter(_treedef_cache))]
+        treedef = _treedef_cache[nodes] = TreeDef(nodes)
+    return leaves, treedef
@@ -0,0 +1,257 @@
+"""Mixed precision training, with an fp32 master copy of the module variables and
+dynamic loss scaling."""
+
+# global
+from typing import Union, Callable
+
+# local
+import ivy
+from ivy.stateful.module import Module
+from ivy.stateful.optimizers import Optimizer
+
+
+# Loss Scaling #
+# -------------#
+
+
+class LossScaler:
+    def __init__(
+        self,
+        init_scale: float = 2.0**16,
+        growth_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        growth_interval: int = 2000,
+        dynamic: bool = True,
+    ):
+        """
+        Construct a loss scaler, which scales the loss before the gradients are
+        computed, so that small gradients do not underflow in low precision, and
+        unscales the gradients afterwards.
+
+        Parameters
+        ----------
+        init_scale
+            The initial loss scale. Default is ``2**16``.
+        growth_factor
+            The factor the scale is multiplied by after growth_interval consecutive
+            steps without overflow. Default is ``2``.
+        backoff_factor
+            The factor the scale is multiplied by after a step with overflow.
+            Default is ``0.5``.
+        growth_interval
+            The number of consecutive steps without overflow after which the scale is
+            grown. Default is ``2000``.
+        dynamic
+            Whether to adjust the scale based on the overflow of the gradients, or to
+            keep it fixed at init_scale. Default is ``True``.
+        """
+        ivy.assertions.check_greater(init_scale, 0.0)
+        ivy.assertions.check_greater(growth_factor, 1.0, allow_equal=True)
+        ivy.assertions.check_true(
+            0.0 < backoff_factor <= 1.0, "backoff_factor must be in (0, 1]"
+        )
+        self._scale = float(init_scale)
+        self._growth_factor = growth_factor
+        self._backoff_factor = backoff_factor
+        self._growth_interval = growth_interval
+        self._dynamic = dynamic
+        self._growth_tracker = 0
+
+    @property
+    def scale(self):
+        return self._scale
+
+    def scale_loss(self, loss: Union[ivy.Array, ivy.NativeArray]):
+        """
+        Scale the loss by the current loss scale.
+
+        Parameters
+        ----------
+        loss
+            The loss to scale.
+
+        Returns
+        -------
+        ret
+            The scaled loss.
+        """
+        return loss * self._scale
+
+    def unscale(self, grads: Union[ivy.Array, ivy.Container]):
+        """
+        Unscale the gradients of a scaled loss.
+
+        Parameters
+        ----------
+        grads
+            Nested gradients to unscale.
+
+        Returns
+        -------
+        ret
+            The unscaled gradients.
+        """
+        return grads * (1.0 / self._scale)
+
+    @staticmethod
+    def grads_finite(grads: Union[ivy.Array, ivy.Container]) -> bool:
+        """
+        Determine whether all of the gradients are finite.
+
+        Parameters
+        ----------
+        grads
+            Nested gradients to check.
+
+        Returns
+        -------
+        ret
+            Boolean, whether none of the gradients contain nans or infs.
+        """
+        if not isinstance(grads, ivy.Container):
+            return not ivy.has_nans(grads)
+        return not any(ivy.has_nans(g) for g in grads.cont_to_flat_list())
+
+    def update(self, finite: bool):
+        """
+        Update the loss scale after a step, backing off if the gradients overflowed,
+        and growing after growth_interval consecutive steps without overflow.
+
+        Parameters
+        ----------
+        finite
+            Whether the gradients of the step were finite.
+        """
+        if not self._dynamic:
+            return
+        if not finite:
+            self._scale *= self._backoff_factor
+            self._growth_tracker = 0
+            return
+        self._growth_tracker += 1
+        if self._growth_tracker == self._growth_interval:
+            self._scale *= self._growth_factor
+            self._growth_tracker = 0
+
+    def set_state(self, state: ivy.Container):
+        """
+        Set state of the loss scaler.
+
+        Parameters
+        ----------
+        state
+            Nested state to update.
+        """
+        self._scale = float(state.scale)
+        self._growth_tracker = int(state.growth_tracker)
+
+    @property
+    def state(self):
+        return ivy.Container(
+            {"scale": self._scale, "growth_tracker": self._growth_tracker}
+        )
+
+
+# Mixed Precision #
+# ----------------#
+
+
+class MixedPrecision:
+    def __init__(
+        self,
+        module: Module,
+        optimizer: Optimizer,
+        /,
+        *,
+        dtype: Union[ivy.Dtype, str] = "float16",
+        loss_scaler: LossScaler = None,
+    ):
+        """
+        Construct a mixed precision trainer for a module. The module variables are
+        kept in low precision, and the forward and backward passes are run in low
+        precision inside a default float dtype scope, while the optimizer updates an
+        fp32 master copy of the variables, from which the module variables are cast
+        after every step. Steps with non-finite gradients are skipped, and the loss
+        scale backed off.
+
+        Parameters
+        ----------
+        module
+            The module to train. Its float variables are replaced by low precision
+            copies.
+        optimizer
+            The optimizer to update the fp32 master variables with.
+        dtype
+            The low precision float dtype, such as ``float16`` or ``bfloat16``.
+            Default is ``float16``.
+        loss_scaler
+            The loss scaler to use. Default is ``None``, in which case a dynamic
+            LossScaler with the default arguments is used.
+        """
+        ivy.assertions.check_true(
+            ivy.is_float_dtype(dtype), "dtype must be a float dtype"
+        )
+        self._module = module
+        self._optimizer = optimizer
+        self._dtype = ivy.as_ivy_dtype(dtype)
+        self._loss_scaler = ivy.default(loss_scaler, LossScaler())
+        self._master_v = self._cast(module.v, "float32", copy=True)
+        module.v = self._cast(self._master_v, self._dtype)
+
+    # Private #
+    # --------#
+
+    @staticmethod
+    def _cast(v, dtype, copy=False):
+        return v.cont_map(
+            lambda x, kc: ivy.astype(x, dtype, copy=copy)
+            if ivy.is_float_dtype(x)
+            else x
+        )
+
+    # Public #
+    # -------#
+
+    def step(self, loss_fn: Callable):
+        """
+        Compute the loss and gradients in low precision, and update the fp32 master
+        variables and the low precision module variables, unless the gradients are
+        not finite.
+
+        Parameters
+        ----------
+        loss_fn
+            Function which takes the module variables and returns the scalar loss,
+            such as ``lambda v: ivy.mean((module(x, v=v) - target) ** 2)``. It is
+            called inside a default float dtype scope of the low precision dtype, and
+            its inputs should also be cast to the low precision dtype.
+
+        Returns
+        -------
+        ret
+            The loss, the unscaled fp32 gradients, and whether the gradients were
+            finite and so the step was taken.
+        """
+
+        def scaled_loss_fn(v):
+            with ivy.DefaultFloatDtype(self._dtype):
+                loss = loss_fn(v)
+            return self._loss_scaler.scale_loss(ivy.astype(loss, "float32"))
+
+        scale = self._loss_scaler.scale
+        scaled_loss, grads = ivy.execute_with_gradients(scaled_loss_fn, self._module.v)
+        grads = self._loss_scaler.unscale(self._cast(grads, "float32"))
+        finite = self._loss_scaler.grads_finite(grads)
+        self._loss_scaler.update(finite)
+        if finite:
+            self._master_v = self._optimizer.step(self._master_v, grads)
+            self._module.v = self._cast(self._master_v, self._dtype)
+        return scaled_loss / scale, grads, finite
+
+    @property
+    def master_v(self):
+        return self._master_v
+
+    @property
+    def loss_scaler(self):
+        return self._loss_scaler
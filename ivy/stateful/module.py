@@ -49,6 +49,21 @@ from ivy.func_wrapper import _get_first_array
 from ivy.functional.ivy.gradients import _is_variable
 
 
+# the modules currently called with submodule tracking enabled, which is checked to
+# skip the tracking bookkeeping of every module in the forward pass
+_tracking_modules = list()
+
+_tracking_backend = None
+
+
+def _tracking_container():
+    """An empty numpy container for tracking submodule returns or call order."""
+    global _tracking_backend
+    if _tracking_backend is None:
+        _tracking_backend = ivy.get_backend(backend="numpy")
+    return ivy.Container(alphabetical_keys=False, ivyh=_tracking_backend)
+
+
 # Base #
 # -----#
 class Module(abc.ABC):
@@ -142,14 +157,10 @@ class Module(abc.ABC):
         self._submod_depth = None
         self._submods_to_track = None
         self._track_submod_call_order = False
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        self.submod_rets = _tracking_container()
         self.expected_submod_rets = None
         self.submod_dict = dict()
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        self.submod_call_order = _tracking_container()
         self._sub_mods = set()
         self._dtype = dtype
         self._args = args
@@ -547,6 +558,8 @@ class Module(abc.ABC):
         ret
             Result of the forward pass of the layer.
         """
+        if not _tracking_modules:
+            return self._forward(*args, **kwargs)
         if self.track_submod_call_order():
             self._add_submod_enter()
         ret = self._forward(*args, **kwargs)
@@ -950,9 +963,7 @@ class Module(abc.ABC):
                 )[-1].split("/")[0]
             else:
                 max_key = key + "_0"
-                sco[max_key] = ivy.Container(
-                    alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-                )
+                sco[max_key] = _tracking_container()
             sco = sco[max_key]
         final_key = key_chain[-1]
         kcs = sco.cont_key_chains_containing(final_key, include_empty=True)
@@ -979,9 +990,7 @@ class Module(abc.ABC):
                 flatten_key_chains=True
             ).to_numpy()
         else:
-            sco[new_key] = ivy.Container(
-                alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-            )
+            sco[new_key] = _tracking_container()
 
     def __call__(
         self,
@@ -1025,12 +1034,20 @@ class Module(abc.ABC):
         ret
         """
         with_grads = ivy.with_grads(with_grads=with_grads)
-        self.submod_rets = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
-        self.submod_call_order = ivy.Container(
-            alphabetical_keys=False, ivyh=ivy.get_backend(backend="numpy")
-        )
+        # the empty tracking containers of the previous call can be reused
+        if self.submod_rets:
+            self.submod_rets = _tracking_container()
+        if self.submod_call_order:
+            self.submod_call_order = _tracking_container()
+        if not (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(expected_submod_rets)
+        ):
+            # nothing to track, so skip the tracking setup
+            if v is not None:
+                v = ivy.to_native(v)
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
         self._set_submod_flags(
             track_submod_rets,
             submod_depth,
@@ -1038,14 +1055,16 @@ class Module(abc.ABC):
             track_submod_call_order,
             expected_submod_rets,
         )
+        _tracking_modules.append(self)
+        try:
+            # convert variables to native arrays so that they can be tracked
+            v = ivy.to_native(v)
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        finally:
+            _tracking_modules.remove(self)
+            self._unset_submod_flags()
 
-        # convert variables to native arrays so that they can be tracked
-        v = ivy.to_native(v)
-        ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
-        self._unset_submod_flags()
-        return ret
-
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, *, as_binary=False):
         """
         Save the weights on the Module.
 
@@ -1053,13 +1072,20 @@ class Module(abc.ABC):
         ----------
         weights_path
             The hdf5 file for saving the weights.
+        as_binary
+            Whether to save the weights in the binary container format instead, which
+            ``ivy.Container.cont_from_disk_as_binary`` loads by memory-mapping the file.
+            Default is ``False``.
 
         Returns
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        os.makedirs(os.path.dirname(weights_path) or ".", exist_ok=True)
+        if as_binary:
+            self.v.cont_to_disk_as_binary(weights_path)
+        else:
+            self.v.cont_to_disk_as_hdf5(weights_path)
 
     def build(self, *args, from_call=False, device=None, dtype=None, **kwargs):
         """
@@ -23,6 +23,7 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,7 +51,18 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all of the variables with a single fused multi-tensor
+            update, writing the new values into the existing variable arrays, rather
+            than with one update per container operation. The inplace writes cannot
+            be differentiated, so this requires stop_gradients to be ``True``.
+            Default is ``False``.
         """
+        ivy.assertions.check_true(
+            stop_gradients or not fused,
+            "fused updates write the variables inplace, and so require "
+            "stop_gradients=True",
+        )
         self._lr = lr
         self._inplace = inplace
         self._stop_gradients = stop_gradients
@@ -62,6 +74,7 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._compiled_step_fn = None
         self._compiled = False
+        self._fused = fused
 
     # Private #
     # --------#
@@ -92,6 +105,133 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    @staticmethod
+    def _fused_leaves(v: ivy.Container, grads: ivy.Container):
+        """
+        Flatten the variables and gradients into lists of leaves, with the gradients
+        ordered by the key chains of the variables. Arrays are returned as lists of
+        one leaf.
+
+        Parameters
+        ----------
+        v
+            Nested variables to flatten.
+        grads
+            Nested gradients to flatten.
+
+        Returns
+        -------
+        ret
+            The list of variables, and the list of their gradients.
+        """
+        if not isinstance(v, ivy.Container):
+            return [v], [grads]
+        ws = v.cont_to_flat_list()
+        if grads.cont_all_key_chains() == v.cont_all_key_chains():
+            return ws, grads.cont_to_flat_list()
+        return ws, [grads[kc] for kc in v.cont_all_key_chains()]
+
+    @staticmethod
+    def _from_fused_leaves(cont: ivy.Container, leaves):
+        """
+        Rebuild a container with the same structure as cont, with its leaves replaced
+        in order from a list returned by a fused update.
+
+        Parameters
+        ----------
+        cont
+            Container with the structure to rebuild.
+        leaves
+            New leaves, in the order of cont.cont_to_flat_list().
+
+        Returns
+        -------
+        ret
+            The rebuilt container.
+        """
+        if not isinstance(cont, ivy.Container):
+            return leaves[0]
+        leaves = iter(leaves)
+        return cont.cont_map(lambda x, kc: next(leaves))
+
+    @staticmethod
+    def _mark_written(leaves):
+        """
+        Record the writes of a fused update to the ivy arrays it was given, whose
+        native arrays the backend kernels write in place, so that the cached
+        fingerprints of the containers holding them are not trusted.
+
+        Parameters
+        ----------
+        leaves
+            The arrays passed to the fused update, which it wrote in place.
+        """
+        if not ivy.inplace_arrays_supported():
+            return
+        for x in leaves:
+            if isinstance(x, ivy.Array):
+                x._bump_version()
+
+    @staticmethod
+    def _new_moments(v: ivy.Container, grads: ivy.Container):
+        """
+        Allocate the first and second moment buffers of the variables, with the
+        dtype and device of the variables, initialised to grads and grads**2. The
+        buffers are updated inplace on later steps, and so never alias the gradients.
+
+        Parameters
+        ----------
+        v
+            Nested variables to allocate the moments for.
+        grads
+            Nested gradients to initialise the moments with.
+
+        Returns
+        -------
+        ret
+            The first moments, and the second moments.
+        """
+
+        def _new_moment(w, x, copy):
+            return ivy.to_device(ivy.astype(x, ivy.dtype(w), copy=copy), ivy.dev(w))
+
+        if not isinstance(v, ivy.Container):
+            return _new_moment(v, grads, True), _new_moment(v, grads**2, False)
+        return (
+            ivy.Container.cont_multi_map(
+                lambda xs, kc: _new_moment(xs[0], xs[1], True), [v, grads]
+            ),
+            ivy.Container.cont_multi_map(
+                lambda xs, kc: _new_moment(xs[0], xs[1] ** 2, False), [v, grads]
+            ),
+        )
+
+    @staticmethod
+    def _update_state(state, new_state):
+        """
+        Write new optimizer state into the existing state buffers, if the backend
+        supports inplace updates, or otherwise replace them.
+
+        Parameters
+        ----------
+        state
+            Nested state to update.
+        new_state
+            Nested new values of the state.
+
+        Returns
+        -------
+        ret
+            The updated state.
+        """
+        if not ivy.inplace_arrays_supported():
+            return new_state
+        ivy.inplace_update(state, new_state)
+        return state
+
+    def _lr_value(self):
+        return self._lr if isinstance(self._lr, float) else self._lr()
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -171,6 +311,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -189,9 +330,20 @@ class SGD(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all of the variables with a single fused multi-tensor
+            update, writing the new values into the existing variable arrays, rather
+            than with one update per container operation. The inplace writes cannot
+            be differentiated, so this requires stop_gradients to be ``True``.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -214,6 +366,13 @@ class SGD(Optimizer):
             The new updated variables container, following gradient descent step.
 
         """
+        if self._fused:
+            ws, dcdws = self._fused_leaves(v, grads)
+            new_ws = ivy.fused_gradient_descent_update(
+                ws, dcdws, self._lr_value(), stop_gradients=self._stop_gradients
+            )
+            self._mark_written(ws)
+            return self._from_fused_leaves(v, new_ws)
         return ivy.gradient_descent_update(
             v,
             grads,
@@ -246,6 +405,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -266,10 +426,21 @@ class LARS(Optimizer):
             Default is ``True``.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is ``False``.
+        fused
+            Whether to update all of the variables with a single fused multi-tensor
+            update, writing the new values into the existing variable arrays, rather
+            than with one update per container operation. The inplace writes cannot
+            be differentiated, so this requires stop_gradients to be ``True``.
+            Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -292,6 +463,17 @@ class LARS(Optimizer):
             The new updated variables container, following LARS step.
 
         """
+        if self._fused:
+            ws, dcdws = self._fused_leaves(v, grads)
+            new_ws = ivy.fused_lars_update(
+                ws,
+                dcdws,
+                self._lr_value(),
+                decay_lambda=self._decay_lambda,
+                stop_gradients=self._stop_gradients,
+            )
+            self._mark_written(ws)
+            return self._from_fused_leaves(v, new_ws)
         return ivy.lars_update(
             v,
             grads,
@@ -328,6 +510,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -356,6 +539,12 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all of the variables with a single fused multi-tensor
+            update, writing the new values into the existing variable arrays, rather
+            than with one update per container operation. The inplace writes cannot
+            be differentiated, so this requires stop_gradients to be ``True``.
+            Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -366,7 +555,14 @@ class Adam(Optimizer):
         self._should_compile = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
 
     # Custom Step
@@ -389,12 +585,14 @@ class Adam(Optimizer):
             The updated variables, following Adam update step.
 
         """
+        if self._fused:
+            return self._fused_step(v, grads)
+
         if self._first_pass:
-            self._mw = grads
-            self._vw = grads**2
+            self._mw, self._vw = self._new_moments(v, grads)
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.adam_update(
+        new_v, mw, vw = ivy.adam_update(
             v,
             grads,
             self._lr if isinstance(self._lr, float) else self._lr(),
@@ -406,8 +604,50 @@ class Adam(Optimizer):
             epsilon=self._epsilon,
             stop_gradients=self._stop_gradients,
         )
+        self._mw = self._update_state(self._mw, mw)
+        self._vw = self._update_state(self._vw, vw)
         return new_v
 
+    def _fused_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v by a fused Adam update step, updating
+        the variables and the moments inplace.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, following the Adam update step.
+        """
+        ws, dcdws = self._fused_leaves(v, grads)
+        if self._first_pass:
+            self._mw, self._vw = self._new_moments(v, grads)
+            self._first_pass = False
+        mws, vws = self._fused_leaves(self._mw, self._vw)
+        new_ws, new_mws, new_vws = ivy.fused_adam_update(
+            ws,
+            dcdws,
+            self._lr_value(),
+            mws,
+            vws,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+            stop_gradients=self._stop_gradients,
+        )
+        self._mark_written(ws + mws + vws)
+        if not ivy.inplace_arrays_supported():
+            self._mw = self._from_fused_leaves(self._mw, new_mws)
+            self._vw = self._from_fused_leaves(self._vw, new_vws)
+        return self._from_fused_leaves(v, new_ws)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -417,12 +657,18 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        # copies, since the moments are updated inplace, and so would otherwise
+        # overwrite the arrays of the caller, such as a saved checkpoint
+        self._mw = ivy.copy_array(state.mw)
+        self._vw = ivy.copy_array(state.vw)
+        self._first_pass = False
 
     @property
     def state(self):
-
+        """
+        The first and second moments. These are the live buffers, which later steps
+        update inplace, so they should be copied to keep a checkpoint.
+        """
         return ivy.Container({"mw": self._mw, "vw": self._vw})
 
 
@@ -439,6 +685,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -472,9 +719,22 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all of the variables with a single fused multi-tensor
+            update, writing the new values into the existing variable arrays, rather
+            than with one update per container operation. The inplace writes cannot
+            be differentiated, so this requires stop_gradients to be ``True``.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -504,12 +764,14 @@ class LAMB(Optimizer):
         ret
             The updated variables, following LAMB update step.
         """
+        if self._fused:
+            return self._fused_step(v, grads)
+
         if self._first_pass:
-            self._mw = grads
-            self._vw = grads**2
+            self._mw, self._vw = self._new_moments(v, grads)
             self._first_pass = False
 
-        new_v, self._mw, self._vw = ivy.lamb_update(
+        new_v, mw, vw = ivy.lamb_update(
             v,
             grads,
             self._lr if isinstance(self._lr, float) else self._lr(),
@@ -523,8 +785,52 @@ class LAMB(Optimizer):
             decay_lambda=self._decay_lambda,
             stop_gradients=self._stop_gradients,
         )
+        self._mw = self._update_state(self._mw, mw)
+        self._vw = self._update_state(self._vw, vw)
         return new_v
 
+    def _fused_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v by a fused LAMB update step, updating
+        the variables and the moments inplace.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, following the LAMB update step.
+        """
+        ws, dcdws = self._fused_leaves(v, grads)
+        if self._first_pass:
+            self._mw, self._vw = self._new_moments(v, grads)
+            self._first_pass = False
+        mws, vws = self._fused_leaves(self._mw, self._vw)
+        new_ws, new_mws, new_vws = ivy.fused_lamb_update(
+            ws,
+            dcdws,
+            self._lr_value(),
+            mws,
+            vws,
+            self._count,
+            beta1=self._beta1,
+            beta2=self._beta2,
+            epsilon=self._epsilon,
+            max_trust_ratio=self._max_trust_ratio,
+            decay_lambda=self._decay_lambda,
+            stop_gradients=self._stop_gradients,
+        )
+        self._mark_written(ws + mws + vws)
+        if not ivy.inplace_arrays_supported():
+            self._mw = self._from_fused_leaves(self._mw, new_mws)
+            self._vw = self._from_fused_leaves(self._vw, new_vws)
+        return self._from_fused_leaves(v, new_ws)
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -533,10 +839,16 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        # copies, since the moments are updated inplace, and so would otherwise
+        # overwrite the arrays of the caller, such as a saved checkpoint
+        self._mw = ivy.copy_array(state.mw)
+        self._vw = ivy.copy_array(state.vw)
+        self._first_pass = False
 
     @property
     def state(self):
-
+        """
+        The first and second moments. These are the live buffers, which later steps
+        update inplace, so they should be copied to keep a checkpoint.
+        """
         return ivy.Container({"mw": self._mw, "vw": self._vw})
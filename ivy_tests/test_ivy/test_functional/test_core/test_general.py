@@ -974,6 +974,41 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_lru():
+    def func(*_, **__):
+        return object()
+
+    cached_fn = ivy.cache_fn(func, max_size=2)
+
+    # arrays are keyed by their identity and version rather than their contents
+    x = ivy.array([0.0, 1.0])
+    ret0 = cached_fn(x, y=[1])
+    assert cached_fn(x, y=[1]) is ret0
+    assert cached_fn(ivy.array([0.0, 1.0]), y=[1]) is not ret0
+    x[1] = 2.0
+    assert cached_fn(x, y=[1]) is not ret0
+    assert ivy.cache_fn_stats(cached_fn) == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+
+    # the least recently used output is evicted
+    ret1 = cached_fn(1)
+    assert cached_fn(1.0) is not ret1
+    assert cached_fn(1) is ret1
+    cached_fn("a")
+    assert cached_fn(1) is ret1
+    assert ivy.cache_fn_stats(func)["evictions"] == 4
+
+    # invalidating the cache recomputes the outputs
+    ivy.invalidate_cache_fn(func)
+    assert cached_fn(1) is not ret1
+    assert ivy.cache_fn_stats(cached_fn)["misses"] == 1
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
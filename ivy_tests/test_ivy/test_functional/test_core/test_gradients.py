@@ -158,6 +158,38 @@ def test_execute_with_gradients(
     )
 
 
+# execute_with_accumulated_gradients
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 10])
+@pytest.mark.parametrize("with_out", [True, False])
+def test_execute_with_accumulated_gradients(chunk_size, with_out, backend_fw):
+    fw = backend_fw.current_backend_str()
+    ivy.set_backend(fw)
+    x = ivy.reshape(ivy.arange(10, dtype="float32"), (10, 1))
+    y = ivy.ones((10, 1))
+    v = ivy.Container(w=_variable(ivy.array([[0.5]])), b=_variable(ivy.array([0.1])))
+
+    def loss_fn(v_, x_, y_):
+        return ivy.mean((ivy.matmul(x_, v_.w) + v_.b - y_) ** 2)
+
+    loss_gt, grads_gt = ivy.execute_with_gradients(lambda v_: loss_fn(v_, x, y), v)
+    out = v.cont_map(lambda x_, kc: ivy.zeros_like(x_)) if with_out else None
+    loss, grads = ivy.execute_with_accumulated_gradients(
+        loss_fn, v, [x, y], chunk_size=chunk_size, out=out
+    )
+    assert np.allclose(ivy.to_numpy(loss), ivy.to_numpy(loss_gt))
+    if grads_gt is None:
+        # NumPy does not support gradients
+        assert grads is out
+        ivy.unset_backend()
+        return
+    for kc in ["w", "b"]:
+        assert np.allclose(ivy.to_numpy(grads[kc]), ivy.to_numpy(grads_gt[kc]))
+        if with_out and ivy.inplace_arrays_supported():
+            # the gradients are accumulated into the given arrays
+            assert grads[kc] is out[kc]
+    ivy.unset_backend()
+
+
 # value_and_grad
 @pytest.mark.parametrize(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
@@ -525,3 +557,54 @@ def test_lamb_update(
         decay_lambda=decay_lambda,
         stop_gradients=stop_gradients,
     )
+
+
+# fused optimizer updates
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("fn_name", ["gradient_descent", "lars", "adam", "lamb"])
+@pytest.mark.parametrize("decay_lambda", [0, 0.01])
+def test_fused_optimizer_updates(dtype, fn_name, decay_lambda, backend_fw):
+    fw = backend_fw.current_backend_str()
+    ivy.set_backend(fw)
+    rng = np.random.default_rng(0)
+    shapes = [(3, 4), (5,), (1,)]
+    ws_np, dcdws_np, mws_np, vws_np = [
+        [rng.standard_normal(shape).astype(dtype) for shape in shapes] for _ in range(4)
+    ]
+    mws_np = [np.abs(x) for x in mws_np]
+    vws_np = [np.abs(x) for x in vws_np]
+    kwargs = dict(decay_lambda=decay_lambda) if fn_name in ["lars", "lamb"] else {}
+    fused_fn = ivy.__dict__["fused_" + fn_name + "_update"]
+    fn = ivy.__dict__[fn_name + "_update"]
+    ws = [ivy.array(x.copy()) for x in ws_np]
+    dcdws = [ivy.array(x) for x in dcdws_np]
+    if fn_name in ["adam", "lamb"]:
+        mws = [ivy.array(x.copy()) for x in mws_np]
+        vws = [ivy.array(x.copy()) for x in vws_np]
+        ret_gt = [
+            fn(ivy.array(w), ivy.array(g), 0.1, ivy.array(m), ivy.array(v), 3, **kwargs)
+            for w, g, m, v in zip(ws_np, dcdws_np, mws_np, vws_np)
+        ]
+        ret = fused_fn(ws, dcdws, 0.1, mws, vws, 3, **kwargs)
+        rets, rets_gt = list(ret), [list(r) for r in zip(*ret_gt)]
+        # the moments are updated inplace where supported
+        if ivy.inplace_arrays_supported():
+            assert np.allclose(ivy.to_numpy(mws[0]), ivy.to_numpy(ret[1][0]))
+    else:
+        ret_gt = [
+            fn(ivy.array(w), ivy.array(g), 0.1, **kwargs)
+            for w, g in zip(ws_np, dcdws_np)
+        ]
+        ret = fused_fn(ws, dcdws, 0.1, **kwargs)
+        rets, rets_gt = [ret], [ret_gt]
+    # the weights are updated inplace where supported
+    if ivy.inplace_arrays_supported():
+        assert np.allclose(ivy.to_numpy(ws[0]), ivy.to_numpy(rets[0][0]))
+    for xs, xs_gt in zip(rets, rets_gt):
+        assert len(xs) == len(shapes)
+        for x, x_gt in zip(xs, xs_gt):
+            assert x.shape == x_gt.shape
+            assert np.allclose(
+                ivy.to_numpy(x), ivy.to_numpy(x_gt), rtol=1e-4, atol=1e-5
+            )
+    ivy.unset_backend()
@@ -217,6 +217,25 @@ def test_nested_argwhere_w_extra_nest_types():
     assert indices[3] == ["b", "c", 0, 1, 0]
 
 
+# nested_argwhere_deep_nest
+def test_nested_argwhere_deep_nest():
+    # nests deeper than the recursion limit are traversed iteratively
+    nest = [0, 1]
+    for _ in range(5000):
+        nest = [nest, {"a": 2}]
+    indices = ivy.nested_argwhere(nest, lambda x: x > 0)
+    assert len(indices) == 5001
+    assert indices[0] == [0] * 5000 + [1]
+    assert indices[-1] == [1, "a"]
+    assert ivy.nested_argwhere(nest, lambda x: x > 0, stop_after_n_found=2) == (
+        indices[:2]
+    )
+    assert ivy.nested_any(nest, lambda x: x == 1)
+    mapped = ivy.nested_map(nest, lambda x: x + 1, shallow=False)
+    assert ivy.index_nest(mapped, [0] * 5000 + [1]) == 2
+    assert ivy.index_nest(nest, [0] * 5000 + [1]) == 1
+
+
 # all_nested_indices
 @pytest.mark.parametrize(
     "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
@@ -502,3 +521,32 @@ def test_duplicate_array_index_chains(nest, x, y):
 def test_prune_empty(nest):
     ret = ivy.prune_empty(ivy.copy_nest(nest))
     assert ret == {"b": {"c": [1]}}
+
+
+# tree_flatten
+def test_tree_flatten():
+    nest = {"a": [ivy.array([1.0]), 2], "b": (ivy.array([3.0]), {"c": 4})}
+    leaves, treedef = ivy.tree_flatten(nest)
+    assert leaves == [nest["a"][0], 2, nest["b"][0], 4]
+    assert treedef.num_leaves == 4
+    assert treedef.leaf_paths == (("a", 0), ("a", 1), ("b", 0), ("b", 1, "c"))
+
+    # nests with the same structure share the cached tree definition
+    other_leaves, other_treedef = ivy.tree_flatten(treedef.unflatten([5, 6, 7, 8]))
+    assert other_treedef is treedef
+    assert other_leaves == [5, 6, 7, 8]
+    assert ivy.tree_flatten({"a": [1], "b": (2, {"c": 3})})[1] != treedef
+
+    # unflattening to a mutable and pruned nest
+    assert treedef.unflatten([1, None, 3, None], to_mutable=True, prune_none=True) == {
+        "a": [1],
+        "b": [3],
+    }
+
+    # leaves and containers
+    assert ivy.tree_flatten(1)[1].unflatten([2]) == 2
+    cont = ivy.Container(a=ivy.array([1.0]), b={"c": ivy.array([2.0])})
+    leaves, treedef = ivy.tree_flatten(cont)
+    assert leaves == [cont.a, cont.b.c]
+    ret = treedef.unflatten([1, 2])
+    assert isinstance(ret, ivy.Container) and ret.b.c == 2
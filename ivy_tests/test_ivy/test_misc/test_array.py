@@ -188,6 +188,26 @@ def test_array_property_device(
     ivy.assertions.check_equal(x.device, ivy.dev(data))
 
 
+def test_array_lazy_metadata():
+    data = ivy.native_array([[1.0, 2.0, 3.0]])
+    x = Array(data)
+    # the array and its mixins only use slots
+    assert not hasattr(x, "__dict__")
+    # the metadata is only computed when it's first accessed
+    assert x._dtype is None and x._device is None
+    ivy.assertions.check_equal(x.dtype, ivy.dtype(data))
+    ivy.assertions.check_equal(x.device, ivy.dev(data))
+    assert x._dtype is not None and x._device is not None
+    # the backend is the one set when the array was created
+    ivy.assertions.check_equal(x.backend, ivy.current_backend_str())
+    # setting the data resets the metadata
+    x.data = ivy.native_array([1, 2], dtype="int32")
+    assert x._dtype is None
+    ivy.assertions.check_equal(x.dtype, "int32")
+    ivy.assertions.check_equal(x.shape, (2,))
+    ivy.assertions.check_equal(x.size, 2)
+
+
 @handle_test(
     fn_tree="functional.ivy.native_array",  # dummy fn_tree
     dtype_x=helpers.dtype_and_values(
@@ -2,6 +2,7 @@
 import pytest
 import importlib
 import types
+from concurrent.futures import ThreadPoolExecutor
 
 
 try:
@@ -57,6 +58,15 @@ if "torch" in available_frameworks:
     available_array_types_class.append(("torch", "<class 'torch.Tensor'>"))
 
 
+def _wraps_fn(wrapped_fn, fn):
+    # whether `fn` is part of the wrapper chain of `wrapped_fn`
+    while wrapped_fn is not None:
+        if wrapped_fn is fn:
+            return True
+        wrapped_fn = getattr(wrapped_fn, "__wrapped__", None)
+    return False
+
+
 @pytest.mark.parametrize(
     (
         "backend",
@@ -72,12 +82,18 @@ def test_set_backend(backend, array_type):
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
+    # check that the function id has changed as inverse=True, unless the same
+    # backend was already set, in which case the cached function is reused.
+    ivy.assertions.check_equal(
+        func_address_before,
+        id(ivy.sum),
+        inverse=not stack_before or stack_before[-1] is not stack_after[-1],
+    )
     # using ivy assertions to ensure the desired backend is set
     ivy.assertions.check_less(len(stack_before), len(stack_after))
     ivy.assertions.check_equal(ivy.current_backend_str(), backend)
     backend = importlib.import_module(_backend_dict[backend])
+    assert _wraps_fn(ivy.sum, backend.sum)
     ivy.assertions.check_equal(stack_after[-1], backend)
     x = ivy.array([1, 2, 3])
     ivy.assertions.check_equal(str(type(ivy.to_native(x))), array_type)
@@ -96,8 +112,18 @@ def test_unset_backend(backend):
 
     unset_backend = ivy.unset_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before_unset, id(ivy.sum), inverse=True)
+    # check that the function id has changed as inverse=True, unless the previous
+    # backend is the same, in which case the cached function is reused.
+    ivy.assertions.check_equal(
+        func_address_before_unset,
+        id(ivy.sum),
+        inverse=not stack_after_unset
+        or stack_after_unset[-1] is not stack_before_unset[-1],
+    )
+    if stack_after_unset:
+        assert _wraps_fn(ivy.sum, stack_after_unset[-1].sum)
+    else:
+        assert ivy.sum is ivy.backend_handler.ivy_original_dict["sum"]
     ivy.assertions.check_equal(
         unset_backend, importlib.import_module(_backend_dict[backend])
     )
@@ -110,6 +136,36 @@ def test_unset_backend(backend):
     ivy.assertions.check_equal(ivy.current_backend_str(), backend)
 
 
+@pytest.mark.parametrize(("backend"), available_frameworks)
+def test_set_backend_reuses_wrapped_fns(backend):
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.set_backend("numpy")
+    ivy.unset_backend()
+    # the wrapped functions are taken from the cached table of the backend
+    assert ivy.sum is wrapped_sum
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    assert ivy.sum is wrapped_sum
+
+    # changing the backend implementation causes the function to be wrapped again
+    backend_module = importlib.import_module(_backend_dict[backend])
+    backend_sum = backend_module.sum
+
+    def _sum(*args, **kwargs):
+        return backend_sum(*args, **kwargs)
+
+    backend_module.sum = _sum
+    try:
+        ivy.unset_backend()
+        ivy.set_backend(backend)
+        assert ivy.sum is not wrapped_sum
+        assert ivy.sum.__wrapped__ is not None
+    finally:
+        backend_module.sum = backend_sum
+        ivy.unset_backend()
+
+
 def test_clear_backend_stack():
     for backend_str in available_frameworks:
         ivy.set_backend(backend_str)
@@ -144,6 +200,51 @@ def test_current_backend(backend, array_type):
         )
 
 
+@pytest.mark.parametrize(
+    ("backend", "array_type"),
+    available_array_types_input,
+)
+def test_current_backend_from_nested_args(backend, array_type):
+    # inference is cached per argument type, and searches nests and kwargs
+    ivy.clear_backend_stack()
+    expected = importlib.import_module(_backend_dict[backend])
+    for _ in range(2):
+        ivy.assertions.check_equal(
+            ivy.current_backend(1.0, [None, {"a": array_type}]), expected
+        )
+        ivy.assertions.check_equal(ivy.current_backend(1.0, x=array_type), expected)
+    assert ivy.backend_handler._backend_from_type_cache[type(array_type)] == (
+        _backend_dict[backend]
+    )
+    assert ivy.backend_handler._backend_from_type_cache[float] is None
+
+
+def test_local_backend():
+    ivy.clear_backend_stack()
+    backends = [available_frameworks[i % len(available_frameworks)] for i in range(4)]
+
+    def _run(backend):
+        with ivy.backend_handler.ContextManager(backend, local=True):
+            x = ivy.add(ivy.array([1.0, 2.0]), 1.0)
+            return ivy.current_backend_str(), ivy.current_backend(), x.to_list()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        rets = list(executor.map(_run, backends))
+    for backend, (backend_str, backend_module, x) in zip(backends, rets):
+        assert backend_str == backend
+        assert backend_module is importlib.import_module(_backend_dict[backend])
+        assert x == [2.0, 3.0]
+    # the local backends don't leak into other threads
+    assert ivy.current_backend_str() == ""
+    assert ivy.unset_local_backend() is None
+
+    # local backends can't be mixed with a global backend
+    ivy.set_backend("numpy")
+    with pytest.raises(ivy.exceptions.IvyException):
+        ivy.set_local_backend("numpy")
+    ivy.unset_backend()
+
+
 @pytest.mark.parametrize(("excluded"), available_frameworks_with_none)
 def test_choose_random_backend(excluded):
     backend = ivy.choose_random_backend(excluded=excluded)
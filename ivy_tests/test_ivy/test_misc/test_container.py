@@ -6,6 +6,8 @@ import random
 import numpy as np
 import multiprocessing
 import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 import ivy
@@ -2056,6 +2058,220 @@ def test_container_multi_map(device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f, copy=False), 3)
 
 
+def test_container_multi_map_in_static_method(device):
+    container0 = Container(
+        {
+            "a": ivy.array([1], device=device),
+            "b": {"c": ivy.array([2], device=device)},
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([3], device=device),
+            "b": {"c": ivy.array([4], device=device)},
+        }
+    )
+    args = ([container0, container1],)
+    kwargs = {"axis": 0}
+
+    # containers nested in the arguments are filled in for each leaf
+    container_concat = ivy.Container.cont_multi_map_in_static_method(
+        "concat", *args, **kwargs
+    )
+    assert np.allclose(ivy.to_numpy(container_concat.a), np.array([1, 3]))
+    assert np.allclose(ivy.to_numpy(container_concat.b.c), np.array([2, 4]))
+
+    # the arguments are left untouched
+    assert args[0][0] is container0 and args[0][1] is container1
+    assert kwargs == {"axis": 0}
+
+    # with an out container
+    out = container0.cont_deep_copy()
+    container_added = ivy.Container.cont_multi_map_in_static_method(
+        "add", container0, container1, out=out
+    )
+    assert container_added is out
+    assert np.allclose(ivy.to_numpy(out.a), np.array([4]))
+    assert np.allclose(ivy.to_numpy(out.b.c), np.array([6]))
+
+
+def test_container_pack(device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=device),
+            "b": {
+                "c": ivy.array([[3.0, 4.0], [5.0, 6.0]], device=device),
+                "d": ivy.array([7, 8], device=device),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    assert packed.cont_is_packed
+    assert not container.cont_is_packed
+    # one flat buffer per dtype, with the leaves as views into them
+    assert len(packed._cont_packed.buffers) == 2
+    assert packed.b.c.shape == (2, 2)
+    assert np.allclose(ivy.to_numpy(packed.b.c), np.array([[3, 4], [5, 6]]))
+
+    # elementwise operations run on the buffers and stay packed
+    for ret in (
+        packed * 2 + packed,
+        -packed,
+        packed < 3,
+        ivy.add(packed, packed),
+        packed.cont_map(lambda x, _: x * 3, elementwise=True),
+    ):
+        assert ret.cont_is_packed
+    ret = packed * 2 + packed
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([3, 6]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[9, 12], [15, 18]]))
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([21, 24]))
+
+    # operands which would broadcast against each leaf use the per-leaf path
+    ret = packed + ivy.array([1.0], device=device)
+    assert not ret.cont_is_packed
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([2, 3]))
+    assert not (packed + container).cont_is_packed
+
+    # replacing a leaf detaches the container from its buffers
+    detached = container.cont_pack()
+    detached.a = ivy.array([0.0, 0.0], device=device)
+    assert not detached.cont_is_packed
+    assert np.allclose(ivy.to_numpy((detached + 1).a), np.array([1, 1]))
+
+    # unpacking copies the leaves out of the buffers
+    unpacked = packed.cont_unpack()
+    assert not unpacked.cont_is_packed
+    assert np.allclose(ivy.to_numpy(unpacked.b.c), np.array([[3, 4], [5, 6]]))
+
+
+def test_container_fusion_mode(device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=device),
+            "b": {
+                "c": ivy.array([3.0, 4.0], device=device),
+                "d": ivy.array([5, 6], device=device),
+                "e": ivy.array(7.0, device=device),
+            },
+        }
+    )
+    expected = [container + container, container * 2, -container]
+    assert not ivy.get_container_fusion_mode()
+    with ivy.ContainerFusion():
+        assert ivy.get_container_fusion_mode()
+        fused = [container + container, container * 2, -container]
+        # inputs which would broadcast against each leaf use the per-leaf path
+        broadcast = container + ivy.array([1.0], device=device)
+    assert not ivy.get_container_fusion_mode()
+    # exceptions raised in the mode propagate
+    with pytest.raises(ValueError):
+        with ivy.ContainerFusion():
+            raise ValueError
+    assert not ivy.get_container_fusion_mode()
+    for ret, ret_expected in zip(fused, expected):
+        assert list(ret.cont_to_iterator_keys()) == list(
+            ret_expected.cont_to_iterator_keys()
+        )
+        for x, y in zip(
+            ret.cont_to_iterator_values(), ret_expected.cont_to_iterator_values()
+        ):
+            assert x.shape == y.shape
+            assert x.dtype == y.dtype
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y))
+    assert np.allclose(ivy.to_numpy(broadcast.b.c), np.array([4.0, 5.0]))
+
+
+def test_container_key_chain_index(device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=device),
+            "b": {"c": ivy.array([2], device=device), "d": {}},
+        }
+    )
+    assert container.cont_has_key("c")
+    assert not container.cont_has_key("e")
+    assert container.cont_all_key_chains() == ["a", "b/c"]
+    assert container.cont_all_key_chains(include_empty=True) == ["a", "b/c", "b/d"]
+
+    # mutating a sub-container invalidates the index of the root
+    container.b.e = ivy.array([3], device=device)
+    assert container.cont_has_key("e")
+    assert container.cont_key_chains_containing("b") == ["b/c", "b/e"]
+    del container.b["e"]
+    assert not container.cont_has_key("e")
+    container.b.cont_inplace_update({"f": ivy.array([4], device=device)})
+    assert container.cont_at_keys("f").cont_all_key_chains() == ["b/f"]
+
+    # filtered maps match the key chains exactly, or by prefix for multi maps
+    mapped = container.cont_map(lambda x, _: x + 1, key_chains=["a", "b/f"])
+    assert np.allclose(ivy.to_numpy(mapped.a), np.array([2]))
+    assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([2]))
+    assert np.allclose(ivy.to_numpy(mapped.b.f), np.array([5]))
+    mapped = ivy.Container.cont_multi_map(
+        lambda xs, _: xs[0] + xs[1], [container, container], key_chains=["b"]
+    )
+    assert np.allclose(ivy.to_numpy(mapped.a), np.array([1]))
+    assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([4]))
+
+
+def test_container_map_in_parallel(device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=device),
+            "b": {
+                "c": ivy.array([2], device=device),
+                "d": [ivy.array([3], device=device), ivy.array([4], device=device)],
+            },
+        }
+    )
+    key_chains_seen = list()
+
+    def _fn(x, kc):
+        key_chains_seen.append(kc)
+        return x * 2
+
+    # the results keep the key order of the sequential map
+    mapped = container.cont_map(_fn, map_sequences=True, num_workers=2, chunk_size=1)
+    expected = container.cont_map(lambda x, _: x * 2, map_sequences=True)
+    assert list(mapped.cont_to_iterator_keys()) == list(
+        expected.cont_to_iterator_keys()
+    )
+    assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([4]))
+    assert np.allclose(ivy.to_numpy(mapped.b.d[1]), np.array([8]))
+    assert sorted(key_chains_seen, key=str) == sorted(["a", "b/c", None, None], key=str)
+
+    # with a given executor, and key chain filtering
+    with ThreadPoolExecutor(2) as executor:
+        mapped = Container.cont_multi_map(
+            lambda xs, _: xs[0] + xs[1],
+            [container, container],
+            key_chains=["b/c"],
+            prune_unapplied=True,
+            executor=executor,
+        )
+    assert list(mapped.cont_to_iterator_keys()) == ["b/c"]
+    assert np.allclose(ivy.to_numpy(mapped.b.c), np.array([4]))
+
+    # inplace maps write the results into the container
+    sub_cont = container.b
+    ret = container.cont_map(lambda x, _: x * 2, num_workers=2, inplace=True)
+    assert ret is container and container.b is sub_cont
+    assert np.allclose(ivy.to_numpy(container.a), np.array([2]))
+    assert np.allclose(ivy.to_numpy(container.b.c), np.array([4]))
+
+    # unless a call fails, which leaves the container untouched
+    def _fail(x, kc):
+        if kc == "b/c":
+            raise ValueError("failed")
+        return x * 2
+
+    with pytest.raises(ValueError):
+        container.cont_map(_fail, num_workers=2, chunk_size=1, inplace=True)
+    assert np.allclose(ivy.to_numpy(container.a), np.array([2]))
+    assert np.allclose(ivy.to_numpy(container.b.c), np.array([4]))
+
+
 def test_container_common_key_chains(device):
     arr1 = ivy.array([1], device=device)
     arr2 = ivy.array([2], device=device)
@@ -2131,6 +2347,86 @@ def test_container_identical(device):
     assert not ivy.Container.cont_identical([container4, container0], partial=True)
 
 
+def test_container_fingerprints(device):
+    def _make():
+        return Container(
+            {
+                "a": ivy.array([1.0, 2.0], device=device),
+                "b": {
+                    "c": ivy.array([[3]], device=device),
+                    "d": "some_string",
+                    "e": {},
+                },
+            }
+        )
+
+    container0, container1, container2 = _make(), _make(), _make()
+    assert container0.cont_fingerprint == container1.cont_fingerprint
+    assert container0.cont_structural_hash == container1.cont_structural_hash
+
+    # the fingerprints are invalidated when sub-containers are mutated
+    container2.b.c = ivy.array([[4]], device=device)
+    assert container0.cont_fingerprint != container2.cont_fingerprint
+    assert container0.cont_structural_hash == container2.cont_structural_hash
+    container2.b.d = "another_string"
+    container2.b.c = ivy.array([[3]], device=device)
+    assert container0.cont_fingerprint != container2.cont_fingerprint
+    container2.b.d = "some_string"
+    assert container0.cont_fingerprint == container2.cont_fingerprint
+
+    # and when the leaves are written in place through ivy
+    container2.inplace_update(
+        Container(a=ivy.array([5.0, 6.0], device=device)), key_chains=["a"]
+    )
+    assert container0.cont_fingerprint != container2.cont_fingerprint
+    assert not ivy.Container.cont_identical(
+        [container0, container2], same_arrays=False, use_fingerprints=True
+    )
+    container3 = _make()
+    fingerprint = container3.cont_fingerprint
+    container3.a[0] = 5.0
+    assert container3.cont_fingerprint != fingerprint
+    assert container3.b.cont_fingerprint == container0.b.cont_fingerprint
+    container3.a[1] = 6.0
+    assert container3.cont_fingerprint == container2.cont_fingerprint
+
+    # identical containers are detected without visiting their leaves
+    assert ivy.Container.cont_identical(
+        [container0, container1], same_arrays=False, use_fingerprints=True
+    )
+    assert ivy.Container.cont_identical_structure(
+        [container0, container2], use_fingerprints=True
+    )
+
+    # and diffs only visit the sub-containers which differ
+    for mode in ["all", "same_only", "diff_only"]:
+        for containers in [(container0, container1), (container0, container2)]:
+            assert (
+                ivy.Container.cont_diff(
+                    *containers, mode=mode, use_fingerprints=True
+                ).cont_to_dict()
+                == ivy.Container.cont_diff(*containers, mode=mode).cont_to_dict()
+            )
+    assert list(
+        ivy.Container.cont_diff(
+            container0, container2, mode="diff_only", use_fingerprints=True
+        ).keys()
+    ) == ["a"]
+    assert not ivy.Container.cont_structural_diff(
+        container0, container2, mode="diff_only", use_fingerprints=True
+    )
+
+    # nans are never equal, so the fingerprints do not change the results
+    nans = [Container(a=ivy.array([np.nan, 1.0], device=device)) for _ in range(2)]
+    assert nans[0].cont_fingerprint is None
+    assert not ivy.Container.cont_identical(
+        nans, same_arrays=False, use_fingerprints=True
+    )
+    assert ivy.Container.cont_diff(
+        *nans, use_fingerprints=True
+    ).cont_all_key_chains() == ["a/diff_"]
+
+
 def test_container_identical_structure(device):
     # without key_chains specification
     container0 = Container(
@@ -2474,6 +2770,53 @@ def test_container_to_and_from_disk_as_hdf5(device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_lazy(device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_lazy.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(12, dtype=np.float32).reshape(6, 2)),
+            "b": {"c": ivy.array(np.arange(6, dtype=np.float32), device=device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 5), lazy=True
+    )
+    # the datasets are not read until accessed
+    assert not ivy.is_array(dict.__getitem__(loaded_container, "a"))
+    assert dict.__getitem__(loaded_container, "a").shape == (4, 2)
+
+    # slicing reads the hyperslab within the loaded slice
+    sliced_container = loaded_container[1:3]
+    assert np.array_equal(
+        ivy.to_numpy(sliced_container.a), np.array([[4, 5], [6, 7]], dtype=np.float32)
+    )
+    assert np.array_equal(ivy.to_numpy(sliced_container.b.c), np.array([2, 3]))
+    assert np.array_equal(ivy.to_numpy(loaded_container[-1].b.c), np.array(4))
+
+    # accessing a leaf reads it in full
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), np.array([1, 2, 3, 4]))
+    assert ivy.is_array(dict.__getitem__(loaded_container.b, "c"))
+
+    # and the traversals read the datasets, never exposing them
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 5), lazy=True
+    )
+    assert loaded_container.cont_shape == [4]
+    assert all(ivy.is_array(x) for x in loaded_container.cont_to_iterator_values())
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, 5), lazy=True
+    )
+    doubled = loaded_container.cont_map(lambda x, kc: x * 2)
+    assert np.array_equal(ivy.to_numpy(doubled.b.c), np.array([2, 4, 6, 8]))
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2513,6 +2856,56 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     os.remove(save_filepath)
 
 
+def test_container_shuffle_h5_file_out_of_core_and_virtual(device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk_shuffle.hdf5"
+    container = Container(
+        {
+            "a": ivy.array(np.arange(10), device=device),
+            "b": {"c": ivy.array(np.arange(20).reshape(10, 2), device=device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, max_batch_size=10)
+    data = np.arange(10)
+    random.seed(0)
+    random.shuffle(data)
+
+    # virtual shuffling leaves the file untouched, and permutes at read time
+    permutation = Container.shuffle_h5_file(save_filepath, virtual=True)
+    assert np.array_equal(permutation, data)
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath, permutation)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), data)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c)[:, 0], data * 2)
+    container_loaded = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(container_loaded.a), np.arange(10))
+
+    # shuffling in blocks of a few rows applies the same permutation
+    Container.shuffle_h5_file(save_filepath, max_memory=24)
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), data)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c)[:, 0], data * 2)
+    os.remove(save_filepath)
+
+    # the temporary buffer datasets never clash with existing datasets, and are
+    # always removed
+    container = Container(
+        {
+            "a": ivy.array(np.arange(10), device=device),
+            "a_buffer": ivy.array(np.arange(10), device=device),
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, max_batch_size=10)
+    Container.shuffle_h5_file(save_filepath, max_memory=24)
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert sorted(container_shuffled.keys()) == ["a", "a_buffer"]
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a), data)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.a_buffer), data)
+
+    os.remove(save_filepath)
+
+
 def test_container_pickle(device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=device),
@@ -2570,6 +2963,56 @@ def test_container_to_and_from_disk_as_pickled(device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_binary(device):
+    save_filepath = "container_on_disk.ivyc"
+    dict_in = {
+        "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], dtype="float32", device=device),
+        "b": {
+            "c": ivy.array([True, False, True], device=device),
+            "d": ivy.array(3, dtype="int64", device=device),
+            "e": {},
+        },
+        "f": "some_string",
+        "g": 1.5,
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_to_disk_as_binary(save_filepath)
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_binary(save_filepath)
+    for key_chain in ["a", "b/c", "b/d"]:
+        loaded, original = loaded_container[key_chain], container[key_chain]
+        assert loaded.dtype == original.dtype
+        assert loaded.shape == original.shape
+        assert np.array_equal(ivy.to_numpy(loaded), ivy.to_numpy(original))
+    assert isinstance(loaded_container.b.e, Container)
+    assert len(loaded_container.b.e) == 0
+    assert loaded_container.f == "some_string"
+    assert loaded_container.g == 1.5
+    if ivy.current_backend_str() == "numpy":
+        # the arrays are views into the memory-mapped file
+        assert isinstance(loaded_container.a.data.base, np.memmap)
+
+    # selective loading
+    loaded_container = Container.cont_from_disk_as_binary(
+        save_filepath, key_chains=["b/c", "g"]
+    )
+    assert loaded_container.cont_all_key_chains() == ["b/c", "g"]
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), [True, False, True])
+
+    os.remove(save_filepath)
+
+    # invalid file
+    with open(save_filepath, "wb") as f:
+        f.write(b"not a container")
+    with pytest.raises(ivy.exceptions.IvyException):
+        Container.cont_from_disk_as_binary(save_filepath)
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2799,6 +3242,49 @@ def test_container_from_queues(device):
     del container
 
 
+def test_container_from_queues_with_prefetch(device):
+    queue_load_sizes = [1, 2, 1]
+    in_process_queues = [queue.Queue() for _ in queue_load_sizes]
+    for i, queue_load_size in enumerate(queue_load_sizes):
+        in_process_queues[i].put(
+            {
+                "a": [
+                    ivy.to_native(ivy.array([1.0, 2.0, 3.0], device=device)) * (i + 1)
+                ]
+                * queue_load_size
+            }
+        )
+    container = Container(
+        queues=in_process_queues,
+        queue_load_sizes=queue_load_sizes,
+        queue_timeout=0.25,
+        queue_prefetch=2,
+        queue_device=device,
+    )
+    # the first entries are loaded in the background before they are accessed
+    start = time.perf_counter()
+    while (
+        container.cont_queue_metrics["loaded"] < 2 and time.perf_counter() - start < 5
+    ):
+        time.sleep(0.01)
+    assert all(q.empty() for q in in_process_queues[:2])
+
+    assert np.allclose(ivy.to_numpy(container[0].a), np.array([1.0, 2.0, 3.0]))
+    assert np.allclose(ivy.to_numpy(container[2].a), np.array([2.0, 4.0, 6.0]))
+    assert np.allclose(ivy.to_numpy(container[3].a), np.array([3.0, 6.0, 9.0]))
+    metrics = container.cont_queue_metrics
+    assert metrics["loaded"] == 3
+    assert metrics["load_time"] > 0 and metrics["throughput"] > 0
+    assert metrics["stalls"] <= 3
+    # the background worker exits once no entries are left to load
+    loader = container._queue_loader
+    start = time.perf_counter()
+    while loader._worker_running and time.perf_counter() - start < 5:
+        time.sleep(0.01)
+    assert not loader._worker_running
+    assert Container(a=ivy.array([0.0], device=device)).cont_queue_metrics is None
+
+
 def test_container_reduce(device):
     container_a = ivy.Container(
         {
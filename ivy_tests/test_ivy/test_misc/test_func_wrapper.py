@@ -34,6 +34,14 @@ def test_handle_array_like(fn, x, expected_type):
     assert isinstance(handle_array_like(fn)(x), expected_type)
 
 
+def test_handle_array_like_caches_positions():
+    fn = handle_array_like(_fn2)
+    assert fn._array_like_positions is None
+    fn([1, 2])
+    assert fn._array_like_positions == (0,)
+    assert isinstance(fn((1, 2)), ivy.Array)
+
+
 def test_outputs_to_ivy_arrays():
     assert isinstance(
         ivy.outputs_to_ivy_arrays(_fn1)(ivy.to_native(ivy.array([2.0]))), ivy.Array
@@ -50,6 +58,29 @@ def test_inputs_to_native_arrays():
     ivy.inputs_to_native_arrays(_fn5)(ivy.array(1))
 
 
+def _fn_nested(x, y):
+    # nested arrays are only converted when the inputs aren't trusted
+    assert isinstance(x, ivy.NativeArray)
+    return isinstance(y[0], ivy.NativeArray)
+
+
+def test_trusted_inputs_mode():
+    x = ivy.array([1.0, 2.0])
+    assert ivy.inputs_to_native_arrays(_fn_nested)(x, [x])
+    with ivy.TrustedInputs():
+        assert ivy.get_trusted_inputs_mode()
+        assert not ivy.inputs_to_native_arrays(_fn_nested)(x, [x])
+        ret = ivy.outputs_to_ivy_arrays(lambda: (x.data, x.data))()
+        assert all(isinstance(r, ivy.Array) for r in ret)
+        assert ivy.array_equal(ivy.add(x, x), ivy.array([2.0, 4.0]))
+    assert not ivy.get_trusted_inputs_mode()
+    # exceptions raised in the mode propagate
+    with pytest.raises(ValueError):
+        with ivy.TrustedInputs():
+            raise ValueError
+    assert not ivy.get_trusted_inputs_mode()
+
+
 def _fn6(x):
     # Assert input was converted to Ivy Array
     assert isinstance(x, ivy.Array)
@@ -90,3 +121,26 @@ def test_to_native_arrays_and_back():
 def test_integer_arrays_to_float(x, expected):
     # Todo: Fix dtype issue
     assert ivy.array_equal(ivy.func_wrapper.integer_arrays_to_float(_fn1)(x), expected)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (ivy.array([1.0, 2.0]), ivy.array([3.0, 4.0])),
+        (ivy.native_array([1.0, 2.0]), ivy.array([3.0, 4.0])),
+        ([1.0, 2.0], ivy.array([3.0, 4.0])),
+        (ivy.Container(a=ivy.array([1.0, 2.0])), ivy.array([3.0, 4.0])),
+    ],
+)
+def test_dispatch_plan(args):
+    assert "handle_nestable" in ivy.add.dispatch_plan
+    stacked_fn = ivy.add.__wrapped__
+    ret = ivy.add(*args)
+    expected = stacked_fn(*args)
+    assert type(ret) is type(expected)
+    assert ivy.all(ivy.to_ivy(ret == expected, nested=True))
+    # out argument is handled by the full decorator stack
+    out = ivy.zeros(2)
+    if not isinstance(args[0], ivy.Container):
+        assert ivy.add(*args, out=out) is out
+        assert ivy.array_equal(out, expected)
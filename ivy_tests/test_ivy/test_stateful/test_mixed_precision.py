@@ -0,0 +1,97 @@
+"""Collection of tests for Ivy mixed precision training."""
+
+# global
+from hypothesis import given, strategies as st
+import numpy as np
+
+# local
+import ivy
+
+
+# loss scaler
+@given(
+    init_scale=st.sampled_from([1.0, 2.0**8, 2.0**16]),
+    growth_interval=st.integers(min_value=1, max_value=5),
+    dynamic=st.booleans(),
+)
+def test_loss_scaler(init_scale, growth_interval, dynamic):
+    scaler = ivy.LossScaler(
+        init_scale=init_scale, growth_interval=growth_interval, dynamic=dynamic
+    )
+    finite = ivy.Container(a=ivy.array([1.0, 2.0]), b={"c": ivy.array([3.0])})
+    overflow = ivy.Container(a=ivy.array([1.0, 2.0]), b={"c": ivy.array([np.inf])})
+    nans = ivy.Container(a=ivy.array([np.nan, 2.0]), b={"c": ivy.array([3.0])})
+    assert scaler.grads_finite(finite)
+    assert not scaler.grads_finite(overflow)
+    assert not scaler.grads_finite(nans)
+    assert np.allclose(ivy.to_numpy(scaler.scale_loss(ivy.array(2.0))), 2 * init_scale)
+    assert np.allclose(ivy.to_numpy(scaler.unscale(finite * init_scale).a), [1, 2])
+
+    # back off on overflow
+    scaler.update(False)
+    scale = init_scale * 0.5 if dynamic else init_scale
+    assert scaler.scale == scale
+
+    # grow after growth_interval steps without overflow
+    for _ in range(growth_interval - 1):
+        scaler.update(True)
+    assert scaler.scale == scale
+    scaler.update(True)
+    assert scaler.scale == (scale * 2 if dynamic else scale)
+
+    # state
+    new_scaler = ivy.LossScaler()
+    new_scaler.set_state(scaler.state)
+    assert new_scaler.scale == scaler.scale
+
+
+# mixed precision training
+@given(
+    dtype=st.sampled_from(["float16", "bfloat16"]),
+    init_scale=st.sampled_from([2.0**8, 1e30]),
+)
+def test_mixed_precision_training(dtype, init_scale, on_device):
+    if dtype in ivy.invalid_dtypes:
+        return
+    module = ivy.Linear(3, 2, device=on_device)
+    optimizer = ivy.SGD(lr=1e-2)
+    trainer = ivy.MixedPrecision(
+        module,
+        optimizer,
+        dtype=dtype,
+        loss_scaler=ivy.LossScaler(init_scale=init_scale),
+    )
+
+    # the module variables are low precision, and the master variables fp32
+    assert module.v.w.dtype == dtype
+    assert trainer.master_v.w.dtype == "float32"
+    assert np.allclose(
+        ivy.to_numpy(ivy.astype(module.v.w, "float32")),
+        ivy.to_numpy(trainer.master_v.w),
+        atol=1e-2,
+    )
+    if ivy.current_backend_str() == "numpy":
+        # NumPy does not support gradients
+        return
+
+    x = ivy.array([[1.0, 2.0, 3.0]], dtype=dtype, device=on_device)
+
+    def loss_fn(v):
+        return ivy.mean(module(x, v=v) ** 2)
+
+    master_w = ivy.to_numpy(trainer.master_v.w)
+    loss, grads, finite = trainer.step(loss_fn)
+    assert loss.shape == ()
+    assert grads.w.dtype == "float32"
+    if init_scale == 1e30:
+        # the scaled gradients overflow, so the step is skipped and the scale
+        # backed off
+        assert not finite
+        assert trainer.loss_scaler.scale == init_scale * 0.5
+        assert np.array_equal(ivy.to_numpy(trainer.master_v.w), master_w)
+    else:
+        assert finite
+        assert trainer.loss_scaler.scale == init_scale
+        assert not np.array_equal(ivy.to_numpy(trainer.master_v.w), master_w)
+    assert module.v.w.dtype == dtype
+    assert trainer.master_v.w.dtype == "float32"
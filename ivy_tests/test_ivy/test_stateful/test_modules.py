@@ -755,6 +755,12 @@ def test_module_track_submod_rets(
             ivy.Container.cont_flatten_key_chain(submod.__repr__(), "_") not in sm_rets
         )
 
+    # untracked calls clear the tracked returns
+    ret = module(x)
+    assert ret.shape == tuple(list(batch_shape) + [64])
+    assert not module.submod_rets
+    assert not module._track_submod_rets
+
 
 # check submod returns
 @given(
@@ -823,6 +829,9 @@ def test_module_check_submod_rets(
     except ivy.exceptions.IvyException:
         pass
 
+    # the flags are unset after a failed check
+    assert module.expected_submod_rets is None
+
     # with tolerances
     ret = module(x, track_submod_rets=True)
     assert ret.shape == tuple(list(batch_shape) + [64])
@@ -3,8 +3,11 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy.functional.backends.numpy as ivy_np
 import ivy_tests.test_ivy.helpers as helpers
 import ivy_tests.test_ivy.helpers.test_parameter_flags as pf
@@ -246,3 +249,113 @@ def test_lamb_optimizer(
         method_name=method_name,
         device_=on_device,
     )
+
+
+# fused
+@pytest.mark.parametrize(
+    "optimizer_class, kwargs",
+    [
+        (ivy.SGD, {}),
+        (ivy.LARS, {"decay_lambda": 0.01}),
+        (ivy.Adam, {}),
+        (ivy.LAMB, {"decay_lambda": 0.01}),
+    ],
+)
+def test_fused_optimizer_step(optimizer_class, kwargs, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+    rng = np.random.default_rng(0)
+
+    def new_container():
+        return ivy.Container(
+            a=rng.standard_normal((3, 4)).astype("float32"),
+            b={"c": rng.standard_normal((5,)).astype("float32")},
+        )
+
+    v_np, grads_np = new_container(), [new_container() for _ in range(3)]
+    rets = list()
+    for fused in [False, True]:
+        optimizer = optimizer_class(lr=0.1, fused=fused, **kwargs)
+        v = v_np.cont_map(lambda x, kc: ivy.array(x.copy()))
+        for grads_np_i in grads_np:
+            grads = grads_np_i.cont_map(lambda x, kc: ivy.array(x.copy()))
+            v_in, fingerprint = v, v.cont_fingerprint
+            v = optimizer.step(v, grads)
+            # the fingerprints of the variables are not trusted once written inplace
+            assert v_in.cont_fingerprint == v_in.cont_deep_copy().cont_fingerprint
+            if ivy.inplace_arrays_supported() and fused:
+                assert v_in.cont_fingerprint != fingerprint
+            # the gradients are never updated inplace
+            assert np.array_equal(ivy.to_numpy(grads.a), grads_np_i.a)
+        rets.append((v, optimizer.state))
+    (v, state), (v_fused, state_fused) = rets
+    assert v_fused.cont_all_key_chains() == v.cont_all_key_chains()
+    for x, x_fused in zip(
+        v.cont_to_flat_list() + state.cont_to_flat_list(),
+        v_fused.cont_to_flat_list() + state_fused.cont_to_flat_list(),
+    ):
+        assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(x_fused), atol=1e-6)
+    ivy.unset_backend()
+
+
+@pytest.mark.parametrize("optimizer_class", [ivy.SGD, ivy.LARS, ivy.Adam, ivy.LAMB])
+def test_fused_optimizer_requires_stop_gradients(optimizer_class):
+    # the fused updates write the variables inplace, which cannot be differentiated
+    with pytest.raises(ivy.exceptions.IvyException):
+        optimizer_class(fused=True, stop_gradients=False)
+    optimizer_class(fused=False, stop_gradients=False)
+
+
+# inplace state
+@pytest.mark.parametrize("optimizer_class", [ivy.Adam, ivy.LAMB])
+@pytest.mark.parametrize("fused", [True, False])
+def test_optimizer_state_inplace(optimizer_class, fused, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+    v = ivy.Container(
+        a=ivy.array([[1.0, 2.0], [3.0, 4.0]]), b={"c": ivy.array([5.0, 6.0])}
+    )
+    optimizer = optimizer_class(lr=0.1, fused=fused)
+    grads = ivy.Container(
+        a=ivy.array([[0.1, 0.2], [0.3, 0.4]]), b={"c": ivy.array([0.5, 0.6])}
+    )
+    v = optimizer.step(v, grads)
+    state = optimizer.state
+    # the moments are allocated with the dtype of the variables, without
+    # aliasing the gradients
+    assert state.mw.a.dtype == v.a.dtype
+    mw_a = ivy.to_numpy(state.mw.a).copy()
+    v = optimizer.step(v, grads * 2)
+    assert np.allclose(ivy.to_numpy(grads.a), [[0.1, 0.2], [0.3, 0.4]])
+    if ivy.inplace_arrays_supported():
+        # and are then updated inplace
+        assert optimizer.state.mw.a is state.mw.a
+        assert not np.allclose(ivy.to_numpy(state.mw.a), mw_a)
+    ivy.unset_backend()
+
+
+# state rollback
+@pytest.mark.parametrize("optimizer_class", [ivy.Adam, ivy.LAMB])
+@pytest.mark.parametrize("fused", [True, False])
+def test_optimizer_set_state(optimizer_class, fused, backend_fw):
+    ivy.set_backend(backend_fw.current_backend_str())
+    v = ivy.Container(
+        a=ivy.array([[1.0, 2.0], [3.0, 4.0]]), b={"c": ivy.array([5.0, 6.0])}
+    )
+    optimizer = optimizer_class(lr=0.1, fused=fused)
+    grads = ivy.Container(
+        a=ivy.array([[0.1, 0.2], [0.3, 0.4]]), b={"c": ivy.array([0.5, 0.6])}
+    )
+    v = optimizer.step(v, grads)
+    saved = ivy.copy_array(optimizer.state)
+    saved_mw = ivy.to_numpy(saved.mw.a).copy()
+    optimizer.set_state(saved)
+    optimizer.step(ivy.copy_array(v), grads * 2)
+    mw = ivy.to_numpy(optimizer.state.mw.a).copy()
+    # the state is copied, so later steps do not write into the checkpoint
+    assert np.array_equal(ivy.to_numpy(saved.mw.a), saved_mw)
+    assert not np.allclose(mw, saved_mw)
+    # and the optimizer can be rolled back to it
+    optimizer.set_state(saved)
+    assert np.array_equal(ivy.to_numpy(optimizer.state.mw.a), saved_mw)
+    optimizer.step(ivy.copy_array(v), grads * 2)
+    assert np.allclose(ivy.to_numpy(optimizer.state.mw.a), mw)
+    ivy.unset_backend()